@@ -7,8 +7,16 @@ key information, entities, and numerical data.
 Reference: Lines 920-989 in agentic_search_system_complete.md
 """
 
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import OrderedDict
+from functools import partial
+import asyncio
+import copy
+import hashlib
+import re
+
+from utils import json_utils
+from utils.logging_config import get_logger
 
 
 COMPRESSION_AGENT_SYSTEM_PROMPT = """You are a content compression specialist.
@@ -42,6 +50,37 @@ GUIDELINES:
 - Be extremely concise while preserving meaning
 """
 
+logger = get_logger("compression_agent")
+
+# Content beyond this many characters is not sent to the model
+COMPRESSION_CONTENT_MAX_CHARS = 10000
+
+# Fixed parts of the single-document compression prompt
+COMPRESSION_PROMPT_HEAD = (
+    "Compress this content to approximately {n} characters "
+    "while preserving key information.\n\nSOURCE: "
+)
+COMPRESSION_PROMPT_TAIL = (
+    "\n\nExtract the essential information and output as JSON following "
+    "the specified format.\nFocus on facts, entities, numbers, and "
+    "actionable insights.\n"
+)
+
+# Content shorter than this is already about the size of a compressed result,
+# so it is structured with rules instead of a model call
+FAST_PATH_MAX_CHARS = 2000
+
+# Contents up to this size are eligible for packing several into one prompt
+PACKED_CONTENT_MAX_CHARS = 4000
+
+# Upper bound on combined content per packed prompt (matches single-call cap)
+PACKED_PROMPT_MAX_CHARS = 10000
+
+# Rule-based extraction patterns for the fast path
+_NUMBER_RE = re.compile(r"(?<![\w.-])\$?\d+(?:[.,]\d+)*%?")
+_ENTITY_RE = re.compile(r"\b[A-Z][a-zA-Z0-9&-]+(?:\s+[A-Z][a-zA-Z0-9&-]+)*")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 class CompressionAgent:
     """
@@ -51,19 +90,48 @@ class CompressionAgent:
     search results before they're added to context.
     """
 
-    def __init__(self, provider):
+    def __init__(
+        self,
+        provider,
+        max_concurrency: int = 8,
+        coalesce_window: float = 0.05,
+        coalesce_batch_size: int = 4,
+        cache_size: int = 1024
+    ):
         """
         Initialize compression agent.
 
         Args:
             provider: BaseProvider instance
+            max_concurrency: Maximum in-flight compression calls to the provider
+            coalesce_window: Seconds to buffer submit() requests before dispatching
+            coalesce_batch_size: Maximum contents packed per prompt by submit()
+            cache_size: Maximum compressed results kept in the LRU cache
         """
         self.provider = provider
         self.agent = None
+        self.coalesce_window = coalesce_window
+        self.coalesce_batch_size = coalesce_batch_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: List[Tuple[str, Dict[str, Any], float, asyncio.Future]] = []
+        self._flush_handle = None
+        # Running flushes, referenced so they are not garbage-collected mid-flight
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # LRU cache keyed by (sha256(content), ratio) -> (url, compressed)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[bytes, float], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._cache_keys_by_url: Dict[str, set] = {}
 
     async def initialize(self):
-        """Create the underlying agent instance."""
-        self.agent = await self.provider.create_agent(
+        """
+        Create the underlying agent instance.
+
+        Agents are shared across CompressionAgent instances using the same
+        provider, so short-lived instances (e.g. one per hook call) reuse a
+        warm agent instead of creating a new one.
+        """
+        self.agent = await self.provider.get_pooled_agent(
             model_type="small",
             system_prompt=COMPRESSION_AGENT_SYSTEM_PROMPT,
             temperature=0.0  # Deterministic compression
@@ -100,6 +168,14 @@ class CompressionAgent:
                 }
             }
         """
+        if len(content) < FAST_PATH_MAX_CHARS:
+            return self._rule_based_compress(content, metadata)
+
+        cache_key = self._cache_key(content, compression_ratio)
+        cached = self._cache_get(cache_key, metadata)
+        if cached is not None:
+            return cached
+
         if not self.agent:
             await self.initialize()
 
@@ -107,45 +183,152 @@ class CompressionAgent:
         target_length = int(len(content) * compression_ratio)
 
         # Build compression prompt
-        prompt = f"""Compress this content to approximately {target_length} characters while preserving key information.
-
-SOURCE: {metadata.get('url', 'Unknown')}
-TITLE: {metadata.get('title', 'Unknown')}
-QUERY CONTEXT: {metadata.get('query', 'Unknown')}
-
-CONTENT:
-{content[:10000]}
-
-Extract the essential information and output as JSON following the specified format.
-Focus on facts, entities, numbers, and actionable insights.
-"""
+        prompt = "".join((
+            COMPRESSION_PROMPT_HEAD.format(n=target_length),
+            str(metadata.get("url", "Unknown")),
+            "\nTITLE: ",
+            str(metadata.get("title", "Unknown")),
+            "\nQUERY CONTEXT: ",
+            str(metadata.get("query", "Unknown")),
+            "\n\nCONTENT:\n",
+            content[:COMPRESSION_CONTENT_MAX_CHARS],
+            COMPRESSION_PROMPT_TAIL
+        ))
 
         try:
             # Get compressed response
-            response = await self.provider.send_message(
-                self.agent,
-                prompt,
-                temperature=0.0
-            )
+            async with self._semaphore:
+                response = await self.provider.send_message(
+                    self.agent,
+                    prompt,
+                    temperature=0.0
+                )
 
             # Parse JSON response
             compressed = self._parse_json_response(response)
 
             # Add compression statistics
-            compressed["compression_stats"] = {
-                "original_length": len(content),
-                "compressed_length": len(json.dumps(compressed)),
-                "ratio": len(json.dumps(compressed)) / len(content),
-                "source": metadata.get("url", "Unknown")
-            }
+            compressed["compression_stats"] = self._compression_stats(
+                compressed,
+                content,
+                metadata
+            )
 
+            self._cache_put(cache_key, compressed, metadata)
             return compressed
 
         except Exception as e:
-            print(f"Compression error: {e}")
+            logger.exception("Compression error: %s", e)
             # Fallback: simple truncation
             return self._fallback_compression(content, metadata)
 
+    def _cache_key(self, content: str, compression_ratio: float) -> Tuple[bytes, float]:
+        """Build the cache key for a content string and target ratio."""
+        return (hashlib.sha256(content.encode()).digest(), compression_ratio)
+
+    def _cache_get(
+        self,
+        key: Tuple[bytes, float],
+        metadata: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached compression result.
+
+        Args:
+            key: Cache key from _cache_key()
+            metadata: Metadata of the current request
+
+        Returns:
+            Copy of the cached result with refreshed stats, or None on miss
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        self._cache.move_to_end(key)
+        result = copy.deepcopy(entry[1])
+        result["compression_stats"]["source"] = metadata.get("url", "Unknown")
+        result["compression_stats"]["cached"] = True
+        return result
+
+    def _cache_put(
+        self,
+        key: Tuple[bytes, float],
+        compressed: Dict[str, Any],
+        metadata: Dict[str, Any]
+    ):
+        """
+        Store a compression result, evicting the least recently used entry.
+
+        Args:
+            key: Cache key from _cache_key()
+            compressed: Compressed result to store
+            metadata: Metadata of the request that produced it
+        """
+        if self.cache_size <= 0:
+            return
+
+        url = metadata.get("url") or ""
+        self._cache[key] = (url, copy.deepcopy(compressed))
+        self._cache.move_to_end(key)
+        self._cache_keys_by_url.setdefault(url, set()).add(key)
+
+        while len(self._cache) > self.cache_size:
+            old_key, (old_url, _) = self._cache.popitem(last=False)
+            self._discard_url_key(old_url, old_key)
+
+    def _discard_url_key(self, url: str, key: Tuple[bytes, float]):
+        """Remove a cache key from the per-URL index."""
+        keys = self._cache_keys_by_url.get(url)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cache_keys_by_url[url]
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop cached results produced for a URL (e.g. after a re-fetch).
+
+        Args:
+            url: Source URL whose cached compressions should be purged
+
+        Returns:
+            Number of cache entries removed
+        """
+        keys = self._cache_keys_by_url.pop(url, set())
+        for key in keys:
+            self._cache.pop(key, None)
+        return len(keys)
+
+    def _compression_stats(
+        self,
+        compressed: Dict[str, Any],
+        content: str,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build compression statistics for a compressed result.
+
+        Args:
+            compressed: Parsed compression output
+            content: Original content
+            metadata: Content metadata
+
+        Returns:
+            Compression statistics dictionary
+        """
+        compressed_length = len(json_utils.dumps(compressed))
+        stats = {
+            "original_length": len(content),
+            "compressed_length": compressed_length,
+            "ratio": compressed_length / len(content),
+            "source": metadata.get("url", "Unknown")
+        }
+
+        # Structured record for telemetry handlers; cheap when queued
+        logger.debug("Compression stats", extra={"compression_stats": stats})
+        return stats
+
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """
         Parse JSON from response, handling various formats.
@@ -156,34 +339,77 @@ Focus on facts, entities, numbers, and actionable insights.
         Returns:
             Parsed dictionary
         """
-        # Try to parse as-is
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-
-        # Try to extract JSON from markdown code blocks
-        if "```json" in response:
-            start = response.find("```json") + 7
-            end = response.find("```", start)
-            json_str = response[start:end].strip()
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-
-        # Try to extract JSON from curly braces
-        if "{" in response and "}" in response:
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            json_str = response[start:end]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
+        parsed = json_utils.extract_json(response, "{")
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Could not parse JSON from response: {response[:200]}")
+        return parsed
+
+    def _parse_json_array(self, response: str) -> List[Any]:
+        """
+        Parse a JSON array from a packed compression response.
+
+        Args:
+            response: Response string that may contain a JSON array
+
+        Returns:
+            Parsed list
+        """
+        parsed = json_utils.extract_json(response, "[")
+
+        if not isinstance(parsed, list):
+            raise ValueError("Packed compression response is not a JSON array")
+
+        return parsed
+
+    def _rule_based_compress(
+        self,
+        content: str,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Structure short content with regex rules instead of a model call.
 
-        # If all else fails, return structured error
-        raise ValueError(f"Could not parse JSON from response: {response[:200]}")
+        Extracts numbers with their leading words, capitalized entities, and
+        the first sentences as summary.
+
+        Args:
+            content: Content to compress
+            metadata: Content metadata
+
+        Returns:
+            Compressed structure (same shape as compress())
+        """
+        sentences = [s for s in _SENTENCE_SPLIT_RE.split(content.strip()) if s]
+
+        numerical_data = {}
+        for i, match in enumerate(_NUMBER_RE.finditer(content)):
+            if len(numerical_data) >= 10:
+                break
+            label = " ".join(content[max(0, match.start() - 40):match.start()].split()[-2:])
+            numerical_data.setdefault(label or f"value_{i + 1}", match.group())
+
+        entities = list(dict.fromkeys(_ENTITY_RE.findall(content)))[:10]
+        summary = " ".join(sentences[:2])
+
+        compressed = {
+            "key_points": sentences[:5],
+            "summary": summary,
+            "entities": entities,
+            "numerical_data": numerical_data,
+            "credibility": "unknown",
+            "relevance_tags": []
+        }
+
+        compressed_length = len(json_utils.dumps(compressed))
+        compressed["compression_stats"] = {
+            "original_length": len(content),
+            "compressed_length": compressed_length,
+            "ratio": compressed_length / max(len(content), 1),
+            "source": metadata.get("url", "Unknown"),
+            "fast_path": True
+        }
+
+        return compressed
 
     def _fallback_compression(
         self,
@@ -222,20 +448,269 @@ Focus on facts, entities, numbers, and actionable insights.
     async def compress_batch(
         self,
         contents: list[tuple[str, Dict[str, Any]]],
-        compression_ratio: float = 0.1
+        compression_ratio: float = 0.1,
+        adaptive_batch_size: int = 1
     ) -> list[Dict[str, Any]]:
         """
         Compress multiple contents in batch.
 
+        Calls are dispatched concurrently (capped by max_concurrency). With
+        adaptive_batch_size > 1, short contents are packed into shared prompts
+        of up to that many documents, bounded by PACKED_PROMPT_MAX_CHARS;
+        contents under FAST_PATH_MAX_CHARS skip the model entirely.
+
         Args:
             contents: List of (content, metadata) tuples
             compression_ratio: Target compression ratio
+            adaptive_batch_size: Maximum contents packed into one prompt
 
         Returns:
-            List of compressed content dictionaries
+            List of compressed content dictionaries (same order as contents)
         """
-        results = []
-        for content, metadata in contents:
-            compressed = await self.compress(content, metadata, compression_ratio)
-            results.append(compressed)
+        if adaptive_batch_size <= 1:
+            return list(await asyncio.gather(*(
+                self.compress(content, metadata, compression_ratio)
+                for content, metadata in contents
+            )))
+
+        results: List[Dict[str, Any]] = [None] * len(contents)
+
+        # Group short contents into packs; long contents go out individually
+        singles: List[int] = []
+        packs: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+
+        for i, (content, metadata) in enumerate(contents):
+            if len(content) < FAST_PATH_MAX_CHARS:
+                results[i] = self._rule_based_compress(content, metadata)
+                continue
+
+            cached = self._cache_get(
+                self._cache_key(content, compression_ratio),
+                metadata
+            )
+            if cached is not None:
+                results[i] = cached
+                continue
+
+            if len(content) > PACKED_CONTENT_MAX_CHARS:
+                singles.append(i)
+                continue
+
+            if current and (
+                len(current) >= adaptive_batch_size
+                or current_chars + len(content) > PACKED_PROMPT_MAX_CHARS
+            ):
+                packs.append(current)
+                current, current_chars = [], 0
+
+            current.append(i)
+            current_chars += len(content)
+
+        if current:
+            packs.append(current)
+
+        async def run_single(i: int):
+            content, metadata = contents[i]
+            results[i] = await self.compress(content, metadata, compression_ratio)
+
+        async def run_pack(indices: List[int]):
+            if len(indices) == 1:
+                await run_single(indices[0])
+                return
+            packed = await self._compress_packed(
+                [contents[i] for i in indices],
+                compression_ratio
+            )
+            for i, compressed in zip(indices, packed):
+                results[i] = compressed
+
+        await asyncio.gather(
+            *(run_single(i) for i in singles),
+            *(run_pack(pack) for pack in packs)
+        )
+
         return results
+
+    async def _compress_packed(
+        self,
+        items: list[tuple[str, Dict[str, Any]]],
+        compression_ratio: float
+    ) -> list[Dict[str, Any]]:
+        """
+        Compress several short contents with a single LLM call.
+
+        Falls back to one call per content if the packed response cannot be
+        parsed or does not contain one result per document.
+
+        Args:
+            items: List of (content, metadata) tuples
+            compression_ratio: Target compression ratio
+
+        Returns:
+            List of compressed content dictionaries
+        """
+        if not self.agent:
+            await self.initialize()
+
+        sections = []
+        for i, (content, metadata) in enumerate(items):
+            sections.append(f"""---DOC {i}---
+SOURCE: {metadata.get('url', 'Unknown')}
+TITLE: {metadata.get('title', 'Unknown')}
+QUERY CONTEXT: {metadata.get('query', 'Unknown')}
+TARGET LENGTH: ~{int(len(content) * compression_ratio)} characters
+
+CONTENT:
+{content}
+""")
+
+        prompt = f"""Compress each of the following {len(items)} documents independently while preserving key information.
+
+{chr(10).join(sections)}
+
+Output a JSON array with exactly {len(items)} objects, one per document in the same order.
+Each object must follow the specified format.
+"""
+
+        try:
+            async with self._semaphore:
+                response = await self.provider.send_message(
+                    self.agent,
+                    prompt,
+                    temperature=0.0
+                )
+
+            parsed = self._parse_json_array(response)
+            if len(parsed) != len(items) or not all(isinstance(p, dict) for p in parsed):
+                raise ValueError(
+                    f"Expected {len(items)} compressed documents, got {len(parsed)}"
+                )
+
+        except Exception as e:
+            logger.exception("Packed compression error: %s", e)
+            return list(await asyncio.gather(*(
+                self.compress(content, metadata, compression_ratio)
+                for content, metadata in items
+            )))
+
+        for compressed, (content, metadata) in zip(parsed, items):
+            compressed["compression_stats"] = self._compression_stats(
+                compressed,
+                content,
+                metadata
+            )
+            self._cache_put(
+                self._cache_key(content, compression_ratio),
+                compressed,
+                metadata
+            )
+
+        return parsed
+
+    async def submit(
+        self,
+        content: str,
+        metadata: Dict[str, Any],
+        compression_ratio: float = 0.1
+    ) -> Dict[str, Any]:
+        """
+        Queue content for coalesced compression.
+
+        Requests arriving within coalesce_window seconds of each other are
+        dispatched together through compress_batch, so short contents share
+        prompts instead of paying one round-trip each.
+
+        Args:
+            content: Raw content to compress
+            metadata: Metadata about the content (url, title, query)
+            compression_ratio: Target compression ratio
+
+        Returns:
+            Compressed content dictionary (same structure as compress())
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((content, metadata, compression_ratio, future))
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.coalesce_window,
+                self._start_flush
+            )
+
+        return await future
+
+    def _start_flush(self):
+        """Dispatch all buffered submit() requests."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(partial(self._flush_done, pending))
+
+    def _flush_done(
+        self,
+        pending: List[Tuple[str, Dict[str, Any], float, asyncio.Future]],
+        task: asyncio.Task
+    ):
+        """
+        Release a finished flush and fail any submitter it left waiting.
+
+        Args:
+            pending: Entries the flush was dispatching
+            task: The finished flush task
+        """
+        self._flush_tasks.discard(task)
+
+        error = None
+        if not task.cancelled():
+            error = task.exception()
+            if error is not None:
+                logger.error("Coalesced compression flush failed: %s", error)
+
+        for *_, future in pending:
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            else:
+                future.set_exception(
+                    error or RuntimeError("Coalesced compression returned no result")
+                )
+
+    async def _flush(
+        self,
+        pending: List[Tuple[str, Dict[str, Any], float, asyncio.Future]]
+    ):
+        """
+        Compress buffered requests, grouped by compression ratio.
+
+        Args:
+            pending: Buffered (content, metadata, ratio, future) entries
+        """
+        groups: Dict[float, list] = {}
+        for entry in pending:
+            groups.setdefault(entry[2], []).append(entry)
+
+        async def run_group(ratio: float, entries: list):
+            try:
+                results = await self.compress_batch(
+                    [(content, metadata) for content, metadata, _, _ in entries],
+                    ratio,
+                    adaptive_batch_size=self.coalesce_batch_size
+                )
+            except Exception as e:
+                for *_, future in entries:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (*_, future), result in zip(entries, results):
+                if not future.done():
+                    future.set_result(result)
+
+        await asyncio.gather(*(
+            run_group(ratio, entries) for ratio, entries in groups.items()
+        ))
@@ -5,7 +5,19 @@ This agent uses context editing capabilities to manage the context window,
 removing duplicates, prioritizing relevant content, and keeping tokens under limits.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Deque, Iterator, Mapping
+from array import array
+from bisect import bisect_right
+from collections import ChainMap, deque
+from itertools import accumulate
+from operator import itemgetter
+import hashlib
+import heapq
+import json
+import time
+import zlib
+
+from utils.logging_config import get_logger
 
 
 CONTEXT_EDITOR_SYSTEM_PROMPT = """You are a context optimization specialist.
@@ -35,6 +47,75 @@ Return optimized message list with:
 Be aggressive but smart - preserve quality while maximizing space.
 """
 
+logger = get_logger("context_editor")
+
+# Upper bound on memoized token counts kept between optimization passes
+TOKEN_CACHE_MAX_ENTRIES = 50000
+
+# Per-message framing tokens (role markers and separators)
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# Skip optimization when it would save less than this fraction of tokens
+MIN_SAVINGS_RATIO = 0.10
+
+# Callers should only invoke the editor when this far over target
+PREFLIGHT_MARGIN = 1.15
+
+# Back-off after consecutive ineffective optimization passes
+OPTIMIZATION_COOLDOWN_SECONDS = 60.0
+
+# Aggressive compression summarizes all but the most recent messages in one call
+RECENT_MESSAGES_KEPT = 6
+SUMMARY_TURN_MAX_CHARS = 2000
+SUMMARY_CACHE_MAX_ENTRIES = 32
+
+# Rolling findings digest: per-angle entry cap, and the size at which the
+# digest is folded into a shorter one with a single model call
+DIGEST_ENTRY_MAX_CHARS = 1500
+DIGEST_MAX_CHARS = 24000
+
+# Content-defined chunking: a line ends a block when crc32(line) % M == 0
+# (~M lines per block); blocks shorter than the minimum are never replaced
+BLOCK_BOUNDARY_MODULUS = 8
+BLOCK_MIN_CHARS = 64
+
+# Relevance heuristic: message keys map to feature bits (url and source_url
+# share a bit, so a source only counts once) and each bit adds a boost
+RELEVANCE_FEATURE_BITS = {
+    "url": 1,             # Indicates source
+    "source_url": 1,
+    "key_points": 2,      # Indicates structured data
+    "numerical_data": 4,
+}
+_RELEVANCE_BOOSTS = ((1, 0.2), (2, 0.2), (4, 0.1))
+
+# Score for every feature combination (base 0.5, capped at 1.0)
+RELEVANCE_SCORE_LUT = tuple(
+    min(0.5 + sum(boost for bit, boost in _RELEVANCE_BOOSTS if bits & bit), 1.0)
+    for bits in range(8)
+)
+
+
+class MessageOverlay(ChainMap):
+    """
+    Compressed view of a message: replaced fields layered over the original
+    message, which is shared rather than copied.
+
+    Reads, len() and comparisons behave like the merged dict; repr() shows
+    the merged fields so string-based token estimates don't count the
+    replaced originals. Serialize with default=_json_default or dict().
+    """
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize mapping overlays (ChainMap) as dicts and anything else as str."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
 
 class ContextEditorAgent:
     """
@@ -56,6 +137,18 @@ class ContextEditorAgent:
         self.target_tokens = 100000
         self.max_tokens = 150000
 
+        # id(message) -> (message, token count) for the call in progress; the
+        # stored reference keeps the id from being reused while the entry is
+        # alive, and the memo is emptied when each call returns
+        self._token_cache: Dict[int, Tuple[Any, int]] = {}
+
+        # Savings ratio of the last passes; two poor passes trigger a cooldown
+        self._recent_ratios: Deque[float] = deque(maxlen=2)
+        self._cooldown_until = 0.0
+
+        # sha256 of summarized messages -> summary text
+        self._summary_cache: Dict[bytes, str] = {}
+
     async def initialize(self):
         """Create the underlying agent instance."""
         self.agent = await self.provider.create_agent(
@@ -69,7 +162,7 @@ class ContextEditorAgent:
         messages: List[Dict[str, Any]],
         target_tokens: Optional[int] = None,
         strategy: str = "keep_recent_and_relevant"
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Mapping[str, Any]]:
         """
         Optimize context to stay within token limits.
 
@@ -79,34 +172,110 @@ class ContextEditorAgent:
             strategy: Optimization strategy to use
 
         Returns:
-            Optimized message list
+            Optimized message list; compressed messages are read-only
+            MessageOverlay mappings over the originals
         """
-        if not self.agent:
-            await self.initialize()
-
+        # Token counts are memoized per message for the duration of this pass
+        # only: messages may be mutated between calls, and the memo must not
+        # keep them alive afterwards
+        self._token_cache.clear()
+        try:
+            return await self._optimize_context(messages, target_tokens, strategy)
+        finally:
+            self._token_cache.clear()
+
+    async def _optimize_context(
+        self,
+        messages: List[Dict[str, Any]],
+        target_tokens: Optional[int],
+        strategy: str
+    ) -> List[Mapping[str, Any]]:
+        """Body of optimize_context(); runs with a fresh token memo."""
         target = target_tokens or self.target_tokens
 
-        # Calculate current token count
-        current_tokens = sum(
-            self.provider.get_token_count(str(msg))
-            for msg in messages
-        )
+        current_tokens = sum(self._toks(msg) for msg in messages)
 
         # If under target, no optimization needed
         if current_tokens <= target:
             return messages
 
-        print(f"Context optimization: {current_tokens} -> target {target} tokens")
+        # Anti-thrashing: skip marginal passes and back off after poor ones
+        if time.monotonic() < self._cooldown_until:
+            logger.debug("Context optimization skipped: cooling down after ineffective passes")
+            return messages
+
+        if (current_tokens - target) / current_tokens < MIN_SAVINGS_RATIO:
+            logger.debug(
+                "Context optimization skipped: %d tokens is within %.0f%% of target %d",
+                current_tokens, MIN_SAVINGS_RATIO * 100, target
+            )
+            return messages
+
+        if not self.agent:
+            await self.initialize()
+
+        logger.info("Context optimization: %d -> target %d tokens", current_tokens, target)
 
         # Apply strategy
         if strategy == "keep_recent_and_relevant":
-            return await self._keep_recent_and_relevant(messages, target)
+            optimized = await self._keep_recent_and_relevant(messages, target)
         elif strategy == "aggressive_compression":
-            return await self._aggressive_compression(messages, target)
+            optimized = await self._aggressive_compression(messages, target)
         elif strategy == "remove_duplicates_only":
-            return await self._remove_duplicates(messages)
+            optimized = await self._remove_duplicates(messages)
         else:
-            return await self._keep_recent_and_relevant(messages, target)
+            optimized = await self._keep_recent_and_relevant(messages, target)
+
+        # Collapse blocks restated across surviving messages
+        optimized = self._dedup_blocks(optimized)
+
+        self._record_savings(current_tokens, optimized)
+        return optimized
+
+    def should_compress_preflight(
+        self,
+        messages: List[Dict[str, Any]],
+        target_tokens: Optional[int] = None
+    ) -> bool:
+        """
+        Cheap check for whether optimize_context() is worth calling.
+
+        Args:
+            messages: Messages that would be optimized
+            target_tokens: Target token count (default: self.target_tokens)
+
+        Returns:
+            True if context is well over target and no cooldown is active
+        """
+        if time.monotonic() < self._cooldown_until:
+            return False
+
+        target = target_tokens or self.target_tokens
+        current_tokens = self._count_tokens(messages)
+        return current_tokens > target * PREFLIGHT_MARGIN
+
+    def _record_savings(
+        self,
+        before_tokens: int,
+        optimized: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Track the savings of an optimization pass and start a cooldown
+        when consecutive passes were ineffective.
+
+        Args:
+            before_tokens: Token count before optimization
+            optimized: Optimized messages
+        """
+        after_tokens = sum(self._toks(msg) for msg in optimized)
+        self._recent_ratios.append((before_tokens - after_tokens) / before_tokens)
+
+        if (
+            len(self._recent_ratios) == self._recent_ratios.maxlen
+            and all(r < MIN_SAVINGS_RATIO for r in self._recent_ratios)
+        ):
+            self._cooldown_until = time.monotonic() + OPTIMIZATION_COOLDOWN_SECONDS
+            self._recent_ratios.clear()
 
     async def _keep_recent_and_relevant(
         self,
@@ -135,17 +304,11 @@ class ContextEditorAgent:
             return messages
 
         # Keep last 2 iterations (assume ~3 messages per iteration)
-        recent_messages = messages[-6:]
-        older_messages = messages[:-6]
-
-        # Remove duplicates from older messages
-        older_messages = await self._remove_duplicates(older_messages)
+        recent_messages = messages[-RECENT_MESSAGES_KEPT:]
+        older_messages = messages[:-RECENT_MESSAGES_KEPT]
 
         # Calculate tokens
-        recent_tokens = sum(
-            self.provider.get_token_count(str(msg))
-            for msg in recent_messages
-        )
+        recent_tokens = sum(self._toks(msg) for msg in recent_messages)
         available_for_older = target_tokens - recent_tokens
 
         # If recent messages alone exceed target, compress them
@@ -156,13 +319,16 @@ class ContextEditorAgent:
             )
             return recent_messages
 
-        # Select older messages that fit in available space
+        # Deduplicate and select older messages that fit in available space
         older_selected = await self._select_by_relevance(
             older_messages,
             available_for_older
         )
 
-        return older_selected + recent_messages
+        # Restore chronological order via the original positions
+        older_selected.sort(key=itemgetter(0))
+
+        return [msg for _, msg in older_selected] + recent_messages
 
     async def _aggressive_compression(
         self,
@@ -172,6 +338,10 @@ class ContextEditorAgent:
         """
         Aggressively compress all messages.
 
+        Older messages are replaced by a single summary message produced by
+        one model call; the most recent messages are truncated. Falls back to
+        truncating everything if summarization fails.
+
         Args:
             messages: Messages to compress
             target_tokens: Target token count
@@ -182,10 +352,142 @@ class ContextEditorAgent:
         # Remove duplicates first
         messages = await self._remove_duplicates(messages)
 
-        # Compress each message
-        compressed = await self._compress_messages(messages, target_tokens)
+        if len(messages) <= RECENT_MESSAGES_KEPT:
+            return await self._compress_messages(messages, target_tokens)
+
+        recent_messages = messages[-RECENT_MESSAGES_KEPT:]
+        older_messages = messages[:-RECENT_MESSAGES_KEPT]
+
+        try:
+            summary = await self._summarize_messages(older_messages)
+        except Exception as e:
+            logger.exception("Context summarization error: %s", e)
+            # Fallback: truncate each message
+            return await self._compress_messages(messages, target_tokens)
+
+        summary_message = {
+            "role": "system",
+            "content": summary,
+            "compression_note": (
+                f"Summary of {len(older_messages)} earlier messages "
+                f"(msg#0-msg#{len(older_messages) - 1})"
+            )
+        }
 
-        return compressed
+        compressed_recent = await self._compress_messages(
+            recent_messages,
+            target_tokens
+        )
+
+        return [summary_message] + compressed_recent
+
+    async def _summarize_messages(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        Summarize a run of messages with a single model call.
+
+        Summaries are cached by message content so re-optimizing the same
+        prefix does not repeat the call.
+
+        Args:
+            messages: Messages to summarize
+
+        Returns:
+            Summary text
+        """
+        turns = []
+        for i, msg in enumerate(messages):
+            if isinstance(msg, Mapping) and "content" in msg:
+                role = msg.get("role", "unknown")
+                source = msg.get("url") or msg.get("source_url")
+                header = f"[TURN {i}] ({role})" + (f" {source}" if source else "")
+                body = str(msg["content"])
+            else:
+                header = f"[TURN {i}]"
+                body = json.dumps(msg, separators=(",", ":"), default=_json_default)
+            turns.append(f"{header}\n{body[:SUMMARY_TURN_MAX_CHARS]}")
+
+        buffer = "\n\n".join(turns)
+        key = hashlib.sha256(buffer.encode()).digest()
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self.agent:
+            await self.initialize()
+
+        bullets = max(5, min(30, len(messages) // 2))
+        prompt = f"""Summarize these {len(messages)} turns into {bullets} bullet points.
+Preserve URLs, numbers, and named entities exactly. Omit repetition.
+
+{buffer}
+"""
+
+        summary = await self.provider.send_message(
+            self.agent,
+            prompt,
+            temperature=0.1
+        )
+
+        if len(self._summary_cache) >= SUMMARY_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._summary_cache.pop(next(iter(self._summary_cache)))
+        self._summary_cache[key] = summary
+
+        return summary
+
+    async def merge(
+        self,
+        prev_digest: str,
+        new_findings: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Fold new findings into a rolling digest of earlier research.
+
+        Each angle is appended as a compact entry; once the digest outgrows
+        DIGEST_MAX_CHARS it is re-summarized with one model call, so the
+        digest stays bounded however many iterations run.
+
+        Args:
+            prev_digest: Digest returned by the previous merge ("" initially)
+            new_findings: Findings produced since the previous merge
+
+        Returns:
+            Updated digest text
+        """
+        entries = [prev_digest] if prev_digest else []
+        for finding in new_findings:
+            angle = finding.get("angle", "Unknown angle")
+            summary = str(finding.get("summary") or "No summary available")
+            num_searches = len(finding.get("searches") or ())
+            entries.append(
+                f"- {angle} ({num_searches} searches): "
+                f"{summary[:DIGEST_ENTRY_MAX_CHARS]}"
+            )
+
+        digest = "\n".join(entries)
+        if len(digest) <= DIGEST_MAX_CHARS:
+            return digest
+
+        if not self.agent:
+            await self.initialize()
+
+        prompt = f"""Condense this research digest to at most {DIGEST_MAX_CHARS // 2} characters.
+Keep one bullet per research angle. Preserve URLs, numbers, and named entities exactly.
+Drop repetition and anything already stated by another bullet.
+
+{digest}
+"""
+
+        try:
+            return await self.provider.send_message(
+                self.agent,
+                prompt,
+                temperature=0.1
+            )
+        except Exception as e:
+            logger.exception("Digest condensation error: %s", e)
+            # Fallback: keep the most recent entries within budget
+            return digest[-DIGEST_MAX_CHARS:]
 
     async def _remove_duplicates(
         self,
@@ -194,35 +496,119 @@ class ContextEditorAgent:
         """
         Remove duplicate URLs and findings.
 
+        Messages are keyed by (url, role), so distinct turns that merely
+        reference the same URL from different roles are kept.
+
         Args:
             messages: Messages to deduplicate
 
         Returns:
             Deduplicated messages
         """
-        seen_urls = set()
-        unique_messages = []
-
-        for msg in messages:
-            # Extract URL if present
-            url = None
-            if isinstance(msg, dict):
-                url = msg.get("url") or msg.get("source_url")
-
-            # Check for duplicates
-            if url:
-                if url in seen_urls:
-                    continue  # Skip duplicate
-                seen_urls.add(url)
-
-            unique_messages.append(msg)
+        keys = [self._dedup_key(msg) for msg in messages]
+        seen = set()
+        unique_messages = [
+            msg for msg, key in zip(messages, keys)
+            if key is None or (key not in seen and not seen.add(key))
+        ]
 
         removed = len(messages) - len(unique_messages)
         if removed > 0:
-            print(f"Removed {removed} duplicate messages")
+            logger.debug("Removed %d duplicate messages", removed, extra={"n": removed})
 
         return unique_messages
 
+    def _dedup_blocks(
+        self,
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Replace content blocks already seen in an earlier message.
+
+        Each message's content is split into variable-length blocks at
+        content-defined line boundaries, so the same passage produces the
+        same blocks even when wrapped in different surrounding text. Repeats
+        become a short pointer to the first occurrence.
+
+        Args:
+            messages: Messages in their final order
+
+        Returns:
+            Messages with repeated blocks replaced by location annotations
+        """
+        # blake2b(block) -> (message index, block index) of first occurrence
+        block_index: Dict[bytes, Tuple[int, int]] = {}
+        result = []
+        replaced = 0
+
+        for i, msg in enumerate(messages):
+            content = msg.get("content") if isinstance(msg, Mapping) else None
+            if not isinstance(content, str):
+                result.append(msg)
+                continue
+
+            parts = []
+            changed = False
+            for j, block in enumerate(self._split_blocks(content)):
+                if len(block) < BLOCK_MIN_CHARS:
+                    parts.append(block)
+                    continue
+
+                digest = hashlib.blake2b(block.encode(), digest_size=16).digest()
+                first = block_index.get(digest)
+                if first is None:
+                    block_index[digest] = (i, j)
+                    parts.append(block)
+                else:
+                    parts.append(f"[see earlier: msg#{first[0]} block#{first[1]}]\n")
+                    changed = True
+                    replaced += 1
+
+            if changed:
+                msg = MessageOverlay({"content": "".join(parts)}, msg)
+            result.append(msg)
+
+        if replaced:
+            logger.debug("Replaced %d repeated content blocks", replaced)
+
+        return result
+
+    def _split_blocks(self, content: str) -> List[str]:
+        """
+        Split content into blocks at content-defined line boundaries.
+
+        Args:
+            content: Text to split
+
+        Returns:
+            Blocks whose concatenation equals content
+        """
+        blocks = []
+        current = []
+        for line in content.splitlines(keepends=True):
+            current.append(line)
+            if zlib.crc32(line.encode()) % BLOCK_BOUNDARY_MODULUS == 0:
+                blocks.append("".join(current))
+                current = []
+        if current:
+            blocks.append("".join(current))
+        return blocks
+
+    def _dedup_key(self, msg: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the duplicate-detection key for a message.
+
+        Args:
+            msg: Message to key
+
+        Returns:
+            (url, role) tuple, or None if the message has no URL
+        """
+        if not isinstance(msg, Mapping):
+            return None
+        url = msg.get("url") or msg.get("source_url")
+        return (url, msg.get("role")) if url else None
+
     async def _compress_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -243,14 +629,12 @@ class ContextEditorAgent:
 
         for msg in messages:
             # Keep message structure but compress content
-            if isinstance(msg, dict) and "content" in msg:
+            if isinstance(msg, Mapping) and "content" in msg:
                 content = str(msg["content"])
                 if len(content) > 500:
                     # Truncate long content
-                    compressed_content = content[:500] + "..."
-                    compressed_msg = msg.copy()
-                    compressed_msg["content"] = compressed_content
-                    compressed.append(compressed_msg)
+                    # Overlay the truncated content instead of copying the message
+                    compressed.append(MessageOverlay({"content": content[:500] + "..."}, msg))
                 else:
                     compressed.append(msg)
             else:
@@ -262,42 +646,137 @@ class ContextEditorAgent:
         self,
         messages: List[Dict[str, Any]],
         available_tokens: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tuple[int, Dict[str, Any]]]:
         """
-        Select messages by relevance score to fit in available tokens.
+        Select unique messages by relevance score to fit in available tokens.
+
+        Duplicate removal and scoring happen in a single pass; only the
+        highest-scored candidates that could possibly fit are ranked.
 
         Args:
             messages: Messages to select from
             available_tokens: Token budget
 
         Returns:
-            Selected messages
+            (original index, message) pairs in relevance order; callers
+            sort by index to restore chronological order
         """
-        # Score each message by relevance (simple heuristic)
-        scored_messages = []
-        for msg in messages:
-            score = self._calculate_relevance_score(msg)
-            tokens = self.provider.get_token_count(str(msg))
-            scored_messages.append((score, tokens, msg))
+        if available_tokens <= 0 or not messages:
+            return []
+
+        # Score each unique message into parallel columns (struct-of-arrays)
+        scores = array("d")
+        tokens = array("q")
+        positions = array("q")
+        kept: List[Dict[str, Any]] = []
+        for i, msg in self._iter_unique(messages):
+            scores.append(self._calculate_relevance_score(msg))
+            tokens.append(self._toks(msg))
+            positions.append(i)
+            kept.append(msg)
+
+        removed = len(messages) - len(kept)
+        if removed > 0:
+            logger.debug("Removed %d duplicate messages", removed, extra={"n": removed})
 
-        # Sort by score descending
-        scored_messages.sort(reverse=True, key=lambda x: x[0])
+        if not kept:
+            return []
 
-        # Select messages until we reach token limit
-        selected = []
-        total_tokens = 0
+        # No more than this many messages can fit in the budget, so only the
+        # top-k row numbers by score (ties in original order) need ranking
+        k = available_tokens // max(1, min(tokens))
+        order = heapq.nlargest(k, range(len(kept)), key=scores.__getitem__)
 
-        for score, tokens, msg in scored_messages:
-            if total_tokens + tokens <= available_tokens:
-                selected.append(msg)
-                total_tokens += tokens
-            else:
-                break
+        # Take the longest ranked prefix whose running total fits the budget
+        cumulative = list(accumulate(tokens[j] for j in order))
+        cutoff = bisect_right(cumulative, available_tokens)
+
+        return [(positions[j], kept[j]) for j in order[:cutoff]]
+
+    def _iter_unique(
+        self,
+        messages: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (index, message) for each non-duplicate message.
+
+        Args:
+            messages: Messages to filter
+
+        Yields:
+            Index-tagged messages in original order
+        """
+        seen = set()
+        for i, msg in enumerate(messages):
+            key = self._dedup_key(msg)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield i, msg
+
+    def _count_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Count tokens for a standalone check, with a memo scoped to this call.
+
+        Args:
+            messages: Messages to count
 
-        # Restore chronological order
-        selected.sort(key=lambda x: messages.index(x) if x in messages else 0)
+        Returns:
+            Total token count
+        """
+        self._token_cache.clear()
+        try:
+            return sum(self._toks(msg) for msg in messages)
+        finally:
+            self._token_cache.clear()
+
+    def _toks(self, msg: Dict[str, Any]) -> int:
+        """
+        Get the token count for a message, memoized by object identity for
+        the duration of the current optimize_context() pass.
+
+        Args:
+            msg: Message to count
+
+        Returns:
+            Token count
+        """
+        key = id(msg)
+        entry = self._token_cache.get(key)
+        if entry is not None and entry[0] is msg:
+            return entry[1]
+
+        if len(self._token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            self._token_cache.clear()
+
+        tokens = self._msg_tokens(msg)
+        self._token_cache[key] = (msg, tokens)
+        return tokens
 
-        return selected
+    def _msg_tokens(self, msg: Dict[str, Any]) -> int:
+        """
+        Count the tokens a message contributes to the model context.
+
+        Only the content field is tokenized, plus a fixed per-message
+        overhead for role framing; messages without content (e.g. raw
+        findings) are serialized whole.
+
+        Args:
+            msg: Message to count
+
+        Returns:
+            Token count
+        """
+        if isinstance(msg, Mapping) and "content" in msg:
+            content = msg["content"]
+            if not isinstance(content, str):
+                content = json.dumps(content, separators=(",", ":"), default=_json_default)
+            return self.provider.get_token_count(content) + MESSAGE_TOKEN_OVERHEAD
+
+        return self.provider.get_token_count(
+            json.dumps(msg, separators=(",", ":"), default=_json_default)
+        )
 
     def _calculate_relevance_score(self, message: Dict[str, Any]) -> float:
         """
@@ -314,26 +793,19 @@ class ContextEditorAgent:
         Returns:
             Relevance score (0.0-1.0)
         """
-        score = 0.5  # Base score
+        if not isinstance(message, Mapping):
+            return RELEVANCE_SCORE_LUT[0]
 
         # Check for explicit relevance
-        if isinstance(message, dict):
-            if "relevance" in message:
-                return float(message["relevance"])
-
-            # Boost for URLs (indicates source)
-            if "url" in message or "source_url" in message:
-                score += 0.2
+        if "relevance" in message:
+            return float(message["relevance"])
 
-            # Boost for key points (indicates structured data)
-            if "key_points" in message:
-                score += 0.2
+        # One key-set intersection builds the feature bitmask
+        bits = 0
+        for key in message.keys() & RELEVANCE_FEATURE_BITS.keys():
+            bits |= RELEVANCE_FEATURE_BITS[key]
 
-            # Boost for numerical data
-            if "numerical_data" in message:
-                score += 0.1
-
-        return min(score, 1.0)
+        return RELEVANCE_SCORE_LUT[bits]
 
     async def get_context_stats(
         self,
@@ -348,10 +820,7 @@ class ContextEditorAgent:
         Returns:
             Context statistics
         """
-        total_tokens = sum(
-            self.provider.get_token_count(str(msg))
-            for msg in messages
-        )
+        total_tokens = self._count_tokens(messages)
 
         return {
             "total_messages": len(messages),
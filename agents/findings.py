@@ -0,0 +1,466 @@
+"""
+Findings Formatting - Shared helpers for rendering research findings.
+
+Verification and synthesis both render every angle's findings into their
+prompts on every call. The per-angle blocks are memoized on their content, so
+re-rendering a growing findings list only formats the angles that are new.
+Synthesis blocks are filled to a token budget, most relevant searches first,
+skipping key points that restate one already kept for the same angle.
+
+FindingsIndex keeps per-angle metadata in parallel arrays with running totals,
+so quality checks and report footers aggregate without walking the findings.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, List, Sequence, Tuple, TypedDict
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+import re
+
+if TYPE_CHECKING:
+    from .search_agent import SearchResult
+
+
+# Approximate input budget for the findings section of a synthesis prompt,
+# shared evenly between angles
+SYNTHESIS_FINDINGS_MAX_TOKENS = 8000
+
+# Rough characters-per-token ratio for budget estimates (English prose)
+CHARS_PER_TOKEN = 4
+
+# Upper bound on memoized per-angle blocks
+FORMAT_CACHE_MAX_ENTRIES = 4096
+
+# Separator between key-point bullets (each bullet line is "  - point")
+_POINT_BULLET = "\n  - "
+
+# Separator between top-level "- item" bullets
+_BULLET = "\n- "
+
+# Key points whose word-shingle Jaccard similarity to a kept point reaches
+# this threshold are dropped as restatements
+KEY_POINT_DUP_THRESHOLD = 0.8
+
+# Words per shingle for near-duplicate detection
+SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text without a tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_at_paragraph(text: str, max_tokens: int) -> str:
+    """
+    Cut text to a token budget at the last paragraph boundary that fits.
+
+    Falls back to the last line break, then to a hard cut, when no
+    paragraph boundary lies within the budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Approximate token budget
+
+    Returns:
+        Text within the budget
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    head = text[:max_chars]
+    for boundary in ("\n\n", "\n"):
+        cut = head.rfind(boundary)
+        if cut > 0:
+            return head[:cut]
+    return head
+
+
+class Finding(TypedDict, total=False):
+    """Findings for one research angle, as passed between agents."""
+    angle: str
+    searches: List["SearchResult"]
+    summary: str
+    total_tokens: int
+
+
+@lru_cache(maxsize=FORMAT_CACHE_MAX_ENTRIES)
+def shingles(text: str, size: int = SHINGLE_SIZE) -> frozenset:
+    """
+    Word shingles of text, for near-duplicate detection (memoized).
+
+    Args:
+        text: Text to fingerprint
+        size: Words per shingle
+
+    Returns:
+        Set of word tuples; the word set itself for texts shorter than size
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return frozenset((word,) for word in words)
+    return frozenset(tuple(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def is_near_duplicate(
+    candidate: frozenset,
+    kept: List[frozenset],
+    threshold: float = KEY_POINT_DUP_THRESHOLD
+) -> bool:
+    """
+    Check a shingle set against already kept ones by Jaccard similarity.
+
+    Args:
+        candidate: Shingles of the new text
+        kept: Shingles of texts kept so far
+        threshold: Similarity at which texts count as duplicates
+
+    Returns:
+        True if candidate restates a kept text
+    """
+    if not candidate:
+        return False
+    for other in kept:
+        union = len(candidate | other)
+        if union and len(candidate & other) / union >= threshold:
+            return True
+    return False
+
+
+@dataclass(slots=True)
+class FindingsIndex:
+    """
+    Column-oriented metadata for a list of findings, one row per angle.
+
+    Rows are appended as findings are produced; totals are maintained
+    incrementally so aggregate queries are O(1).
+    """
+    search_counts: array = field(default_factory=lambda: array("i"))
+    has_summary: array = field(default_factory=lambda: array("b"))
+    avg_relevance: array = field(default_factory=lambda: array("f"))
+    total_searches: int = 0
+    missing_summaries: int = 0
+
+    @classmethod
+    def from_findings(cls, findings: Iterable[Finding]) -> "FindingsIndex":
+        """
+        Build an index over existing findings.
+
+        Args:
+            findings: Finding dictionaries
+
+        Returns:
+            Populated FindingsIndex
+        """
+        index = cls()
+        index.extend(findings)
+        return index
+
+    def add(self, finding: Finding) -> None:
+        """
+        Append one finding's metadata.
+
+        Args:
+            finding: Finding dictionary
+        """
+        searches = finding.get("searches") or ()
+        count = len(searches)
+        summarized = bool(finding.get("summary"))
+
+        relevance = 0.0
+        if count:
+            relevance = sum(
+                float(get_field(search, "relevance", 0) or 0) for search in searches
+            ) / count
+
+        self.search_counts.append(count)
+        self.has_summary.append(summarized)
+        self.avg_relevance.append(relevance)
+        self.total_searches += count
+        self.missing_summaries += not summarized
+
+    def extend(self, findings: Iterable[Finding]) -> None:
+        """
+        Append metadata for several findings.
+
+        Args:
+            findings: Finding dictionaries
+        """
+        for finding in findings:
+            self.add(finding)
+
+    def merge(self, other: "FindingsIndex") -> None:
+        """
+        Append another index's rows and totals without revisiting findings.
+
+        Args:
+            other: Index to append
+        """
+        self.search_counts.extend(other.search_counts)
+        self.has_summary.extend(other.has_summary)
+        self.avg_relevance.extend(other.avg_relevance)
+        self.total_searches += other.total_searches
+        self.missing_summaries += other.missing_summaries
+
+    def __len__(self) -> int:
+        return len(self.search_counts)
+
+    @property
+    def all_have_summaries(self) -> bool:
+        """Whether every indexed angle has a summary."""
+        return self.missing_summaries == 0
+
+
+def get_field(obj: Any, name: str, default: Any = None) -> Any:
+    """
+    Read a field from a dict or an object (e.g. a SearchResult dataclass).
+
+    Args:
+        obj: Mapping or object
+        name: Key or attribute name
+        default: Value when the field is missing
+
+    Returns:
+        Field value or default
+    """
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def searches_key(searches: List[Any]) -> Tuple[Tuple[str, float, Tuple[str, ...]], ...]:
+    """
+    Build a hashable key for an angle's searches, most relevant first.
+
+    Args:
+        searches: Search results (dicts or SearchResult objects)
+
+    Returns:
+        Tuple of (provider, relevance, key points) per search
+    """
+    key = [
+        (
+            str(get_field(search, "provider", "unknown")),
+            float(get_field(search, "relevance", 0) or 0),
+            tuple(str(point) for point in get_field(search, "key_points") or ()),
+        )
+        for search in searches
+    ]
+    key.sort(key=itemgetter(1), reverse=True)
+    return tuple(key)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_MAX_ENTRIES)
+def format_synthesis_block(
+    angle: str,
+    summary: str,
+    num_searches: int,
+    key: Tuple[Tuple[str, float, Tuple[str, ...]], ...],
+    max_tokens: int = SYNTHESIS_FINDINGS_MAX_TOKENS
+) -> str:
+    """
+    Format one angle for the synthesis prompt within a token budget (memoized).
+
+    The angle's summary is always included; searches are then added in
+    descending relevance, key point by key point, until the budget is spent.
+    Key points that restate one already included are skipped, and searches
+    left with nothing new are omitted.
+
+    Args:
+        angle: Research angle
+        summary: Angle summary
+        num_searches: Number of searches for the angle
+        key: Result of searches_key() for the angle's searches
+        max_tokens: Approximate token budget for the block
+
+    Returns:
+        Block text following the "=== ANGLE i: " header
+    """
+    remaining = max_tokens * CHARS_PER_TOKEN - len(angle) - len(summary) - 64
+
+    search_details = []
+    kept_shingles: List[frozenset] = []
+    for provider, relevance, key_points in key:
+        header = (
+            f"\n  Search {len(search_details) + 1} "
+            f"({provider}, relevance: {relevance:.1f}):\n  "
+        )
+        remaining -= len(header) + 2
+        if remaining <= 0:
+            break
+
+        points = []
+        exhausted = False
+        for point in key_points:
+            point_shingles = shingles(point)
+            if is_near_duplicate(point_shingles, kept_shingles):
+                continue
+            remaining -= len(point) + len(_POINT_BULLET)
+            if remaining < 0:
+                exhausted = True
+                break
+            points.append(point)
+            kept_shingles.append(point_shingles)
+
+        if not points:
+            if exhausted:
+                break
+            if key_points:
+                # Everything restated earlier searches
+                remaining += len(header) + 2
+                continue
+
+        text = "  - " + _POINT_BULLET.join(points) if points else ""
+        search_details.append(f"{header}{text}\n")
+
+    details = "\n".join(search_details)
+    return f"""{angle} ===
+Number of searches: {num_searches}
+
+Key findings:
+{details}
+
+Summary:
+{summary}
+"""
+
+
+@lru_cache(maxsize=FORMAT_CACHE_MAX_ENTRIES)
+def format_verification_block(angle: str, summary: str, num_searches: int) -> str:
+    """
+    Format one angle for the verification prompt (memoized).
+
+    Args:
+        angle: Research angle
+        summary: Angle summary
+        num_searches: Number of searches for the angle
+
+    Returns:
+        Block text following the "ANGLE i: " header
+    """
+    return f"""{angle}
+Number of searches: {num_searches}
+Summary: {summary}
+"""
+
+
+def format_verification_assessment(
+    confidence: float,
+    strengths: Sequence[str],
+    gaps: Sequence[str]
+) -> str:
+    """
+    Format a verification assessment for the synthesis prompt.
+
+    Args:
+        confidence: Overall confidence score
+        strengths: Strengths of the research
+        gaps: Identified gaps
+
+    Returns:
+        Formatted verification info
+    """
+    strengths_text = "- " + _BULLET.join(strengths) if strengths else "- None noted"
+    gaps_text = "- " + _BULLET.join(gaps) if gaps else "- None identified"
+
+    return f"""
+VERIFICATION ASSESSMENT:
+Overall Confidence: {confidence:.2f}
+
+Strengths:
+{strengths_text}
+
+Identified Gaps:
+{gaps_text}
+"""
+
+
+def format_findings_for_synthesis(
+    findings: List[Finding],
+    max_tokens: int = SYNTHESIS_FINDINGS_MAX_TOKENS
+) -> str:
+    """
+    Format findings into readable structure for synthesis.
+
+    Args:
+        findings: List of finding dictionaries
+        max_tokens: Approximate token budget, split evenly between angles
+
+    Returns:
+        Formatted string
+    """
+    per_angle_tokens = max_tokens // max(len(findings), 1)
+
+    formatted = []
+    for i, finding in enumerate(findings, 1):
+        searches = finding.get("searches") or []
+        block = format_synthesis_block(
+            str(finding.get("angle", "Unknown angle")),
+            str(finding.get("summary", "No summary available")),
+            len(searches),
+            searches_key(searches),
+            per_angle_tokens
+        )
+        formatted.append(f"\n=== ANGLE {i}: {block}")
+
+    return "\n".join(formatted)
+
+
+def format_findings_overview(findings: List[Finding], max_tokens: int) -> str:
+    """
+    Format findings as one line per angle, each angle's summary clipped to
+    an even share of the token budget so every angle is represented.
+
+    Args:
+        findings: List of finding dictionaries
+        max_tokens: Approximate token budget for the whole overview
+
+    Returns:
+        Formatted string, "- angle: summary" per line
+    """
+    per_angle_chars = max_tokens * CHARS_PER_TOKEN // max(len(findings), 1)
+
+    lines = []
+    for finding in findings:
+        angle = str(finding.get("angle", "Unknown angle"))
+        summary = " ".join(str(finding.get("summary", "No summary available")).split())
+        room = max(per_angle_chars - len(angle) - 4, 0)
+        if len(summary) > room:
+            cut = summary.rfind(" ", 0, room)
+            summary = summary[:cut if cut > 0 else room] + "..."
+        lines.append(f"- {angle}: {summary}")
+
+    return "\n".join(lines)
+
+
+def format_findings_for_verification(findings: List[Finding]) -> str:
+    """
+    Format findings into readable summary for verification.
+
+    Args:
+        findings: List of finding dictionaries
+
+    Returns:
+        Formatted string
+    """
+    formatted = []
+    for i, finding in enumerate(findings, 1):
+        block = format_verification_block(
+            str(finding.get("angle", "Unknown angle")),
+            str(finding.get("summary", "No summary available")),
+            len(finding.get("searches") or ())
+        )
+        formatted.append(f"\nANGLE {i}: {block}")
+
+    return "\n".join(formatted)
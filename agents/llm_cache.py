@@ -0,0 +1,785 @@
+"""
+LLM Response Caching - Reuse completions for repeated or near-duplicate prompts.
+
+SemanticCache answers a prompt from an earlier completion when the prompt is
+identical, or when its semantic key is similar enough (cosine similarity over
+a hashed bag-of-words embedding) and has the same content terms, so keys that
+differ in a single topic word never share a completion. This removes the LLM round-trip for repeated
+research runs on the same or closely related queries. AngleTemplateCache
+applies the same idea to whole angle plans, keyed by the query's topic.
+
+LLMCache is an exact-match cache for deterministic calls (temperature 0 and
+tool calls) with pluggable async storage backends.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, Protocol
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from pathlib import Path
+import asyncio
+import copy
+import hashlib
+import math
+import re
+import time
+import zlib
+
+from utils import json_utils
+from utils.logging_config import get_logger
+
+
+logger = get_logger("llm_cache")
+
+# Dimensionality of the hashed bag-of-words embedding
+EMBEDDING_DIM = 1024
+
+_WORD_RE = re.compile(r"\w+")
+
+# Function words ignored when comparing the content terms of two texts
+STOPWORDS = frozenset("""
+a about an and are as at be by can could do does for from had has have how
+i in into is it its me my of on or our should so than that the their them
+there these this those to was we were what when where which who why will
+with would you your
+""".split())
+
+
+@lru_cache(maxsize=4096)
+def embed_text(text: str) -> Dict[int, float]:
+    """
+    Embed text as a sparse, L2-normalized hashed bag of unigrams and bigrams.
+
+    Results are memoized; callers must not mutate the returned mapping.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        Mapping of feature index to weight
+    """
+    words = _WORD_RE.findall(text.lower())
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    vector: Dict[int, float] = {}
+    for feature in features:
+        index = zlib.crc32(feature.encode()) % EMBEDDING_DIM
+        vector[index] = vector.get(index, 0.0) + 1.0
+
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if norm:
+        for index in vector:
+            vector[index] /= norm
+    return vector
+
+
+@lru_cache(maxsize=4096)
+def content_terms(text: str) -> frozenset:
+    """
+    Distinct non-stopword words of a text (memoized).
+
+    Hashed bag-of-words cosine barely moves when one key word is swapped
+    ("... in Europe in 2025?" vs "... in China in 2025?"), so near hits also
+    require equal content terms: texts may differ in word order, case,
+    punctuation and function words, but not in what they are about.
+
+    Args:
+        text: Text to reduce
+
+    Returns:
+        Set of lowercased content words
+    """
+    return frozenset(
+        word for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS
+    )
+
+
+def cosine_similarity(a: Dict[int, float], b: Dict[int, float]) -> float:
+    """
+    Cosine similarity of two normalized sparse vectors.
+
+    Args:
+        a: First vector
+        b: Second vector
+
+    Returns:
+        Similarity in [0, 1]
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(i, 0.0) for i, w in a.items())
+
+
+def agent_namespace(agent: Any) -> str:
+    """
+    Derive a cache namespace from an agent's model and system prompt.
+
+    Completions are only shared between agents with the same model and
+    system prompt.
+
+    Args:
+        agent: Provider agent (a config dict for ClaudeProvider)
+
+    Returns:
+        Namespace string
+    """
+    if isinstance(agent, dict):
+        model = str(agent.get("model", ""))
+        system_prompt = str(agent.get("system_prompt", ""))
+    else:
+        model = type(agent).__name__
+        system_prompt = ""
+    digest = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
+    return f"{model}:{digest}"
+
+
+class SemanticCache:
+    """
+    In-memory completion cache with exact and similarity-based lookup.
+
+    Features:
+    - Exact hits keyed by sha256(namespace || prompt)
+    - Approximate hits when the semantic key's cosine similarity >= threshold
+      and its content terms (see content_terms) match exactly
+    - Per-entry TTL and bounded size (oldest entries evicted first)
+    - Optional JSON persistence between runs
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        max_entries: int = 1024,
+        path: Optional[str] = None
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for an approximate hit
+                (content terms must also match)
+            ttl: Seconds before an entry expires
+            max_entries: Maximum cached completions
+            path: Optional JSON file to load from and persist to
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+
+        # exact key -> (namespace, semantic vector, content terms, response, created_at)
+        self._entries: Dict[str, Tuple[str, Dict[int, float], frozenset, str, float]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def _exact_key(self, namespace: str, prompt: str) -> str:
+        """Build the exact-match key for a prompt."""
+        return hashlib.sha256(f"{namespace}\x00{prompt}".encode()).hexdigest()
+
+    def get(
+        self,
+        namespace: str,
+        prompt: str,
+        semantic_key: Optional[str] = None,
+        threshold: Optional[float] = None,
+        ttl: Optional[float] = None,
+        vector: Optional[Dict[int, float]] = None
+    ) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            namespace: Cache namespace (see agent_namespace)
+            prompt: Full prompt text
+            semantic_key: Text compared for approximate hits (default: prompt)
+            threshold: Override the similarity threshold for this lookup
+            ttl: Override the entry TTL for this lookup
+            vector: Precomputed embedding of the semantic key
+
+        Returns:
+            Cached response, or None on miss
+        """
+        threshold = self.threshold if threshold is None else threshold
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+
+        entry = self._entries.get(self._exact_key(namespace, prompt))
+        if entry is not None and now - entry[4] < ttl:
+            self.hits += 1
+            return entry[3]
+
+        query_vector = vector if vector is not None else embed_text(semantic_key or prompt)
+        query_terms = content_terms(semantic_key or prompt)
+        best_score = 0.0
+        best_response = None
+        for entry_namespace, vector, terms, response, created_at in self._entries.values():
+            if (
+                entry_namespace != namespace
+                or now - created_at >= ttl
+                or terms != query_terms
+            ):
+                continue
+            score = cosine_similarity(query_vector, vector)
+            if score > best_score:
+                best_score, best_response = score, response
+
+        if best_response is not None and best_score >= threshold:
+            self.hits += 1
+            self.semantic_hits += 1
+            logger.debug("Semantic cache hit (similarity %.3f)", best_score)
+            return best_response
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        namespace: str,
+        prompt: str,
+        response: str,
+        semantic_key: Optional[str] = None,
+        vector: Optional[Dict[int, float]] = None
+    ) -> None:
+        """
+        Store a completion.
+
+        Args:
+            namespace: Cache namespace (see agent_namespace)
+            prompt: Full prompt text
+            response: Completion to cache
+            semantic_key: Text compared for approximate hits (default: prompt)
+            vector: Precomputed embedding of the semantic key
+        """
+        key = self._exact_key(namespace, prompt)
+        self._entries.pop(key, None)
+
+        while len(self._entries) >= self.max_entries:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._entries.pop(next(iter(self._entries)))
+
+        self._entries[key] = (
+            namespace,
+            vector if vector is not None else embed_text(semantic_key or prompt),
+            content_terms(semantic_key or prompt),
+            response,
+            time.time()
+        )
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def save(self) -> None:
+        """Persist unexpired entries to the configured JSON file."""
+        if not self.path:
+            return
+
+        now = time.time()
+        records: List[List[Any]] = [
+            [key, namespace, list(vector.items()), sorted(terms), response, created_at]
+            for key, (namespace, vector, terms, response, created_at) in self._entries.items()
+            if now - created_at < self.ttl
+        ]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            f.write(json_utils.dumps(records))
+
+    def load(self) -> None:
+        """Load unexpired entries from the configured JSON file."""
+        if not self.path:
+            return
+
+        try:
+            with open(self.path, "r") as f:
+                records = json_utils.loads(f.read())
+        except (OSError, *json_utils.JSONDecodeError) as e:
+            logger.warning("Could not load semantic cache from %s: %s", self.path, e)
+            return
+
+        now = time.time()
+        for record in records[-self.max_entries:]:
+            if len(record) != 6:
+                # Written before content terms were stored; can't be matched safely
+                continue
+            key, namespace, vector, terms, response, created_at = record
+            if now - created_at < self.ttl:
+                self._entries[key] = (
+                    namespace,
+                    {int(i): w for i, w in vector},
+                    frozenset(terms),
+                    response,
+                    created_at
+                )
+
+
+# Global semantic cache instance
+_global_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_global_semantic_cache() -> SemanticCache:
+    """
+    Get or create global semantic cache instance
+
+    Returns:
+        Global SemanticCache instance
+    """
+    global _global_semantic_cache
+    if _global_semantic_cache is None:
+        _global_semantic_cache = SemanticCache()
+    return _global_semantic_cache
+
+
+def semantic_cached(
+    threshold: float = 0.92,
+    ttl: float = 3600.0,
+    max_temperature: float = 0.5,
+    cache: Optional[SemanticCache] = None
+) -> Callable:
+    """
+    Decorator adding semantic caching to an agent's send method.
+
+    The decorated coroutine must have the signature
+    ``(self, prompt, temperature, semantic_key=None) -> str`` and the instance
+    must expose the provider agent as ``self.agent``. Calls with temperature
+    above max_temperature are never cached.
+
+    Args:
+        threshold: Minimum cosine similarity for an approximate hit (content
+            terms must also match)
+        ttl: Seconds before an entry expires
+        max_temperature: Highest temperature whose responses are cached
+        cache: Cache to use (default: the global semantic cache)
+
+    Returns:
+        Decorator
+    """
+    def decorator(
+        func: Callable[..., Awaitable[str]]
+    ) -> Callable[..., Awaitable[str]]:
+        @wraps(func)
+        async def wrapper(
+            self,
+            prompt: str,
+            temperature: float,
+            semantic_key: Optional[str] = None
+        ) -> str:
+            if temperature > max_temperature:
+                return await func(self, prompt, temperature, semantic_key)
+
+            store = cache or get_global_semantic_cache()
+            namespace = agent_namespace(self.agent)
+
+            # Embed once for both the lookup and the store on a miss
+            vector = embed_text(semantic_key or prompt)
+
+            cached = store.get(
+                namespace, prompt, semantic_key, threshold, ttl, vector=vector
+            )
+            if cached is not None:
+                return cached
+
+            response = await func(self, prompt, temperature, semantic_key)
+            store.set(namespace, prompt, response, semantic_key, vector=vector)
+            return response
+
+        return wrapper
+    return decorator
+
+
+class AngleTemplateCache:
+    """
+    Reusable research-angle plans keyed by query topic.
+
+    Rephrasings of the same query ("How does LLM inference optimization work?"
+    vs "LLM inference optimization: how does it work") yield nearly identical
+    angle sets, so a query whose embedding is close enough to an earlier one
+    and has the same content terms reuses its angles instead of asking the
+    model again. Angles generated for such queries accumulate in the same
+    template.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.88,
+        ttl: float = 3600.0,
+        max_entries: int = 256,
+        max_angles: int = 20
+    ):
+        """
+        Initialize angle template cache.
+
+        Args:
+            threshold: Minimum topic cosine similarity for a hit (content
+                terms must also match)
+            ttl: Seconds before a template expires
+            max_entries: Maximum cached templates
+            max_angles: Maximum angles kept per template
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_angles = max_angles
+
+        # [topic vector, content terms, angles, created_at]
+        self._templates: List[List[Any]] = []
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def _nearest(self, query: str) -> Optional[List[Any]]:
+        """Find the unexpired template closest to the query, if within threshold."""
+        vector = embed_text(query)
+        terms = content_terms(query)
+        now = time.time()
+        best_score = 0.0
+        best = None
+        for template in self._templates:
+            if now - template[3] >= self.ttl or template[1] != terms:
+                continue
+            score = cosine_similarity(vector, template[0])
+            if score > best_score:
+                best_score, best = score, template
+
+        if best is not None and best_score >= self.threshold:
+            return best
+        return None
+
+    def get(
+        self,
+        query: str,
+        num_angles: int,
+        existing_angles: Optional[List[str]] = None
+    ) -> Optional[List[str]]:
+        """
+        Look up angles for a query.
+
+        Args:
+            query: Research query
+            num_angles: Number of angles needed
+            existing_angles: Angles already researched (excluded from the result)
+
+        Returns:
+            num_angles unused angles, or None on miss
+        """
+        template = self._nearest(query)
+        if template is not None:
+            seen = {angle.casefold() for angle in existing_angles or ()}
+            angles = [angle for angle in template[2] if angle.casefold() not in seen]
+            if len(angles) >= num_angles:
+                self.hits += 1
+                return angles[:num_angles]
+
+        self.misses += 1
+        return None
+
+    def set(self, query: str, angles: List[str]) -> None:
+        """
+        Store generated angles under the query's topic.
+
+        Args:
+            query: Research query
+            angles: Angles generated for the query
+        """
+        template = self._nearest(query)
+        if template is not None:
+            known = {angle.casefold() for angle in template[2]}
+            template[2].extend(
+                angle for angle in angles if angle.casefold() not in known
+            )
+            del template[2][self.max_angles:]
+            return
+
+        while len(self._templates) >= self.max_entries:
+            self._templates.pop(0)
+
+        self._templates.append(
+            [
+                embed_text(query),
+                content_terms(query),
+                list(angles[:self.max_angles]),
+                time.time()
+            ]
+        )
+
+    def clear(self) -> None:
+        """Remove all templates and reset statistics."""
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Global angle template cache instance
+_global_angle_template_cache: Optional[AngleTemplateCache] = None
+
+
+def get_global_angle_template_cache() -> AngleTemplateCache:
+    """
+    Get or create global angle template cache instance
+
+    Returns:
+        Global AngleTemplateCache instance
+    """
+    global _global_angle_template_cache
+    if _global_angle_template_cache is None:
+        _global_angle_template_cache = AngleTemplateCache()
+    return _global_angle_template_cache
+
+
+class CacheBackend(Protocol):
+    """Async key-value storage used by LLMCache."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+        ...
+
+
+class MemoryBackend:
+    """In-process LRU backend."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize memory backend.
+
+        Args:
+            max_entries: Maximum entries before least-recently-used eviction
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[0])
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (copy.deepcopy(value), time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileBackend:
+    """JSON-file-per-key backend that survives restarts."""
+
+    def __init__(self, directory: str = ".cache/llm"):
+        """
+        Initialize file backend.
+
+        Args:
+            directory: Directory for cache files
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), "r") as f:
+                record = json_utils.loads(f.read())
+        except (OSError, *json_utils.JSONDecodeError):
+            return None
+        if time.time() >= record["expires_at"]:
+            return None
+        return record["value"]
+
+    def _write(self, key: str, value: Any, ttl: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._path(key), "w") as f:
+            f.write(json_utils.dumps({"expires_at": time.time() + ttl, "value": value}))
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+
+def cache_key(
+    model: str,
+    messages: Any,
+    temperature: float,
+    tools: Optional[List[str]] = None,
+    **kwargs
+) -> Optional[str]:
+    """
+    Build an exact-match cache key for a deterministic LLM call.
+
+    Args:
+        model: Model identifier (see agent_namespace)
+        messages: Prompt or tool arguments
+        temperature: Sampling temperature
+        tools: Tool names involved in the call
+        **kwargs: Other request parameters that affect the output
+
+    Returns:
+        sha256 hex digest, or None if the call is not deterministic
+    """
+    if temperature > 0:
+        return None
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "tools": tools or [],
+        "params": kwargs
+    }
+    encoded = json_utils.dumps(payload, sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    Exact-match cache for deterministic provider calls.
+
+    send_message() results are cached only at temperature <= 0; call_tool()
+    results are cached by tool name and arguments.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 3600.0):
+        """
+        Initialize LLM cache.
+
+        Args:
+            backend: Storage backend (default: MemoryBackend)
+            ttl: Seconds before an entry expires
+        """
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    async def send_message(
+        self,
+        provider,
+        agent: Any,
+        message: str,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> str:
+        """
+        Send a message through the cache.
+
+        Args:
+            provider: BaseProvider instance
+            agent: Agent instance
+            message: Message to send
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            Agent response
+        """
+        key = cache_key(agent_namespace(agent), message, temperature, **kwargs)
+        if key is not None:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        response = await provider.send_message(
+            agent,
+            message,
+            temperature=temperature,
+            **kwargs
+        )
+
+        if key is not None:
+            await self.backend.set(key, response, self.ttl)
+        return response
+
+    async def call_tool(
+        self,
+        provider,
+        agent: Any,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute a tool call through the cache.
+
+        Args:
+            provider: BaseProvider instance
+            agent: Agent instance
+            tool_name: Name of tool to call
+            arguments: Tool arguments
+
+        Returns:
+            Tool result
+        """
+        key = cache_key(agent_namespace(agent), arguments, 0.0, tools=[tool_name])
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        result = await provider.call_tool(agent, tool_name, arguments)
+
+        # Only successful results are worth replaying; providers report
+        # failures (timeouts, rate limits) as {"success": False, "error": ...}
+        if isinstance(result, dict) and result.get("success") and "error" not in result:
+            await self.backend.set(key, result, self.ttl)
+        return result
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+# Global exact-match cache instance
+_global_llm_cache: Optional[LLMCache] = None
+
+
+def get_global_llm_cache() -> LLMCache:
+    """
+    Get or create global LLM cache instance
+
+    Returns:
+        Global LLMCache instance
+    """
+    global _global_llm_cache
+    if _global_llm_cache is None:
+        _global_llm_cache = LLMCache()
+    return _global_llm_cache
@@ -7,9 +7,19 @@ managing the research loop, and delegating to specialized agents.
 Reference: Lines 344-380 in agentic_search_system_complete.md
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 import asyncio
 
+from utils import json_utils
+from utils.logging_config import get_logger
+from .context_editor import ContextEditorAgent
+from .findings import Finding, FindingsIndex
+from .llm_cache import semantic_cached, get_global_angle_template_cache
+from .search_agent import SearchAgent
+from .synthesis_agent import SynthesisAgent
+from .verification_agent import VerificationAgent
+
 
 ORCHESTRATOR_SYSTEM_PROMPT = """You are a research orchestrator managing a team of specialized search agents.
 
@@ -54,25 +64,71 @@ Remember: You coordinate and delegate. Specialized agents do the work.
 """
 
 
+logger = get_logger("orchestrator")
+
+
+FALLBACK_ANGLE_SUFFIXES = (
+    "Overview and fundamentals",
+    "Current state and trends",
+    "Technical details and implementation",
+    "Applications and use cases",
+    "Future outlook and predictions",
+)
+
+
+@lru_cache(maxsize=1024)
+def _build_fallback_angles(query: str, num_angles: int) -> Tuple[str, ...]:
+    """
+    Build generic research angles for a query (memoized).
+
+    Args:
+        query: Research query
+        num_angles: Number of angles needed
+
+    Returns:
+        Tuple of fallback angles
+    """
+    return tuple(f"{query} - {suffix}" for suffix in FALLBACK_ANGLE_SUFFIXES[:num_angles])
+
+
+# Search agents started for the next iteration while verification runs
+PREFETCH_SEARCH_AGENTS = 2
+
+# Confidence gain per iteration that justifies full-size iterations; smaller
+# gains scale the next iteration's angles and searches down proportionally
+MARGINAL_GAIN_REFERENCE = 0.1
+MIN_ANGLES_PER_ITERATION = 2
+MIN_SEARCHES_PER_ANGLE = 2
+
+
 class OrchestratorAgent:
     """
     Main coordination agent that manages the entire research workflow.
 
     This agent uses tool calls only and delegates all heavy work to
     specialized agents. It uses a big model for strategic reasoning.
+
+    The CLI runs it on uvloop when installed; applications embedding the
+    orchestrator in their own event loop choose the loop themselves.
     """
 
-    def __init__(self, provider):
+    def __init__(self, provider, max_parallel: int = 8):
         """
         Initialize orchestrator agent.
 
         Args:
             provider: BaseProvider instance
+            max_parallel: Maximum in-flight search agent provider calls
         """
         self.provider = provider
+        self.max_parallel = max_parallel
+        self._semaphore = asyncio.Semaphore(max_parallel)
         self.agent = None
         self.search_agents = []
         self.current_iteration = 0
+        self.context_editor = None
+        self.findings_digest = ""
+        self.findings_index = FindingsIndex()
 
     async def initialize(self):
         """Create the underlying agent instance."""
@@ -93,7 +149,13 @@ class OrchestratorAgent:
         query: str,
         max_iterations: int = 5,
         confidence_threshold: float = 0.85,
-        num_angles: int = 5
+        num_angles: int = 5,
+        num_searches: int = 5,
+        early_stopping: bool = True,
+        min_delta: float = 0.02,
+        patience: int = 1,
+        fuse_angle_generation: bool = True,
+        on_report_chunk: Optional[Callable[[str], Any]] = None
     ) -> Dict[str, Any]:
         """
         Execute complete research workflow.
@@ -103,6 +165,17 @@ class OrchestratorAgent:
             max_iterations: Maximum research iterations (default 5)
             confidence_threshold: Minimum confidence to complete (default 0.85)
             num_angles: Number of research angles per iteration (default 5)
+            num_searches: Number of searches per angle (default 5)
+            early_stopping: Stop when confidence plateaus (default True)
+            min_delta: Minimum confidence gain counted as improvement (default 0.02)
+            patience: Iterations without improvement before stopping (default 1)
+            fuse_angle_generation: Take the next iteration's angles from the
+                verification call instead of a separate angle-generation call;
+                when False, the next iteration's angles and first searches are
+                prefetched during verification instead (default True)
+            on_report_chunk: Called with each chunk of the final report as it
+                is generated, e.g. to write it out while synthesis runs
+                (optional)
 
         Returns:
             Complete research results with report
@@ -110,62 +183,187 @@ class OrchestratorAgent:
         if not self.agent:
             await self.initialize()
 
-        print(f"\nStarting research on: {query}")
-        print(f"Max iterations: {max_iterations}, Confidence threshold: {confidence_threshold}")
+        logger.info("Starting research on: %s", query)
+        logger.info(
+            "Max iterations: %d, Confidence threshold: %s",
+            max_iterations, confidence_threshold
+        )
 
         all_findings = []
+        optimized_findings = None
+        verification = None
+        assessed_verification = None  # Latest verification scored by the model
+        prev_confidence = None
+        no_improve_count = 0
         iteration = 0
+        self.findings_digest = ""
+        self.findings_index = FindingsIndex()
 
-        while iteration < max_iterations:
-            self.current_iteration = iteration
-            print(f"\n--- Iteration {iteration + 1}/{max_iterations} ---")
-
-            # Generate research angles
-            angles = await self._generate_research_angles(
-                query,
-                num_angles,
-                existing_findings=all_findings
-            )
-
-            # Spawn and execute search agents
-            new_findings = await self._spawn_and_execute_search_agents(
-                query,
-                angles
-            )
-
-            all_findings.extend(new_findings)
+        prefetch = None
+        next_angles = None
 
-            # Verify sufficiency
-            verification = await self._verify_sufficiency(
-                query,
-                all_findings,
-                confidence_threshold
-            )
+        # Per-iteration workload, scaled down as confidence gains shrink
+        iteration_angles = num_angles
+        iteration_searches = num_searches
 
-            print(f"\nVerification: Confidence = {verification.confidence:.2f}")
-
-            # Check if research is sufficient
-            if verification.decision == "complete":
-                print("\nResearch complete! Generating final report...")
-                break
-
-            # Continue research
-            print(f"\nConfidence below threshold. Identified gaps:")
-            for gap in verification.gaps:
-                print(f"  - {gap}")
-
-            iteration += 1
-
-        # Optimize context before synthesis
-        print("\nOptimizing context...")
-        # Context optimization would happen here via ContextEditorAgent
+        try:
+            while iteration < max_iterations:
+                self.current_iteration = iteration
+                logger.info("--- Iteration %d/%d ---", iteration + 1, max_iterations)
+
+                new_findings = []
+                if prefetch is not None:
+                    # Angles and first searches were prefetched during verification
+                    angles, new_findings = await self._collect_prefetch(prefetch)
+                    prefetch = None
+                else:
+                    # Angles recommended by the previous verification, if any
+                    angles, next_angles = next_angles, None
+
+                if angles is None:
+                    # Generate research angles
+                    angles = await self._generate_research_angles(
+                        query,
+                        iteration_angles,
+                        existing_findings=all_findings
+                    )
+                angles = angles[:iteration_angles]
+
+                # Spawn and execute search agents for angles not yet searched
+                searched = {f["angle"] for f in new_findings}
+                remaining = [angle for angle in angles if angle not in searched]
+                if remaining:
+                    new_findings.extend(await self._spawn_and_execute_search_agents(
+                        query,
+                        remaining,
+                        num_searches=iteration_searches
+                    ))
+
+                all_findings.extend(new_findings)
+                new_index = FindingsIndex.from_findings(new_findings)
+                self.findings_index.merge(new_index)
+
+                # Speculatively start the next iteration's searches; cancelled
+                # if verification ends the research
+                if not fuse_angle_generation and iteration + 1 < max_iterations:
+                    prefetch = asyncio.create_task(
+                        self._prefetch_gap_searches(
+                            query,
+                            iteration_angles,
+                            list(all_findings),
+                            num_searches=iteration_searches
+                        )
+                    )
+
+                # Verify the new findings against the digest of earlier ones while
+                # speculatively optimizing context and folding them into the
+                # digest; the optimized findings are superseded if another
+                # iteration runs
+                verification, optimized_findings, findings_digest = await asyncio.gather(
+                    self._verify_sufficiency(
+                        query,
+                        new_findings,
+                        confidence_threshold,
+                        findings_digest=self.findings_digest,
+                        num_angles=num_angles if fuse_angle_generation else None,
+                        findings_index=new_index
+                    ),
+                    self._optimize_findings(all_findings),
+                    self._merge_digest(self.findings_digest, new_findings)
+                )
+                self.findings_digest = findings_digest
+
+                logger.info("Verification: Confidence = %.2f", verification.confidence)
+
+                # Check if research is sufficient
+                if verification.decision == "complete":
+                    logger.info("Research complete! Generating final report...")
+                    break
+
+                if verification.is_quick_check:
+                    # Placeholder scores for thin findings: not a confidence
+                    # reading, so leave the plateau and scaling state alone
+                    logger.info("Quick check failed: %s", verification.reasoning)
+                else:
+                    assessed_verification = verification
+
+                # Stop once further iterations stop paying for themselves
+                if (
+                    early_stopping
+                    and prev_confidence is not None
+                    and not verification.is_quick_check
+                ):
+                    if verification.confidence - prev_confidence < min_delta:
+                        no_improve_count += 1
+                    else:
+                        no_improve_count = 0
+
+                    if no_improve_count >= patience:
+                        logger.info(
+                            "Confidence plateaued (%.2f -> %.2f). Generating final report...",
+                            prev_confidence, verification.confidence
+                        )
+                        break
+
+                # Scale the next iteration's work by this iteration's gain
+                if prev_confidence is not None and not verification.is_quick_check:
+                    scale = min(
+                        1.0,
+                        max(verification.confidence - prev_confidence, 0.01)
+                        / MARGINAL_GAIN_REFERENCE
+                    )
+                    iteration_angles = min(
+                        num_angles,
+                        max(MIN_ANGLES_PER_ITERATION, int(num_angles * scale))
+                    )
+                    iteration_searches = min(
+                        num_searches,
+                        max(MIN_SEARCHES_PER_ANGLE, int(num_searches * scale))
+                    )
+
+                if not verification.is_quick_check:
+                    prev_confidence = verification.confidence
+
+                if fuse_angle_generation:
+                    next_angles = self._select_recommended_angles(
+                        verification,
+                        num_angles,
+                        all_findings
+                    )
+
+                # Continue research
+                logger.info(
+                    "Confidence below threshold. Identified gaps:%s",
+                    "".join(f"\n  - {gap}" for gap in verification.gaps)
+                )
+
+                iteration += 1
+
+        finally:
+            # Discard prefetched searches the research no longer needs
+            if prefetch is not None:
+                prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+        # Optimize context before synthesis (normally done alongside verification)
+        if optimized_findings is None:
+            logger.info("Optimizing context...")
+            optimized_findings = await self._optimize_findings(all_findings)
+
+        # Report the model's latest assessment rather than a quick-check placeholder
+        if verification is not None and verification.is_quick_check and assessed_verification:
+            verification = assessed_verification
 
         # Generate final report
-        print("\nGenerating final report...")
-        report = await self._generate_final_report(
+        logger.info("Generating final report...")
+        # The footer reports the research performed, which the running index
+        # tracks even when optimization condensed the findings
+        report, executive_summary = await self._generate_final_report(
             query,
-            all_findings,
-            verification if 'verification' in locals() else None
+            optimized_findings,
+            verification,
+            findings_index=self.findings_index,
+            on_report_chunk=on_report_chunk
         )
 
         return {
@@ -173,21 +371,103 @@ class OrchestratorAgent:
             "iterations": iteration + 1,
             "total_findings": len(all_findings),
             "report": report,
-            "verification": verification if 'verification' in locals() else None,
+            "executive_summary": executive_summary,
+            "verification": verification,
             "metadata": {
-                "total_searches": sum(
-                    len(f.get("searches", []))
-                    for f in all_findings
-                ),
+                "total_searches": self.findings_index.total_searches,
                 "angles_researched": len(all_findings)
             }
         }
 
+    def _select_recommended_angles(
+        self,
+        verification,
+        num_angles: int,
+        findings: List[Finding]
+    ) -> Optional[List[str]]:
+        """
+        Pick the next iteration's angles from a verification result.
+
+        Args:
+            verification: VerificationResult with recommended_angles
+            num_angles: Maximum number of angles
+            findings: All findings so far (their angles are skipped)
+
+        Returns:
+            List of new angles, or None if the verifier recommended none
+        """
+        seen = {str(f.get("angle", "")).casefold() for f in findings}
+        angles = []
+        for angle in verification.recommended_angles or ():
+            if not isinstance(angle, str) or not angle.strip():
+                continue
+            key = angle.casefold()
+            if key not in seen:
+                seen.add(key)
+                angles.append(angle)
+
+        return angles[:num_angles] or None
+
+    async def _prefetch_gap_searches(
+        self,
+        query: str,
+        num_angles: int,
+        findings: List[Finding],
+        num_searches: int = 5
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Generate the next iteration's angles and search the first few of them.
+
+        Runs while the current iteration is being verified. Angle generation
+        depends only on the query and the findings so far, so these are the
+        angles the next iteration would generate.
+
+        Args:
+            query: Original research query
+            num_angles: Number of angles per iteration
+            findings: All findings so far
+            num_searches: Number of searches per prefetched angle
+
+        Returns:
+            Tuple of (angles, findings for the prefetched angles)
+        """
+        angles = await self._generate_research_angles(
+            query,
+            num_angles,
+            existing_findings=findings
+        )
+        prefetched = await self._spawn_and_execute_search_agents(
+            query,
+            angles[:PREFETCH_SEARCH_AGENTS],
+            num_searches=num_searches
+        )
+        return angles, prefetched
+
+    async def _collect_prefetch(
+        self,
+        prefetch: "asyncio.Task"
+    ) -> Tuple[Optional[List[str]], List[Dict[str, Any]]]:
+        """
+        Await a prefetch task started during the previous verification.
+
+        Args:
+            prefetch: Task running _prefetch_gap_searches
+
+        Returns:
+            Tuple of (angles, prefetched findings); (None, []) if it failed
+        """
+        try:
+            angles, prefetched = await prefetch
+            return angles, list(prefetched)
+        except Exception as e:
+            logger.warning("Search prefetch failed: %s", e)
+            return None, []
+
     async def _generate_research_angles(
         self,
         query: str,
         num_angles: int,
-        existing_findings: List[Dict[str, Any]] = None
+        existing_findings: List[Finding] = None
     ) -> List[str]:
         """
         Generate distinct research angles for the query.
@@ -205,6 +485,12 @@ class OrchestratorAgent:
         if existing_findings:
             existing_angles = [f.get("angle", "") for f in existing_findings]
 
+        # Reuse the angle plan of an earlier query on the same topic
+        template_cache = get_global_angle_template_cache()
+        cached_angles = template_cache.get(query, num_angles, existing_angles)
+        if cached_angles is not None:
+            return cached_angles
+
         existing_context = ""
         if existing_angles:
             existing_context = f"""
@@ -238,27 +524,55 @@ Examples of good angles:
 - "Real-world applications and case studies"
 """
 
+        # Near-identical queries with the same prior angles reuse a response
+        semantic_key = "\n".join([str(num_angles), query, *existing_angles])
+
         try:
-            response = await self.provider.send_message(
-                self.agent,
+            response = await self._send_cached(
                 prompt,
-                temperature=0.3
+                0.3,
+                semantic_key=semantic_key
             )
 
-            # Parse JSON response
-            import json
-            angles = json.loads(response)
+            # Parse JSON response (tolerates fences and surrounding prose)
+            angles = json_utils.extract_json(response, "[")
 
             if isinstance(angles, list):
-                return angles[:num_angles]
+                angles = angles[:num_angles]
+                template_cache.set(query, [str(angle) for angle in angles])
+                return angles
             else:
-                print(f"Unexpected response format: {response}")
+                logger.warning("Unexpected response format: %s", response)
                 return self._fallback_angles(query, num_angles)
 
         except Exception as e:
-            print(f"Error generating angles: {e}")
+            logger.warning("Error generating angles: %s", e)
             return self._fallback_angles(query, num_angles)
 
+    @semantic_cached(threshold=0.92, ttl=3600)
+    async def _send_cached(
+        self,
+        prompt: str,
+        temperature: float,
+        semantic_key: Optional[str] = None
+    ) -> str:
+        """
+        Send a prompt to the orchestrator agent through the semantic cache.
+
+        Args:
+            prompt: Prompt text
+            temperature: Sampling temperature
+            semantic_key: Text compared for near-duplicate cache hits
+
+        Returns:
+            Model response
+        """
+        return await self.provider.send_message(
+            self.agent,
+            prompt,
+            temperature=temperature
+        )
+
     def _fallback_angles(self, query: str, num_angles: int) -> List[str]:
         """
         Generate fallback angles if automated generation fails.
@@ -270,100 +584,151 @@ Examples of good angles:
         Returns:
             List of fallback angles
         """
-        fallback = [
-            f"{query} - Overview and fundamentals",
-            f"{query} - Current state and trends",
-            f"{query} - Technical details and implementation",
-            f"{query} - Applications and use cases",
-            f"{query} - Future outlook and predictions"
-        ]
-        return fallback[:num_angles]
+        return list(_build_fallback_angles(query, num_angles))
 
     async def _spawn_and_execute_search_agents(
         self,
         query: str,
-        angles: List[str]
-    ) -> List[Dict[str, Any]]:
+        angles: List[str],
+        num_searches: int = 5
+    ) -> List[Finding]:
         """
         Spawn and execute search agents in parallel.
 
         Args:
             query: Original research query
             angles: List of research angles
+            num_searches: Number of searches per agent
 
         Returns:
             List of findings from all agents
         """
-        from .search_agent import SearchAgent
-
-        print(f"\nSpawning {len(angles)} search agents...")
+        logger.info("Spawning %d search agents...", len(angles))
 
-        # Create search agents
+        # Create search agents sharing one provider-call limit
         agents = [
-            SearchAgent(self.provider, angle, query)
+            SearchAgent(self.provider, angle, query, semaphore=self._semaphore)
             for angle in angles
         ]
 
-        # Execute in parallel
-        tasks = [agent.execute_searches() for agent in agents]
-
-        try:
-            findings = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter out exceptions
-            valid_findings = []
-            for i, finding in enumerate(findings):
-                if isinstance(finding, Exception):
-                    print(f"Agent {i+1} failed: {finding}")
-                else:
-                    valid_findings.append({
-                        "angle": angles[i],
-                        "searches": finding.searches if hasattr(finding, 'searches') else [],
-                        "summary": finding.summary if hasattr(finding, 'summary') else "",
-                        "total_tokens": finding.total_tokens if hasattr(finding, 'total_tokens') else 0
-                    })
+        async def run_agent(agent):
+            # Agent errors are reported per angle; only cancellation and
+            # other BaseExceptions tear down the whole group
+            try:
+                return await agent.execute_searches(num_searches)
+            except Exception as e:
+                return e
+
+        # Execute in parallel; cancellation propagates to every agent
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_agent(agent)) for agent in agents]
+
+        # Filter out exceptions
+        valid_findings = []
+        for i, task in enumerate(tasks):
+            finding = task.result()
+            if isinstance(finding, Exception):
+                logger.warning("Agent %d failed: %s", i + 1, finding)
+            else:
+                valid_findings.append(Finding(
+                    angle=angles[i],
+                    searches=finding.searches,
+                    summary=finding.summary,
+                    total_tokens=finding.total_tokens
+                ))
 
-            print(f"Completed {len(valid_findings)}/{len(angles)} agents successfully")
-            return valid_findings
-
-        except Exception as e:
-            print(f"Error in parallel execution: {e}")
-            return []
+        logger.info("Completed %d/%d agents successfully", len(valid_findings), len(angles))
+        return valid_findings
 
     async def _verify_sufficiency(
         self,
         query: str,
-        findings: List[Dict[str, Any]],
-        confidence_threshold: float
+        findings: List[Finding],
+        confidence_threshold: float,
+        findings_digest: Optional[str] = None,
+        num_angles: Optional[int] = None,
+        findings_index: Optional[FindingsIndex] = None
     ):
         """
         Verify if research findings are sufficient.
 
         Args:
             query: Original query
-            findings: All findings so far
+            findings: New findings (all findings if no digest is given)
             confidence_threshold: Threshold for completion
+            findings_digest: Digest of findings from earlier iterations
+            num_angles: Number of next-iteration angles to request, if any
+            findings_index: Precomputed metadata for findings (optional)
 
         Returns:
             VerificationResult
         """
-        from .verification_agent import VerificationAgent
-
         verifier = VerificationAgent(self.provider)
         result = await verifier.verify_sufficiency(
             query,
             findings,
-            confidence_threshold
+            confidence_threshold,
+            findings_digest=findings_digest,
+            num_angles=num_angles,
+            findings_index=findings_index
         )
 
         return result
 
+    def _get_context_editor(self):
+        """Return the shared ContextEditorAgent, creating it on first use."""
+        if self.context_editor is None:
+            self.context_editor = ContextEditorAgent(self.provider)
+        return self.context_editor
+
+    async def _merge_digest(
+        self,
+        prev_digest: str,
+        new_findings: List[Finding]
+    ) -> str:
+        """
+        Fold new findings into the rolling findings digest.
+
+        Args:
+            prev_digest: Digest of earlier findings
+            new_findings: Findings from the current iteration
+
+        Returns:
+            Updated digest (prev_digest if merging fails)
+        """
+        try:
+            return await self._get_context_editor().merge(prev_digest, new_findings)
+        except Exception as e:
+            logger.warning("Findings digest update failed: %s", e)
+            return prev_digest
+
+    async def _optimize_findings(
+        self,
+        findings: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Optimize findings for the context window via ContextEditorAgent.
+
+        Args:
+            findings: All findings so far
+
+        Returns:
+            Optimized findings (the original list if optimization fails)
+        """
+        try:
+            return await self._get_context_editor().optimize_context(findings)
+        except Exception as e:
+            logger.warning("Context optimization failed: %s", e)
+            return findings
+
     async def _generate_final_report(
         self,
         query: str,
         findings: List[Dict[str, Any]],
-        verification = None
-    ) -> str:
+        verification = None,
+        findings_index: Optional[FindingsIndex] = None,
+        on_report_chunk: Optional[Callable[[str], Any]] = None
+    ) -> Tuple[str, str]:
         """
         Generate final research report.
 
@@ -371,12 +736,13 @@ Examples of good angles:
             query: Original query
             findings: All research findings
             verification: Verification result
+            findings_index: Precomputed metadata for findings (optional)
+            on_report_chunk: Called with each report chunk as it is
+                generated; the report is streamed when given (optional)
 
         Returns:
-            Markdown-formatted report
+            Tuple of (markdown-formatted report, executive summary)
         """
-        from .synthesis_agent import SynthesisAgent
-
         synthesizer = SynthesisAgent(self.provider)
 
         verification_dict = None
@@ -384,18 +750,22 @@ Examples of good angles:
             verification_dict = {
                 "confidence": verification.confidence,
                 "strengths": verification.strengths,
-                "gaps": verification.gaps
+                "gaps": verification.gaps,
+                "formatted": verification.format_assessment()
             }
 
-        report = await synthesizer.synthesize_report(
+        # The executive summary is written from the findings while the
+        # report is generated
+        return await synthesizer.synthesize_report_with_summary(
             query,
             findings,
-            verification_dict
+            verification_dict,
+            findings_index=findings_index,
+            on_report_chunk=on_report_chunk
         )
 
-        return report
-
     async def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources, including the provider's pooled connections."""
         self.search_agents.clear()
         self.agent = None
+        await self.provider.aclose()
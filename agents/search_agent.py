@@ -8,7 +8,17 @@ Reference: Lines 384-435 in agentic_search_system_complete.md
 """
 
 from typing import Dict, Any, List, Optional
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
+import sys
+
+from utils.logging_config import get_logger
+from .llm_cache import semantic_cached, get_global_llm_cache
+
+
+logger = get_logger("search_agent")
 
 
 # System prompt template from reference document
@@ -63,8 +73,42 @@ OUTPUT FORMAT:
 Remember: Keep summaries concise! The orchestrator needs compressed information.
 """
 
+# Static halves of the system prompt around the angle placeholder, split once
+# so each agent's prompt is a single concatenation
+_PROMPT_PREFIX, _, _PROMPT_SUFFIX = SEARCH_AGENT_SYSTEM_PROMPT.partition("{your_assigned_angle}")
+_PROMPT_PREFIX = sys.intern(_PROMPT_PREFIX)
+_PROMPT_SUFFIX = sys.intern(_PROMPT_SUFFIX)
+
+
+# Query suffix per search iteration; other iterations use the bare query
+SEARCH_QUERY_SUFFIXES = (
+    " overview",
+    " latest developments 2025",
+    " research papers",
+    " industry applications",
+    " future trends",
+)
+
+
+@lru_cache(maxsize=1024)
+def _build_search_query(original_query: str, angle: str, iteration: int) -> str:
+    """
+    Build the search query for an angle and iteration (memoized).
+
+    Args:
+        original_query: Original research query
+        angle: Research angle
+        iteration: Search iteration number
 
-@dataclass
+    Returns:
+        Search query string
+    """
+    if 0 <= iteration < len(SEARCH_QUERY_SUFFIXES):
+        return f"{original_query} {angle}{SEARCH_QUERY_SUFFIXES[iteration]}"
+    return f"{original_query} {angle}"
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Result from a single search."""
     query: str
@@ -76,7 +120,7 @@ class SearchResult:
     compressed_length: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AngleFindings:
     """Findings for a specific research angle."""
     angle: str
@@ -93,7 +137,13 @@ class SearchAgent:
     extraction. It uses a small model (Haiku/GPT-5-mini/etc) for cost efficiency.
     """
 
-    def __init__(self, provider, angle: str, original_query: str):
+    def __init__(
+        self,
+        provider,
+        angle: str,
+        original_query: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """
         Initialize search agent.
 
@@ -101,21 +151,24 @@ class SearchAgent:
             provider: BaseProvider instance
             angle: Specific research angle to focus on
             original_query: Original research query
+            semaphore: Shared limit on in-flight provider calls (optional)
         """
         self.provider = provider
         self.angle = angle
         self.original_query = original_query
         self.agent = None
         self.searches: List[SearchResult] = []
+        self._semaphore = semaphore
+
+    def _provider_slot(self):
+        """Context manager holding a shared provider-call slot, if configured."""
+        return self._semaphore if self._semaphore is not None else nullcontext()
 
     async def initialize(self):
         """Create the underlying agent instance."""
-        system_prompt = SEARCH_AGENT_SYSTEM_PROMPT.replace(
-            "{your_assigned_angle}",
-            self.angle
-        )
+        system_prompt = f"{_PROMPT_PREFIX}{self.angle}{_PROMPT_SUFFIX}"
 
-        self.agent = await self.provider.create_agent(
+        self.agent = await self.provider.get_pooled_agent(
             model_type="small",
             system_prompt=system_prompt,
             tools=[
@@ -144,16 +197,23 @@ class SearchAgent:
         # Provider rotation for diversity
         providers = ["tavily", "exa", "brave", "kagi", "perplexity"]
 
-        for i in range(num_searches):
-            provider = providers[i % len(providers)]
+        queries = [
+            (self._generate_search_query(i), providers[i % len(providers)])
+            for i in range(num_searches)
+        ]
 
-            # Generate search query
-            search_query = self._generate_search_query(i)
-
-            # Execute search (compression hook will be applied automatically)
-            result = await self._execute_single_search(search_query, provider)
+        # Searches are independent, so run them concurrently
+        # (compression hook will be applied automatically)
+        results = await asyncio.gather(
+            *(self._execute_single_search(q, p) for q, p in queries),
+            return_exceptions=True
+        )
 
-            if result:
+        # Keep successful results in query order
+        for (search_query, provider), result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.warning("Error in search for '%s' with %s: %s", search_query, provider, result)
+            elif result:
                 self.searches.append(result)
 
         # Generate angle summary
@@ -178,14 +238,7 @@ class SearchAgent:
         Returns:
             Search query string
         """
-        query_templates = {
-            0: f"{self.original_query} {self.angle} overview",
-            1: f"{self.original_query} {self.angle} latest developments 2025",
-            2: f"{self.original_query} {self.angle} research papers",
-            3: f"{self.original_query} {self.angle} industry applications",
-            4: f"{self.original_query} {self.angle} future trends"
-        }
-        return query_templates.get(iteration, f"{self.original_query} {self.angle}")
+        return _build_search_query(self.original_query, self.angle, iteration)
 
     async def _execute_single_search(
         self,
@@ -215,11 +268,13 @@ class SearchAgent:
             tool_name = tool_map.get(provider, "search_tavily")
 
             # Execute search via tool call
-            result = await self.provider.call_tool(
-                self.agent,
-                tool_name,
-                {"query": query}
-            )
+            async with self._provider_slot():
+                result = await get_global_llm_cache().call_tool(
+                    self.provider,
+                    self.agent,
+                    tool_name,
+                    {"query": query}
+                )
 
             # Extract compressed content
             # (compression hook should have already processed this)
@@ -227,7 +282,7 @@ class SearchAgent:
                 return SearchResult(
                     query=query,
                     provider=provider,
-                    key_points=result.get("key_points", []),
+                    key_points=result.get("key_points") or [],
                     source_url=result.get("url", ""),
                     relevance=result.get("relevance", 0.5),
                     raw_content_length=result.get("original_length", 0),
@@ -235,7 +290,7 @@ class SearchAgent:
                 )
 
         except Exception as e:
-            print(f"Error in search for '{query}' with {provider}: {e}")
+            logger.warning("Error in search for '%s' with %s: %s", query, provider, e)
             return None
 
     async def _summarize_angle(self) -> str:
@@ -269,12 +324,37 @@ Keep it concise but informative.
 """
 
         try:
-            summary = await self.provider.send_message(
-                self.agent,
+            summary = await self._send_cached(
                 prompt,
-                temperature=0.1
+                0.1,
+                semantic_key=f"{self.angle}\n{findings_text}"
             )
             return summary
         except Exception as e:
-            print(f"Error generating summary: {e}")
+            logger.warning("Error generating summary: %s", e)
             return f"Summary unavailable. Analyzed {len(self.searches)} sources on {self.angle}."
+
+    @semantic_cached(threshold=0.92, ttl=3600)
+    async def _send_cached(
+        self,
+        prompt: str,
+        temperature: float,
+        semantic_key: Optional[str] = None
+    ) -> str:
+        """
+        Send a prompt to the search agent through the semantic cache.
+
+        Args:
+            prompt: Prompt text
+            temperature: Sampling temperature
+            semantic_key: Text compared for near-duplicate cache hits
+
+        Returns:
+            Model response
+        """
+        async with self._provider_slot():
+            return await self.provider.send_message(
+                self.agent,
+                prompt,
+                temperature=temperature
+            )
@@ -5,7 +5,56 @@ This agent creates comprehensive, well-structured reports in Markdown format
 from all the compressed research findings.
 """
 
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, AsyncIterator, List, Optional, Tuple
+from string import Template
+import asyncio
+
+from utils.logging_config import get_logger
+from .findings import (
+    FindingsIndex,
+    format_findings_for_synthesis,
+    format_findings_overview,
+    format_verification_assessment,
+    truncate_at_paragraph
+)
+from .llm_cache import get_global_llm_cache
+
+
+logger = get_logger("synthesis_agent")
+
+# Approximate budget for the report excerpt sent for executive summaries
+EXECUTIVE_SUMMARY_REPORT_MAX_TOKENS = 1250
+
+# Approximate budget for the per-angle findings overview sent for executive
+# summaries written alongside the report, shared evenly between angles
+EXECUTIVE_SUMMARY_FINDINGS_MAX_TOKENS = 1250
+
+# Report prompt skeletons, compiled once; the stable prefix (query and
+# findings) is prompt-cached and the instructions follow it
+_REPORT_PREFIX_TEMPLATE = Template("""Create a comprehensive research report for this query.
+
+ORIGINAL QUERY:
+$query
+
+RESEARCH FINDINGS:
+$findings
+""")
+
+_REPORT_INSTRUCTIONS_TEMPLATE = Template("""$verification
+
+Create a well-structured report following the specified format:
+1. Executive Summary
+2. Key Findings (organized by theme)
+3. Detailed Analysis
+4. Confidence Assessment
+5. Sources and Citations
+6. Recommendations (if applicable)
+
+Use Markdown formatting. Be comprehensive but concise. Focus on synthesizing
+information across all sources rather than summarizing each source separately.
+
+Ensure the report directly answers the original query.
+""")
 
 
 SYNTHESIS_AGENT_SYSTEM_PROMPT = """You are a research report synthesis specialist.
@@ -62,6 +111,12 @@ QUALITY STANDARDS:
 - Well-organized and easy to navigate
 """
 
+EXECUTIVE_SUMMARY_SYSTEM_PROMPT = """You are a research summary specialist.
+
+Write concise, accurate executive summaries of research reports and findings.
+Use only the information provided. Output plain prose with no headings.
+"""
+
 
 class SynthesisAgent:
     """
@@ -80,20 +135,35 @@ class SynthesisAgent:
         """
         self.provider = provider
         self.agent = None
+        self.summary_agent = None
+
+        # Fixed per provider; bound once for the report footer
+        self._provider_name = provider.provider_name
+        self._big_model_name = provider.big_model_name
 
     async def initialize(self):
-        """Create the underlying agent instance."""
-        self.agent = await self.provider.create_agent(
+        """Create the underlying agent instances."""
+        self.agent = await self.provider.get_pooled_agent(
             model_type="big",
             system_prompt=SYNTHESIS_AGENT_SYSTEM_PROMPT,
-            temperature=0.3  # Balanced creativity and accuracy
+            temperature=0.3,  # Balanced creativity and accuracy
+            prompt_caching=True
+        )
+
+        # Executive summaries are a short extraction task; the small model
+        # handles them at a fraction of the latency and cost
+        self.summary_agent = await self.provider.get_pooled_agent(
+            model_type="small",
+            system_prompt=EXECUTIVE_SUMMARY_SYSTEM_PROMPT,
+            temperature=0.2
         )
 
     async def synthesize_report(
         self,
         query: str,
         findings: List[Dict[str, Any]],
-        verification_result: Dict[str, Any] = None
+        verification_result: Dict[str, Any] = None,
+        findings_index: Optional[FindingsIndex] = None
     ) -> str:
         """
         Create final research report from findings.
@@ -102,6 +172,7 @@ class SynthesisAgent:
             query: Original research query
             findings: List of research findings from all angles
             verification_result: Optional verification result to include
+            findings_index: Precomputed metadata for findings (optional)
 
         Returns:
             Markdown-formatted research report
@@ -109,54 +180,204 @@ class SynthesisAgent:
         if not self.agent:
             await self.initialize()
 
-        # Build synthesis prompt
-        findings_summary = self._format_findings_for_synthesis(findings)
-        verification_info = self._format_verification_info(verification_result)
+        try:
+            report = await self._request_report(query, findings, verification_result)
 
-        prompt = f"""Create a comprehensive research report for this query.
+            # Add metadata footer
+            report_with_metadata = self._add_metadata_footer(
+                report,
+                query,
+                findings,
+                verification_result,
+                findings_index
+            )
 
-ORIGINAL QUERY:
-{query}
+            return report_with_metadata
 
-RESEARCH FINDINGS:
-{findings_summary}
+        except Exception as e:
+            logger.exception("Synthesis error: %s", e)
+            return self._generate_fallback_report(query, findings, str(e))
+
+    async def synthesize_report_stream(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        verification_result: Dict[str, Any] = None,
+        findings_index: Optional[FindingsIndex] = None
+    ) -> AsyncIterator[str]:
+        """
+        Create the final research report, yielding it as it is generated.
 
-{verification_info}
+        Yields the same text as synthesize_report(): report chunks as the
+        model produces them, then the metadata footer. If the model call
+        fails before any chunk, the fallback report is yielded instead.
 
-Create a well-structured report following the specified format:
-1. Executive Summary
-2. Key Findings (organized by theme)
-3. Detailed Analysis
-4. Confidence Assessment
-5. Sources and Citations
-6. Recommendations (if applicable)
+        Args:
+            query: Original research query
+            findings: List of research findings from all angles
+            verification_result: Optional verification result to include
+            findings_index: Precomputed metadata for findings (optional)
 
-Use Markdown formatting. Be comprehensive but concise. Focus on synthesizing
-information across all sources rather than summarizing each source separately.
+        Yields:
+            Markdown report chunks
 
-Ensure the report directly answers the original query.
-"""
+        Raises:
+            Exception: The provider's error if the stream fails after some of
+                the report was yielded, so a truncated report never ends with
+                the footer as if complete
+        """
+        if not self.agent:
+            await self.initialize()
 
+        cache_prefix, prompt = self._build_report_prompt(query, findings, verification_result)
+
+        streamed = False
         try:
-            report = await self.provider.send_message(
+            async for chunk in self.provider.send_message_stream(
                 self.agent,
                 prompt,
-                temperature=0.3
-            )
+                temperature=0.3,
+                cache_prefix=cache_prefix
+            ):
+                streamed = True
+                yield chunk
 
-            # Add metadata footer
-            report_with_metadata = self._add_metadata_footer(
-                report,
-                query,
-                findings,
-                verification_result
+        except Exception as e:
+            logger.exception("Synthesis error: %s", e)
+            # Part of the report already reached the consumer; a fallback or
+            # footer appended now would pass a truncated report off as whole
+            if streamed:
+                raise
+            yield self._generate_fallback_report(query, findings, str(e))
+            return
+
+        yield self._add_metadata_footer(
+            "",
+            query,
+            findings,
+            verification_result,
+            findings_index
+        )
+
+    async def synthesize_report_with_summary(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        verification_result: Dict[str, Any] = None,
+        findings_index: Optional[FindingsIndex] = None,
+        on_report_chunk: Optional[Callable[[str], Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Create the final report and an executive summary concurrently.
+
+        The summary is written from the findings rather than the finished
+        report, so both model calls run at the same time and the caller waits
+        for the slower one instead of both in sequence.
+
+        Args:
+            query: Original research query
+            findings: List of research findings from all angles
+            verification_result: Optional verification result to include
+            findings_index: Precomputed metadata for findings (optional)
+            on_report_chunk: Called with each report chunk as it is
+                generated; the report is streamed when given (optional)
+
+        Returns:
+            Tuple of (markdown report, executive summary)
+        """
+        if not self.agent:
+            await self.initialize()
+
+        report, summary = await asyncio.gather(
+            self._collect_report(
+                query, findings, verification_result, findings_index, on_report_chunk
+            ),
+            self.create_findings_summary(query, findings)
+        )
+        return report, summary
+
+    async def _collect_report(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        verification_result: Optional[Dict[str, Any]],
+        findings_index: Optional[FindingsIndex],
+        on_report_chunk: Optional[Callable[[str], Any]]
+    ) -> str:
+        """
+        Create the final report, streaming it to on_report_chunk if given.
+
+        Returns:
+            Markdown report with metadata footer
+        """
+        if on_report_chunk is None:
+            return await self.synthesize_report(
+                query, findings, verification_result, findings_index=findings_index
             )
 
-            return report_with_metadata
+        chunks = []
+        async for chunk in self.synthesize_report_stream(
+            query, findings, verification_result, findings_index=findings_index
+        ):
+            on_report_chunk(chunk)
+            chunks.append(chunk)
+        return "".join(chunks)
 
-        except Exception as e:
-            print(f"Synthesis error: {e}")
-            return self._generate_fallback_report(query, findings, str(e))
+    async def _request_report(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        verification_result: Dict[str, Any] = None
+    ) -> str:
+        """
+        Send the synthesis prompt and return the raw report.
+
+        Args:
+            query: Original research query
+            findings: List of research findings from all angles
+            verification_result: Optional verification result to include
+
+        Returns:
+            Report text without metadata footer
+        """
+        cache_prefix, prompt = self._build_report_prompt(query, findings, verification_result)
+
+        return await get_global_llm_cache().send_message(
+            self.provider,
+            self.agent,
+            prompt,
+            temperature=0.3,
+            cache_prefix=cache_prefix
+        )
+
+    def _build_report_prompt(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        verification_result: Dict[str, Any] = None
+    ) -> Tuple[str, str]:
+        """
+        Build the synthesis prompt.
+
+        Args:
+            query: Original research query
+            findings: List of research findings from all angles
+            verification_result: Optional verification result to include
+
+        Returns:
+            Tuple of (prompt-cached prefix, instructions)
+        """
+        # Build synthesis prompt
+        findings_summary = self._format_findings_for_synthesis(findings)
+        verification_info = self._format_verification_info(verification_result)
+
+        cache_prefix = _REPORT_PREFIX_TEMPLATE.substitute(
+            query=query,
+            findings=findings_summary
+        )
+        prompt = _REPORT_INSTRUCTIONS_TEMPLATE.substitute(verification=verification_info)
+
+        return cache_prefix, prompt
 
     def _format_findings_for_synthesis(
         self,
@@ -171,38 +392,7 @@ Ensure the report directly answers the original query.
         Returns:
             Formatted string
         """
-        formatted = []
-
-        for i, finding in enumerate(findings, 1):
-            angle = finding.get("angle", "Unknown angle")
-            summary = finding.get("summary", "No summary available")
-            searches = finding.get("searches", [])
-            num_searches = len(searches)
-
-            # Format individual searches
-            search_details = []
-            for j, search in enumerate(searches[:3], 1):  # Limit to top 3 per angle
-                key_points = search.get("key_points", [])
-                provider = search.get("provider", "unknown")
-                relevance = search.get("relevance", 0)
-
-                search_details.append(f"""
-  Search {j} ({provider}, relevance: {relevance:.1f}):
-  {chr(10).join('  - ' + point for point in key_points[:5])}
-""")
-
-            formatted.append(f"""
-=== ANGLE {i}: {angle} ===
-Number of searches: {num_searches}
-
-Key findings:
-{chr(10).join(search_details)}
-
-Summary:
-{summary}
-""")
-
-        return "\n".join(formatted)
+        return format_findings_for_synthesis(findings)
 
     def _format_verification_info(
         self,
@@ -211,6 +401,9 @@ Summary:
         """
         Format verification information.
 
+        Reuses the "formatted" entry when the caller already rendered it
+        (see VerificationResult.format_assessment).
+
         Args:
             verification_result: Verification result dictionary
 
@@ -220,28 +413,23 @@ Summary:
         if not verification_result:
             return ""
 
-        confidence = verification_result.get("confidence", 0)
-        strengths = verification_result.get("strengths", [])
-        gaps = verification_result.get("gaps", [])
-
-        info = f"""
-VERIFICATION ASSESSMENT:
-Overall Confidence: {confidence:.2f}
+        formatted = verification_result.get("formatted")
+        if formatted:
+            return formatted
 
-Strengths:
-{chr(10).join('- ' + s for s in strengths) if strengths else '- None noted'}
-
-Identified Gaps:
-{chr(10).join('- ' + g for g in gaps) if gaps else '- None identified'}
-"""
-        return info
+        return format_verification_assessment(
+            verification_result.get("confidence", 0),
+            verification_result.get("strengths") or (),
+            verification_result.get("gaps") or ()
+        )
 
     def _add_metadata_footer(
         self,
         report: str,
         query: str,
         findings: List[Dict[str, Any]],
-        verification_result: Dict[str, Any] = None
+        verification_result: Dict[str, Any] = None,
+        findings_index: Optional[FindingsIndex] = None
     ) -> str:
         """
         Add metadata footer to report.
@@ -251,15 +439,14 @@ Identified Gaps:
             query: Original query
             findings: Findings used
             verification_result: Verification result
+            findings_index: Precomputed metadata for findings (optional)
 
         Returns:
             Report with metadata footer
         """
-        total_searches = sum(
-            len(f.get("searches", []))
-            for f in findings
-        )
-        total_angles = len(findings)
+        index = findings_index if findings_index is not None else FindingsIndex.from_findings(findings)
+        total_searches = index.total_searches
+        total_angles = len(index)
 
         confidence = "N/A"
         if verification_result:
@@ -279,8 +466,8 @@ Identified Gaps:
 - Overall confidence: {confidence}
 
 **Generated by:** Agentic Research System
-**Provider:** {self.provider.provider_name}
-**Model:** {self.provider.big_model_name}
+**Provider:** {self._provider_name}
+**Model:** {self._big_model_name}
 
 ---
 """
@@ -350,28 +537,87 @@ Identified Gaps:
         Returns:
             Executive summary (3-4 sentences)
         """
-        if not self.agent:
+        if not self.summary_agent:
             await self.initialize()
 
-        prompt = f"""Extract the executive summary from this report, or create one if not present.
+        # The report excerpt is identical across re-summary calls, so it is
+        # sent first as a prompt-cached prefix
+        excerpt = truncate_at_paragraph(full_report, EXECUTIVE_SUMMARY_REPORT_MAX_TOKENS)
+        cache_prefix = f"""REPORT:
+{excerpt}
+"""
+
+        prompt = """Extract the executive summary from the report above, or create one if not present.
 The summary should be 3-4 sentences covering:
 1. Main question addressed
 2. Key findings
 3. Overall conclusion
 
-REPORT:
-{full_report[:5000]}
+Provide only the executive summary, nothing else.
+"""
+
+        return await self._request_summary(prompt, cache_prefix)
+
+    async def create_findings_summary(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Generate an executive summary directly from research findings.
+
+        Every angle contributes one line (its summary, clipped to an even
+        share of the budget), so the summary covers all angles without
+        waiting for the report.
+
+        Args:
+            query: Original research query
+            findings: List of research findings from all angles
+
+        Returns:
+            Executive summary (3-4 sentences)
+        """
+        if not self.summary_agent:
+            await self.initialize()
+
+        overview = format_findings_overview(findings, EXECUTIVE_SUMMARY_FINDINGS_MAX_TOKENS)
+        cache_prefix = f"""QUERY:
+{query}
+
+FINDINGS BY RESEARCH ANGLE:
+{overview}
+"""
+
+        prompt = """Write an executive summary of the research findings above.
+The summary should be 3-4 sentences covering:
+1. Main question addressed
+2. Key findings across all angles
+3. Overall conclusion
 
 Provide only the executive summary, nothing else.
 """
 
+        return await self._request_summary(prompt, cache_prefix)
+
+    async def _request_summary(self, prompt: str, cache_prefix: str) -> str:
+        """
+        Send an executive summary prompt.
+
+        Args:
+            prompt: Summary instructions
+            cache_prefix: Prompt-cached material to summarize
+
+        Returns:
+            Executive summary, or a placeholder if the call failed
+        """
         try:
             summary = await self.provider.send_message(
-                self.agent,
+                self.summary_agent,
                 prompt,
-                temperature=0.2
+                temperature=0.2,
+                cache_prefix=cache_prefix
             )
             return summary.strip()
         except Exception as e:
-            print(f"Executive summary error: {e}")
+            logger.exception("Executive summary error: %s", e)
             return "Executive summary unavailable."
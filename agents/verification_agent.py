@@ -7,8 +7,22 @@ the query or if additional research is needed.
 Reference: Lines 359-388 in METAPROMPT_agentic_research_continuation.md
 """
 
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from string import Template
+
+from utils import json_utils
+from utils.logging_config import get_logger
+from .findings import (
+    Finding,
+    FindingsIndex,
+    format_findings_for_verification,
+    format_verification_assessment
+)
+from .llm_cache import get_global_llm_cache
+
+
+logger = get_logger("verification_agent")
 
 
 VERIFICATION_AGENT_SYSTEM_PROMPT = """You are a research quality control specialist.
@@ -69,7 +83,7 @@ than to deliver an incomplete answer.
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of research verification."""
     confidence: float
@@ -82,6 +96,79 @@ class VerificationResult:
     strengths: List[str]
     decision: str  # "continue" or "complete"
     reasoning: str
+    # Set on the canned result returned when findings fail the quick check;
+    # its scores are placeholders, not a model assessment
+    is_quick_check: bool = False
+    formatted: str = field(default="", repr=False, compare=False)
+
+    def format_assessment(self) -> str:
+        """Assessment block for the synthesis prompt, rendered once and reused."""
+        if not self.formatted:
+            self.formatted = format_verification_assessment(
+                self.confidence,
+                self.strengths,
+                self.gaps
+            )
+        return self.formatted
+
+
+# Below this many searches per angle, findings are too thin to be worth a
+# big-model evaluation
+MIN_SEARCHES_PER_ANGLE = 2
+
+# Verification prompt skeletons, compiled once. The stable prefix (query and
+# findings) is prompt-cached across repeated verification of the same
+# findings; the instructions follow it
+_VERIFICATION_PREFIX_TEMPLATE = Template("""Evaluate whether the research findings adequately answer this query.
+
+ORIGINAL QUERY:
+$query
+$earlier_context
+RESEARCH FINDINGS:
+$findings
+""")
+
+_EARLIER_CONTEXT_TEMPLATE = Template("""
+EARLIER RESEARCH (compressed digest of previous iterations):
+$digest
+
+The findings below are new this iteration; evaluate them together with the digest.
+""")
+
+_BATCH_PREFIX_TEMPLATE = Template("""Evaluate several alternative sets of research findings for the same query.
+
+ORIGINAL QUERY:
+$query
+""")
+
+_SCENARIO_TEMPLATE = Template("""=== SCENARIO $number ===
+$findings
+""")
+
+_BATCH_INSTRUCTIONS_TEMPLATE = Template("""$scenarios
+
+CONFIDENCE THRESHOLD: $threshold
+
+Evaluate each of the $count scenarios above independently, as if it were the
+only research available, using the criteria and output format you were given.
+
+Output a JSON array of exactly $count evaluation objects, one per scenario in
+scenario order, and nothing else.
+""")
+
+_VERIFICATION_INSTRUCTIONS_TEMPLATE = Template("""CONFIDENCE THRESHOLD: $threshold
+
+Evaluate each criterion (coverage, depth, source quality, consistency) and provide:
+1. Individual scores (0.0-1.0) for each criterion
+2. Overall confidence score (average of the four)
+3. List of gaps or missing information
+4. $angles_instruction
+5. Strengths of current research
+6. Decision: "continue" or "complete"
+7. Reasoning for your decision
+
+Output your evaluation as JSON following the specified format.
+""")
 
 
 class VerificationAgent:
@@ -104,97 +191,248 @@ class VerificationAgent:
 
     async def initialize(self):
         """Create the underlying agent instance."""
-        self.agent = await self.provider.create_agent(
+        self.agent = await self.provider.get_pooled_agent(
             model_type="big",
             system_prompt=VERIFICATION_AGENT_SYSTEM_PROMPT,
-            temperature=0.3  # Some creativity for identifying gaps
+            temperature=0.0,  # Greedy decoding: strict JSON output, reproducible
+            prompt_caching=True
         )
 
     async def verify_sufficiency(
         self,
         query: str,
-        findings: List[Dict[str, Any]],
-        confidence_threshold: float = 0.85
+        findings: List[Finding],
+        confidence_threshold: float = 0.85,
+        findings_digest: Optional[str] = None,
+        num_angles: Optional[int] = None,
+        findings_index: Optional[FindingsIndex] = None
     ) -> VerificationResult:
         """
         Verify if research findings are sufficient to answer the query.
 
         Args:
             query: Original research query
-            findings: List of research findings (AngleFindings objects)
+            findings: List of research findings (Finding dicts); only
+                the new findings when findings_digest is given
             confidence_threshold: Minimum confidence to consider complete
+            findings_digest: Pre-compressed digest of earlier findings
+            num_angles: If set, recommend exactly this many angles for the
+                next research iteration
+            findings_index: Precomputed metadata for findings (optional)
 
         Returns:
             VerificationResult with detailed evaluation
         """
+        # Cheap gate: trivially insufficient findings never reach the model
+        quick_result = self._quick_check_result(findings, findings_index)
+        if quick_result is not None:
+            return quick_result
+
         if not self.agent:
             await self.initialize()
 
         # Build verification prompt
         findings_summary = self._format_findings(findings)
 
-        prompt = f"""Evaluate whether the research findings adequately answer this query.
-
-ORIGINAL QUERY:
-{query}
-
-RESEARCH FINDINGS:
-{findings_summary}
-
-CONFIDENCE THRESHOLD: {confidence_threshold}
+        earlier_context = ""
+        if findings_digest:
+            earlier_context = _EARLIER_CONTEXT_TEMPLATE.substitute(digest=findings_digest)
 
-Evaluate each criterion (coverage, depth, source quality, consistency) and provide:
-1. Individual scores (0.0-1.0) for each criterion
-2. Overall confidence score (average of the four)
-3. List of gaps or missing information
-4. Recommended angles for additional research (if needed)
-5. Strengths of current research
-6. Decision: "continue" or "complete"
-7. Reasoning for your decision
+        if num_angles:
+            angles_instruction = (
+                f"Exactly {num_angles} recommended angles for the next research "
+                "iteration, each distinct from the angles already researched"
+            )
+        else:
+            angles_instruction = "List of recommended angles for additional research (if needed)"
 
-Output your evaluation as JSON following the specified format.
-"""
+        cache_prefix = _VERIFICATION_PREFIX_TEMPLATE.substitute(
+            query=query,
+            earlier_context=earlier_context,
+            findings=findings_summary
+        )
+        prompt = _VERIFICATION_INSTRUCTIONS_TEMPLATE.substitute(
+            threshold=confidence_threshold,
+            angles_instruction=angles_instruction
+        )
 
         try:
-            response = await self.provider.send_message(
+            response = await get_global_llm_cache().send_message(
+                self.provider,
                 self.agent,
                 prompt,
-                temperature=0.3
+                temperature=0.0,
+                cache_prefix=cache_prefix
             )
 
             # Parse verification result
             result_dict = self._parse_verification_response(response)
+            return self._result_from_dict(result_dict)
 
-            return VerificationResult(
-                confidence=result_dict.get("confidence", 0.0),
-                coverage_score=result_dict.get("coverage_score", 0.0),
-                depth_score=result_dict.get("depth_score", 0.0),
-                source_quality_score=result_dict.get("source_quality_score", 0.0),
-                consistency_score=result_dict.get("consistency_score", 0.0),
-                gaps=result_dict.get("gaps", []),
-                recommended_angles=result_dict.get("recommended_angles", []),
-                strengths=result_dict.get("strengths", []),
-                decision=result_dict.get("decision", "continue"),
-                reasoning=result_dict.get("reasoning", "")
+        except Exception as e:
+            logger.exception("Verification error: %s", e)
+            return self._error_result(e)
+
+    async def verify_sufficiency_batch(
+        self,
+        query: str,
+        findings_variants: List[List[Finding]],
+        confidence_threshold: float = 0.85
+    ) -> List[VerificationResult]:
+        """
+        Verify several candidate sets of findings for one query in one call.
+
+        The system prompt and query are sent once, followed by one labeled
+        scenario per variant, and the model returns one evaluation per
+        scenario. Variants failing the quick quality check are answered
+        locally and left out of the prompt.
+
+        Args:
+            query: Original research query
+            findings_variants: Candidate findings lists to evaluate
+            confidence_threshold: Minimum confidence to consider complete
+
+        Returns:
+            One VerificationResult per variant, in order
+        """
+        results: List[Optional[VerificationResult]] = [
+            self._quick_check_result(findings) for findings in findings_variants
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if len(pending) == 1:
+            i = pending[0]
+            results[i] = await self.verify_sufficiency(
+                query,
+                findings_variants[i],
+                confidence_threshold
+            )
+        elif pending:
+            if not self.agent:
+                await self.initialize()
+
+            scenarios = "\n".join(
+                _SCENARIO_TEMPLATE.substitute(
+                    number=n,
+                    findings=self._format_findings(findings_variants[i])
+                )
+                for n, i in enumerate(pending, 1)
+            )
+            cache_prefix = _BATCH_PREFIX_TEMPLATE.substitute(query=query)
+            prompt = _BATCH_INSTRUCTIONS_TEMPLATE.substitute(
+                scenarios=scenarios,
+                count=len(pending),
+                threshold=confidence_threshold
             )
 
-        except Exception as e:
-            print(f"Verification error: {e}")
-            # Conservative fallback: request more research
+            try:
+                response = await get_global_llm_cache().send_message(
+                    self.provider,
+                    self.agent,
+                    prompt,
+                    temperature=0.0,
+                    cache_prefix=cache_prefix
+                )
+                result_dicts = self._parse_batch_response(response, len(pending))
+                for i, result_dict in zip(pending, result_dicts):
+                    results[i] = self._result_from_dict(result_dict)
+
+            except Exception as e:
+                logger.exception("Batch verification error: %s", e)
+                for i in pending:
+                    results[i] = self._error_result(e)
+
+        return results
+
+    def _quick_check_result(
+        self,
+        findings: List[Finding],
+        findings_index: Optional[FindingsIndex] = None
+    ) -> Optional[VerificationResult]:
+        """
+        Result for findings too thin to be worth a model evaluation.
+
+        Args:
+            findings: List of findings
+            findings_index: Precomputed metadata for findings (optional)
+
+        Returns:
+            A "continue" VerificationResult, or None if the findings need a
+            full evaluation
+        """
+        quality = self.quick_quality_check(findings, findings_index)
+        if (
+            quality["total_angles"] == 0
+            or quality["total_searches"] < MIN_SEARCHES_PER_ANGLE * quality["total_angles"]
+            or not quality["has_summaries"]
+        ):
             return VerificationResult(
-                confidence=0.5,
-                coverage_score=0.5,
-                depth_score=0.5,
-                source_quality_score=0.5,
-                consistency_score=0.5,
-                gaps=["Verification failed - error in evaluation"],
-                recommended_angles=["Retry verification"],
+                confidence=0.3,
+                coverage_score=0.3,
+                depth_score=0.3,
+                source_quality_score=0.3,
+                consistency_score=0.3,
+                gaps=["insufficient search volume"],
+                recommended_angles=[],
                 strengths=[],
                 decision="continue",
-                reasoning=f"Verification error: {str(e)}"
+                reasoning=(
+                    f"Quick check: {quality['total_searches']} searches across "
+                    f"{quality['total_angles']} angles"
+                    + ("" if quality["has_summaries"] else ", some angles lack summaries")
+                ),
+                is_quick_check=True
             )
 
-    def _format_findings(self, findings: List[Dict[str, Any]]) -> str:
+        return None
+
+    def _result_from_dict(self, result_dict: Dict[str, Any]) -> VerificationResult:
+        """
+        Build a VerificationResult from a parsed evaluation.
+
+        Args:
+            result_dict: Parsed evaluation dictionary
+
+        Returns:
+            VerificationResult
+        """
+        return VerificationResult(
+            confidence=result_dict.get("confidence", 0.0),
+            coverage_score=result_dict.get("coverage_score", 0.0),
+            depth_score=result_dict.get("depth_score", 0.0),
+            source_quality_score=result_dict.get("source_quality_score", 0.0),
+            consistency_score=result_dict.get("consistency_score", 0.0),
+            gaps=result_dict.get("gaps") or [],
+            recommended_angles=result_dict.get("recommended_angles") or [],
+            strengths=result_dict.get("strengths") or [],
+            decision=result_dict.get("decision", "continue"),
+            reasoning=result_dict.get("reasoning", "")
+        )
+
+    def _error_result(self, error: Exception) -> VerificationResult:
+        """
+        Conservative fallback after a failed evaluation: request more research.
+
+        Args:
+            error: Exception raised during evaluation
+
+        Returns:
+            A "continue" VerificationResult
+        """
+        return VerificationResult(
+            confidence=0.5,
+            coverage_score=0.5,
+            depth_score=0.5,
+            source_quality_score=0.5,
+            consistency_score=0.5,
+            gaps=["Verification failed - error in evaluation"],
+            recommended_angles=[],
+            strengths=[],
+            decision="continue",
+            reasoning=f"Verification error: {str(error)}"
+        )
+
+    def _format_findings(self, findings: List[Finding]) -> str:
         """
         Format findings into readable summary for verification.
 
@@ -204,19 +442,7 @@ Output your evaluation as JSON following the specified format.
         Returns:
             Formatted string
         """
-        formatted = []
-        for i, finding in enumerate(findings, 1):
-            angle = finding.get("angle", "Unknown angle")
-            summary = finding.get("summary", "No summary available")
-            num_searches = len(finding.get("searches", []))
-
-            formatted.append(f"""
-ANGLE {i}: {angle}
-Number of searches: {num_searches}
-Summary: {summary}
-""")
-
-        return "\n".join(formatted)
+        return format_findings_for_verification(findings)
 
     def _parse_verification_response(self, response: str) -> Dict[str, Any]:
         """
@@ -228,35 +454,45 @@ Summary: {summary}
         Returns:
             Parsed dictionary
         """
-        import json
-
-        # Try to parse as-is
+        # Whole response first, then the first balanced {...} region
+        # (which also covers ```json fenced blocks)
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            result = json_utils.extract_json(response, "{")
+            if isinstance(result, dict):
+                return result
+        except ValueError:
             pass
 
-        # Try to extract JSON from markdown code blocks
-        if "```json" in response:
-            start = response.find("```json") + 7
-            end = response.find("```", start)
-            json_str = response[start:end].strip()
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-
-        # Try to extract JSON from curly braces
-        if "{" in response and "}" in response:
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            json_str = response[start:end]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-
         # If all else fails, return minimal structure
+        return self._unparsed_result_dict()
+
+    def _parse_batch_response(self, response: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Parse a batch verification response into one dictionary per scenario.
+
+        Args:
+            response: Response string containing a JSON array
+            count: Number of scenarios evaluated
+
+        Returns:
+            Exactly count parsed dictionaries; missing or malformed entries
+            are replaced by the minimal structure
+        """
+        try:
+            parsed = json_utils.extract_json(response, "[")
+        except ValueError:
+            parsed = None
+        if not isinstance(parsed, list):
+            parsed = []
+
+        return [
+            parsed[i] if i < len(parsed) and isinstance(parsed[i], dict)
+            else self._unparsed_result_dict()
+            for i in range(count)
+        ]
+
+    def _unparsed_result_dict(self) -> Dict[str, Any]:
+        """Minimal evaluation used when a response cannot be parsed."""
         return {
             "confidence": 0.5,
             "coverage_score": 0.5,
@@ -270,26 +506,29 @@ Summary: {summary}
             "reasoning": "Failed to parse verification response"
         }
 
-    async def quick_quality_check(
+    def quick_quality_check(
         self,
-        findings: List[Dict[str, Any]]
+        findings: List[Finding],
+        findings_index: Optional[FindingsIndex] = None
     ) -> Dict[str, Any]:
         """
         Perform a quick quality check without full verification.
 
         Args:
             findings: List of findings
+            findings_index: Precomputed metadata for findings (optional)
 
         Returns:
             Quick quality metrics
         """
-        total_searches = sum(len(f.get("searches", [])) for f in findings)
-        total_angles = len(findings)
+        index = findings_index if findings_index is not None else FindingsIndex.from_findings(findings)
+        total_searches = index.total_searches
+        total_angles = len(index)
         avg_searches_per_angle = total_searches / total_angles if total_angles > 0 else 0
 
         return {
             "total_searches": total_searches,
             "total_angles": total_angles,
             "avg_searches_per_angle": avg_searches_per_angle,
-            "has_summaries": all(f.get("summary") for f in findings)
+            "has_summaries": index.all_have_summaries
         }
@@ -13,7 +13,12 @@ from .cost_tracker import (
     CostTracker,
     ModelPricing,
     UsageRecord,
+    UsageHistory,
+    UsageSnapshot,
     MODEL_PRICING,
+    MODEL_ALIASES,
+    get_model_pricing,
+    rebuild_pricing_index,
     get_global_tracker
 )
 
@@ -32,7 +37,12 @@ __all__ = [
     'CostTracker',
     'ModelPricing',
     'UsageRecord',
+    'UsageHistory',
+    'UsageSnapshot',
     'MODEL_PRICING',
+    'MODEL_ALIASES',
+    'get_model_pricing',
+    'rebuild_pricing_index',
     'get_global_tracker',
 
     # Rate limiting
@@ -7,12 +7,21 @@ Alert at budget thresholds to prevent overspending.
 Thread-safe for concurrent API calls.
 """
 
+import json
+import re
 import time
-from typing import Dict, Optional, List, Tuple
+from bisect import bisect_left, bisect_right
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from threading import Lock
-from collections import defaultdict
+from threading import Lock, local
+from functools import lru_cache, partial
+
+from utils.logging_config import get_logger
+
+
+logger = get_logger("cost_tracker")
 
 
 @dataclass
@@ -22,6 +31,13 @@ class ModelPricing:
     input_cost_per_1m: float  # Cost per 1M input tokens
     output_cost_per_1m: float  # Cost per 1M output tokens
     provider: str
+    input_per_token: float = field(init=False, repr=False)
+    output_per_token: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Per-token rates, so cost calculation is two multiplies
+        self.input_per_token = self.input_cost_per_1m / 1_000_000
+        self.output_per_token = self.output_cost_per_1m / 1_000_000
 
 
 # Model pricing database (as of January 2025)
@@ -44,7 +60,106 @@ MODEL_PRICING = {
 }
 
 
-@dataclass
+# Alternative names for priced models
+MODEL_ALIASES = {
+    "claude-3-5-sonnet-latest": "claude-3-5-sonnet-20241022",
+    "claude-3-5-haiku-latest": "claude-3-5-haiku-20241022",
+    "claude-3-opus-latest": "claude-3-opus-20240229",
+}
+
+# Trailing snapshot date in Anthropic model names
+_DATE_SUFFIX_RE = re.compile(r"-\d{8}$")
+
+# Lowercased model names and aliases -> pricing, and the same keys sorted
+# for prefix lookups
+_PRICING_INDEX: Dict[str, ModelPricing] = {}
+_PRICING_KEYS: List[str] = []
+
+
+def rebuild_pricing_index():
+    """
+    Rebuild the pricing lookup index from MODEL_PRICING and MODEL_ALIASES
+
+    Call after changing either table; trackers created before that keep the
+    rates they have already resolved.
+    """
+    index = {}
+    for name, pricing in MODEL_PRICING.items():
+        key = name.lower()
+        index[key] = pricing
+        # Undated name, e.g. "claude-3-5-sonnet"
+        index.setdefault(_DATE_SUFFIX_RE.sub("", key), pricing)
+    for alias, name in MODEL_ALIASES.items():
+        index.setdefault(alias.lower(), MODEL_PRICING[name])
+
+    _PRICING_INDEX.clear()
+    _PRICING_INDEX.update(index)
+    _PRICING_KEYS[:] = sorted(index)
+    get_model_pricing.cache_clear()
+
+
+def _match_pricing_prefix(model: str) -> Optional[ModelPricing]:
+    """
+    Find pricing for a variant of a known model name
+
+    Prefers the longest known name that model starts with (e.g. a dated
+    "gpt-4o-mini-2024-07-18"), then a known name that starts with model
+    (e.g. "gpt-4"). Both use binary search over the sorted keys.
+    """
+    keys = _PRICING_KEYS
+    probe = model
+    while probe:
+        i = bisect_right(keys, probe) - 1
+        if i < 0:
+            break
+        key = keys[i]
+        if probe.startswith(key):
+            return _PRICING_INDEX[key]
+        # Any shorter key that prefixes model also prefixes this common part
+        common = 0
+        for a, b in zip(key, probe):
+            if a != b:
+                break
+            common += 1
+        probe = probe[:common]
+
+    i = bisect_left(keys, model)
+    if i < len(keys) and keys[i].startswith(model):
+        return _PRICING_INDEX[keys[i]]
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_model_pricing(model: str) -> ModelPricing:
+    """
+    Get pricing for a model, with fallback to default
+
+    Looks up the name case-insensitively among known models and aliases,
+    ignoring a routing prefix such as "anthropic/", then falls back to
+    prefix matching. Memoized, so the unknown-model warning is issued once
+    per distinct model name.
+    """
+    key = model.lower().rsplit("/", 1)[-1]
+
+    # Try exact match
+    pricing = _PRICING_INDEX.get(key)
+    if pricing is not None:
+        return pricing
+
+    # Try partial match
+    pricing = _match_pricing_prefix(key)
+    if pricing is not None:
+        return pricing
+
+    # Default to GPT-4o-mini pricing (conservative estimate)
+    print(f"⚠️ Unknown model '{model}', using default pricing")
+    return MODEL_PRICING["gpt-4o-mini"]
+
+
+rebuild_pricing_index()
+
+
+@dataclass(slots=True)
 class UsageRecord:
     """Record of a single API call"""
     timestamp: float
@@ -55,6 +170,264 @@ class UsageRecord:
     cost: float
 
 
+@dataclass(frozen=True, slots=True)
+class UsageSnapshot:
+    """Immutable point-in-time view of a tracker's totals"""
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    total_cost: float
+    models_used: int
+    providers_used: int
+
+
+# Default number of usage records kept in memory
+DEFAULT_HISTORY_LIMIT = 100_000
+
+# Clock for usage timestamps, in integer nanoseconds. The coarse monotonic
+# clock (Linux) is millisecond-precise and much cheaper to read.
+if hasattr(time, "CLOCK_MONOTONIC_COARSE"):
+    _clock_ns = partial(time.clock_gettime_ns, time.CLOCK_MONOTONIC_COARSE)
+else:
+    _clock_ns = time.monotonic_ns
+
+
+class _Interner:
+    """
+    Assigns small integer IDs to names (model and provider strings)
+
+    Lookups of known names are lock-free; the lock is only taken the first
+    time a name is seen.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def id_for(self, name: str) -> int:
+        """Get the ID for a name, assigning the next free ID on first sight"""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            with self._lock:
+                name_id = self._ids.get(name)
+                if name_id is None:
+                    name_id = len(self.names)
+                    self.names.append(name)
+                    self._ids[name] = name_id
+        return name_id
+
+
+class UsageHistory:
+    """
+    Bounded columnar history of usage records
+
+    Records are stored as parallel typed arrays (structure of arrays) with
+    interned model/provider IDs: about 40 bytes per record instead of a
+    Python object each. Once full, the oldest record is overwritten (ring
+    buffer). Iterating yields UsageRecord objects, oldest first.
+
+    Timestamps are kept as _clock_ns() readings and converted to wall-clock
+    seconds, relative to an anchor taken at creation, only when iterated.
+
+    Not thread-safe by itself; CostTracker guards it with _history_lock.
+    """
+
+    def __init__(self, limit: int, models: _Interner, providers: _Interner):
+        """
+        Initialize history
+
+        Args:
+            limit: Maximum records kept
+            models: Interner for model names
+            providers: Interner for provider names
+        """
+        self.limit = limit
+        self.models = models
+        self.providers = providers
+        self._wall_anchor = time.time()
+        self._clock_anchor_ns = _clock_ns()
+        self.clear()
+
+    def clear(self):
+        """Remove all records"""
+        self.timestamps = array("q")
+        self.input_tokens = array("q")
+        self.output_tokens = array("q")
+        self.costs = array("d")
+        self.model_ids = array("I")
+        self.provider_ids = array("I")
+        self._start = 0  # Index of the oldest record once the buffer wraps
+
+    def append(
+        self,
+        timestamp_ns: int,
+        model_id: int,
+        provider_id: int,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float
+    ) -> bool:
+        """
+        Add a record
+
+        Args:
+            timestamp_ns: _clock_ns() reading at the time of the call
+            model_id: Model ID from the models interner
+            provider_id: Provider ID from the providers interner
+
+        Returns:
+            True if the oldest record was overwritten to make room
+        """
+        if len(self.timestamps) < self.limit:
+            self.timestamps.append(timestamp_ns)
+            self.input_tokens.append(input_tokens)
+            self.output_tokens.append(output_tokens)
+            self.costs.append(cost)
+            self.model_ids.append(model_id)
+            self.provider_ids.append(provider_id)
+            return False
+
+        i = self._start
+        self.timestamps[i] = timestamp_ns
+        self.input_tokens[i] = input_tokens
+        self.output_tokens[i] = output_tokens
+        self.costs[i] = cost
+        self.model_ids[i] = model_id
+        self.provider_ids[i] = provider_id
+        self._start = (i + 1) % self.limit
+        return True
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _order(self) -> Iterator[int]:
+        """Array indices from oldest to newest record"""
+        n = len(self.timestamps)
+        return (
+            (self._start + k) % n if self._start else k
+            for k in range(n)
+        )
+
+    def __iter__(self) -> Iterator[UsageRecord]:
+        model_names = self.models.names
+        provider_names = self.providers.names
+        base = self._wall_anchor - self._clock_anchor_ns / 1e9
+        for i in self._order():
+            yield UsageRecord(
+                timestamp=base + self.timestamps[i] / 1e9,
+                model=model_names[self.model_ids[i]],
+                provider=provider_names[self.provider_ids[i]],
+                input_tokens=self.input_tokens[i],
+                output_tokens=self.output_tokens[i],
+                cost=self.costs[i]
+            )
+
+    def _ordered(self, column: array) -> list:
+        """A column's values from oldest to newest record"""
+        if not self._start:
+            return column.tolist()
+        return column[self._start:].tolist() + column[:self._start].tolist()
+
+    def columns(self) -> Dict[str, list]:
+        """
+        All records as parallel lists, oldest first
+
+        Builds one list per field rather than an object per record.
+
+        Returns:
+            Dictionary of field name -> list of values (timestamps in
+            wall-clock seconds)
+        """
+        model_names = self.models.names
+        provider_names = self.providers.names
+        base = self._wall_anchor - self._clock_anchor_ns / 1e9
+        return {
+            "timestamp": [base + ns / 1e9 for ns in self._ordered(self.timestamps)],
+            "model": [model_names[i] for i in self._ordered(self.model_ids)],
+            "provider": [provider_names[i] for i in self._ordered(self.provider_ids)],
+            "input_tokens": self._ordered(self.input_tokens),
+            "output_tokens": self._ordered(self.output_tokens),
+            "cost": self._ordered(self.costs),
+        }
+
+
+def _ensure_rows(columns: Tuple[array, ...], size: int):
+    """Pad each column with zeros up to size rows"""
+    for column in columns:
+        if len(column) < size:
+            column.extend([0] * (size - len(column)))
+
+
+# Positions in _ThreadTotals.usage
+_INPUT_TOKENS, _OUTPUT_TOKENS, _COST = range(3)
+
+
+class _ThreadTotals:
+    """
+    Running totals written only by the thread that owns them
+
+    Values only ever grow, so other threads can sum them without a lock:
+    a concurrent read sees either the old or the new value, never a torn or
+    lost update. The running totals are packed in one array of doubles
+    (input tokens, output tokens, cost); token counts stay exact up to 2**53.
+    Per-model and per-provider columns are indexed by interned ID and grow
+    as new IDs are seen.
+    """
+
+    __slots__ = (
+        "calls", "usage",
+        "model_calls", "model_input_tokens", "model_output_tokens", "model_cost",
+        "provider_calls", "provider_cost"
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.usage = array("d", (0.0, 0.0, 0.0))
+        self.model_calls = array("q")
+        self.model_input_tokens = array("q")
+        self.model_output_tokens = array("q")
+        self.model_cost = array("d")
+        self.provider_calls = array("q")
+        self.provider_cost = array("d")
+
+    def add(
+        self,
+        model_id: int,
+        provider_id: int,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float
+    ):
+        """
+        Add one call's usage (only from the owning thread)
+
+        calls is bumped last: readers key cached results on the summed call
+        counts, so a reader must never see the new count without the values.
+        """
+        usage = self.usage
+        usage[_INPUT_TOKENS] += input_tokens
+        usage[_OUTPUT_TOKENS] += output_tokens
+        usage[_COST] += cost
+
+        if model_id >= len(self.model_cost):
+            _ensure_rows(
+                (self.model_calls, self.model_input_tokens,
+                 self.model_output_tokens, self.model_cost),
+                model_id + 1
+            )
+        self.model_calls[model_id] += 1
+        self.model_input_tokens[model_id] += input_tokens
+        self.model_output_tokens[model_id] += output_tokens
+        self.model_cost[model_id] += cost
+
+        if provider_id >= len(self.provider_cost):
+            _ensure_rows((self.provider_calls, self.provider_cost), provider_id + 1)
+        self.provider_calls[provider_id] += 1
+        self.provider_cost[provider_id] += cost
+        self.calls += 1
+
+
 class CostTracker:
     """
     Track API costs in real-time
@@ -65,37 +438,75 @@ class CostTracker:
     - Thread-safe for concurrent use
     - Historical usage records
     - Cost projection and analysis
+
+    Totals and per-model/per-provider usage are accumulated per thread
+    without locking and summed on read, so concurrent add_usage() calls
+    never contend on them.
     """
 
-    def __init__(self, budget_limit: float = 10.0, alert_thresholds: Optional[List[float]] = None):
+    def __init__(
+        self,
+        budget_limit: float = 10.0,
+        alert_thresholds: Optional[List[float]] = None,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        history_enabled: bool = True
+    ):
         """
         Initialize cost tracker
 
         Args:
             budget_limit: Maximum budget in USD
             alert_thresholds: Budget percentages to alert at (default: [0.5, 0.75, 0.9])
+            history_limit: Most recent usage records kept in memory; older
+                records are dropped (use flush_usage_history to keep them)
+            history_enabled: Keep per-call usage records at all; totals and
+                breakdowns are tracked either way
         """
         self.budget_limit = budget_limit
         self.alert_thresholds = alert_thresholds or [0.5, 0.75, 0.9]
         self.alerted_thresholds = set()
 
-        # Thread-safe lock
-        self._lock = Lock()
+        # Fine-grained locks, so unrelated updates from concurrent calls do
+        # not serialize. When both are needed they are taken in this order.
+        self._totals_lock = Lock()  # _thread_totals registration, alerts
+        self._history_lock = Lock()  # usage_history
 
-        # Usage tracking
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.total_cost = 0.0
+        # Usage tracking: one _ThreadTotals per thread that has added usage.
+        # reset() swaps in a new list, which makes threads register afresh.
+        self._local = local()
+        self._thread_totals: List[_ThreadTotals] = []
 
-        # Per-model tracking
-        self.model_usage: Dict[str, Dict[str, int]] = defaultdict(lambda: {"input": 0, "output": 0})
-        self.model_costs: Dict[str, float] = defaultdict(float)
+        # Alert thresholds in ascending order, ending with the 100% mark, and
+        # a pointer to the next one not yet issued
+        self._sorted_thresholds = sorted(set(self.alert_thresholds)) + [1.0]
+        self._next_threshold_idx = 0
 
-        # Per-provider tracking
-        self.provider_costs: Dict[str, float] = defaultdict(float)
+        # Total cost at which _check_budget_alerts() next has work to do
+        self._next_alert_cost = self.budget_limit * self._sorted_thresholds[0]
+
+        # Model and provider names are interned to small integer IDs, shared
+        # with the history; per-model and per-provider usage lives in dense
+        # per-thread arrays indexed by those IDs. IDs stay valid across
+        # reset().
+        self._models = _Interner()
+        self._providers = _Interner()
+
+        # (model, provider argument) -> (model ID, provider ID, input cost
+        # per token, output cost per token), resolved once per pair
+        self._routes: Dict[Tuple[str, Optional[str]], Tuple[int, int, float, float]] = {}
 
         # Historical records
-        self.usage_history: List[UsageRecord] = []
+        self.history_enabled = history_enabled
+        self.history_limit = history_limit
+        self.usage_history = UsageHistory(history_limit, self._models, self._providers)
+
+        # Records no longer in usage_history (dropped at the limit or flushed)
+        self.released_records = 0
+
+        # Read-side results ("snapshot", "model" and "provider" breakdowns)
+        # -> (thread registry, call count, result), reused until another call
+        # is added or the tracker is reset
+        self._read_cache: Dict[str, Tuple[List[_ThreadTotals], int, Any]] = {}
 
         # Session tracking
         self.session_start = time.time()
@@ -121,85 +532,253 @@ class CostTracker:
 
         Thread-safe: Yes
         """
-        with self._lock:
-            # Get pricing info
-            pricing = self._get_model_pricing(model)
-            if provider is None:
-                provider = pricing.provider
-
-            # Calculate cost
-            cost = self._calculate_cost(input_tokens, output_tokens, pricing)
-
-            # Update totals
-            self.total_input_tokens += input_tokens
-            self.total_output_tokens += output_tokens
-            self.total_cost += cost
-
-            # Update per-model tracking
-            self.model_usage[model]["input"] += input_tokens
-            self.model_usage[model]["output"] += output_tokens
-            self.model_costs[model] += cost
-
-            # Update per-provider tracking
-            self.provider_costs[provider] += cost
-
-            # Record usage
-            record = UsageRecord(
-                timestamp=time.time(),
-                model=model,
-                provider=provider,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost=cost
-            )
-            self.usage_history.append(record)
+        route = self._routes.get((model, provider))
+        if route is None:
+            route = self._resolve_route(model, provider)
+        model_id, provider_id, input_per_token, output_per_token = route
 
-            # Check budget alerts
-            self._check_budget_alerts()
+        cost = input_tokens * input_per_token + output_tokens * output_per_token
+        self._accumulate(model_id, provider_id, input_tokens, output_tokens, cost)
+        return cost
 
-            return cost
+    def add_usage_many(
+        self,
+        batch: Iterable[Tuple[str, int, int, Optional[str]]]
+    ) -> List[float]:
+        """
+        Track token usage for several API calls at once
 
-    def _get_model_pricing(self, model: str) -> ModelPricing:
-        """Get pricing for a model, with fallback to default"""
-        # Try exact match
-        if model in MODEL_PRICING:
-            return MODEL_PRICING[model]
+        Equivalent to calling add_usage() for each entry, but budget alerts
+        are checked once and the history lock is taken once for the batch.
 
-        # Try partial match
-        for known_model, pricing in MODEL_PRICING.items():
-            if known_model in model or model in known_model:
-                return pricing
+        Args:
+            batch: (model, input_tokens, output_tokens, provider) per call;
+                provider may be None or omitted
 
-        # Default to GPT-4o-mini pricing (conservative estimate)
-        print(f"⚠️ Unknown model '{model}', using default pricing")
-        return MODEL_PRICING["gpt-4o-mini"]
+        Returns:
+            Cost of each API call in USD, in batch order
 
-    def _calculate_cost(
+        Thread-safe: Yes
+        """
+        routes = self._routes
+        totals = self._own_totals()
+        costs = []
+        rows = []
+        for model, input_tokens, output_tokens, *rest in batch:
+            provider = rest[0] if rest else None
+            route = routes.get((model, provider))
+            if route is None:
+                route = self._resolve_route(model, provider)
+            model_id, provider_id, input_per_token, output_per_token = route
+
+            cost = input_tokens * input_per_token + output_tokens * output_per_token
+            totals.add(model_id, provider_id, input_tokens, output_tokens, cost)
+            costs.append(cost)
+            rows.append((model_id, provider_id, input_tokens, output_tokens, cost))
+
+        self._maybe_alert()
+
+        if self.history_enabled and rows:
+            timestamp_ns = _clock_ns()
+            with self._history_lock:
+                append = self.usage_history.append
+                for row in rows:
+                    if append(timestamp_ns, *row):
+                        self.released_records += 1
+
+        return costs
+
+    def _resolve_route(
         self,
+        model: str,
+        provider: Optional[str]
+    ) -> Tuple[int, int, float, float]:
+        """Look up pricing and interned IDs for a (model, provider) pair and cache them"""
+        pricing = get_model_pricing(model)
+        route = (
+            self._models.id_for(model),
+            self._providers.id_for(provider or pricing.provider),
+            pricing.input_per_token,
+            pricing.output_per_token
+        )
+        self._routes[(model, provider)] = route
+        return route
+
+    def _accumulate(
+        self,
+        model_id: int,
+        provider_id: int,
         input_tokens: int,
         output_tokens: int,
-        pricing: ModelPricing
-    ) -> float:
-        """Calculate cost for token usage"""
-        input_cost = (input_tokens * pricing.input_cost_per_1m) / 1_000_000
-        output_cost = (output_tokens * pricing.output_cost_per_1m) / 1_000_000
-        return input_cost + output_cost
+        cost: float
+    ):
+        """Add one call's usage to the totals, breakdowns and history"""
+        # Update this thread's totals and breakdowns (no lock)
+        self._own_totals().add(model_id, provider_id, input_tokens, output_tokens, cost)
+
+        self._maybe_alert()
+
+        # Record usage
+        if self.history_enabled:
+            timestamp_ns = _clock_ns()
+            with self._history_lock:
+                if self.usage_history.append(
+                    timestamp_ns, model_id, provider_id, input_tokens, output_tokens, cost
+                ):
+                    self.released_records += 1
+
+    def _maybe_alert(self):
+        """Check budget alerts, but only once a threshold may have been crossed"""
+        if self.budget_limit > 0 and self.total_cost >= self._next_alert_cost:
+            with self._totals_lock:
+                crossed, total_cost = self._check_budget_alerts()
+            self._log_budget_alerts(crossed, total_cost)
+
+    def _own_totals(self) -> _ThreadTotals:
+        """Get the calling thread's totals, registering them on first use"""
+        registry = self._thread_totals
+        totals = getattr(self._local, "totals", None)
+        if totals is None or getattr(self._local, "registry", None) is not registry:
+            totals = _ThreadTotals()
+            with self._totals_lock:
+                registry.append(totals)
+            self._local.totals = totals
+            self._local.registry = registry
+        return totals
+
+    def _merged(self, column: str) -> List:
+        """Sum one per-model or per-provider column across threads, by ID"""
+        merged = []
+        for totals in self._thread_totals:
+            values = getattr(totals, column)
+            if len(values) > len(merged):
+                merged.extend([0] * (len(values) - len(merged)))
+            for i, value in enumerate(values):
+                merged[i] += value
+        return merged
+
+    def _cached(self, kind: str) -> Tuple[Any, Tuple[List[_ThreadTotals], int]]:
+        """
+        Look up a memoized read-side result
 
-    def _check_budget_alerts(self):
-        """Check if we've crossed any budget thresholds"""
-        if self.budget_limit <= 0:
-            return
+        Returns:
+            Cached result (None if stale or missing), and the key to store a
+            freshly computed one under
+        """
+        registry = self._thread_totals
+        key = (registry, sum(totals.calls for totals in registry))
+        cached = self._read_cache.get(kind)
+        if cached is not None and cached[0] is key[0] and cached[1] == key[1]:
+            return cached[2], key
+        return None, key
+
+    @property
+    def model_input_tokens(self) -> Dict[str, int]:
+        """Input tokens per model"""
+        names = self._models.names
+        tokens = self._merged("model_input_tokens")
+        return {
+            names[i]: tokens[i]
+            for i, calls in enumerate(self._merged("model_calls")) if calls
+        }
+
+    @property
+    def model_output_tokens(self) -> Dict[str, int]:
+        """Output tokens per model"""
+        names = self._models.names
+        tokens = self._merged("model_output_tokens")
+        return {
+            names[i]: tokens[i]
+            for i, calls in enumerate(self._merged("model_calls")) if calls
+        }
+
+    @property
+    def model_costs(self) -> Dict[str, float]:
+        """Cost per model"""
+        names = self._models.names
+        costs = self._merged("model_cost")
+        return {
+            names[i]: costs[i]
+            for i, calls in enumerate(self._merged("model_calls")) if calls
+        }
+
+    @property
+    def provider_costs(self) -> Dict[str, float]:
+        """Cost per provider"""
+        names = self._providers.names
+        costs = self._merged("provider_cost")
+        return {
+            names[i]: costs[i]
+            for i, calls in enumerate(self._merged("provider_calls")) if calls
+        }
+
+    def _usage_totals(self) -> Tuple[int, int, float]:
+        """Input tokens, output tokens and cost across all threads, in one pass"""
+        input_tokens = output_tokens = cost = 0.0
+        for totals in self._thread_totals:
+            thread_input, thread_output, thread_cost = totals.usage
+            input_tokens += thread_input
+            output_tokens += thread_output
+            cost += thread_cost
+        return int(input_tokens), int(output_tokens), cost
+
+    @property
+    def total_input_tokens(self) -> int:
+        """Total input tokens across all threads"""
+        return int(sum(totals.usage[_INPUT_TOKENS] for totals in self._thread_totals))
+
+    @property
+    def total_output_tokens(self) -> int:
+        """Total output tokens across all threads"""
+        return int(sum(totals.usage[_OUTPUT_TOKENS] for totals in self._thread_totals))
+
+    @property
+    def total_cost(self) -> float:
+        """Total cost across all threads"""
+        return sum((totals.usage[_COST] for totals in self._thread_totals), 0.0)
+
+    def _check_budget_alerts(self) -> Tuple[List[float], float]:
+        """
+        Check if we've crossed any budget thresholds (caller holds _totals_lock)
 
-        budget_pct = self.total_cost / self.budget_limit
+        Alerts are only recorded here; the caller logs them with
+        _log_budget_alerts() after releasing the lock.
 
-        for threshold in self.alert_thresholds:
-            if budget_pct >= threshold and threshold not in self.alerted_thresholds:
-                self.alerted_thresholds.add(threshold)
-                print(f"⚠️ Budget Alert: {threshold*100:.0f}% of ${self.budget_limit:.2f} used (${self.total_cost:.4f})")
+        Returns:
+            Thresholds newly crossed, and the total cost they were checked at
+        """
+        crossed = []
+        if self.budget_limit <= 0:
+            return crossed, 0.0
+
+        total_cost = self.total_cost
+        thresholds = self._sorted_thresholds
+
+        # Issue every threshold crossed since the last check; the trailing
+        # 100% mark is never passed so the pointer stays on it once reached
+        while (
+            self._next_threshold_idx < len(thresholds) - 1
+            and total_cost >= self.budget_limit * thresholds[self._next_threshold_idx]
+        ):
+            threshold = thresholds[self._next_threshold_idx]
+            self.alerted_thresholds.add(threshold)
+            self._next_threshold_idx += 1
+            crossed.append(threshold)
+
+        self._next_alert_cost = self.budget_limit * thresholds[self._next_threshold_idx]
+        return crossed, total_cost
+
+    def _log_budget_alerts(self, crossed: List[float], total_cost: float):
+        """Log alerts found by _check_budget_alerts (called without locks held)"""
+        for threshold in crossed:
+            logger.warning(
+                "Budget Alert: %.0f%% of $%.2f used ($%.4f)",
+                threshold * 100, self.budget_limit, total_cost
+            )
 
         # Critical alert at 100%
-        if budget_pct >= 1.0:
-            print(f"❌ BUDGET EXCEEDED: ${self.total_cost:.4f} / ${self.budget_limit:.2f}")
+        if self.budget_limit > 0 and total_cost >= self.budget_limit:
+            logger.error("BUDGET EXCEEDED: $%.4f / $%.2f", total_cost, self.budget_limit)
 
     def get_cost(self) -> float:
         """
@@ -208,81 +787,134 @@ class CostTracker:
         Returns:
             Total cost in USD
 
-        Thread-safe: Yes
+        Thread-safe: Yes (lock-free)
+        """
+        return self.total_cost
+
+    def snapshot(self) -> UsageSnapshot:
         """
-        with self._lock:
-            return self.total_cost
+        Get an immutable view of the current totals
+
+        Built in one pass over the per-thread totals and reused until another
+        call is added, so polling readers do no work in between.
 
-    def get_summary(self) -> Dict[str, any]:
+        Returns:
+            UsageSnapshot
+
+        Thread-safe: Yes (lock-free)
+        """
+        cached, key = self._cached("snapshot")
+        if cached is not None:
+            return cached
+
+        input_tokens, output_tokens, total_cost = self._usage_totals()
+        snapshot = UsageSnapshot(
+            calls=key[1],
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_cost=total_cost,
+            models_used=sum(1 for calls in self._merged("model_calls") if calls),
+            providers_used=sum(1 for calls in self._merged("provider_calls") if calls)
+        )
+        self._read_cache["snapshot"] = (*key, snapshot)
+        return snapshot
+
+    def get_summary(self) -> Dict[str, Any]:
         """
         Get comprehensive usage summary
 
         Returns:
             Dictionary with usage statistics
 
-        Thread-safe: Yes
+        Thread-safe: Yes (lock-free)
         """
-        with self._lock:
-            elapsed_time = time.time() - self.session_start
-
-            return {
-                "total_cost": self.total_cost,
-                "budget_limit": self.budget_limit,
-                "budget_used_pct": (self.total_cost / self.budget_limit * 100) if self.budget_limit > 0 else 0,
-                "total_input_tokens": self.total_input_tokens,
-                "total_output_tokens": self.total_output_tokens,
-                "total_tokens": self.total_input_tokens + self.total_output_tokens,
-                "total_calls": len(self.usage_history),
-                "session_duration_seconds": elapsed_time,
-                "cost_per_hour": (self.total_cost / elapsed_time * 3600) if elapsed_time > 0 else 0,
-                "models_used": len(self.model_costs),
-                "providers_used": len(self.provider_costs)
-            }
-
-    def get_breakdown_by_model(self) -> List[Dict[str, any]]:
+        snapshot = self.snapshot()
+        elapsed_time = time.time() - self.session_start
+        total_cost = snapshot.total_cost
+
+        return {
+            "total_cost": total_cost,
+            "budget_limit": self.budget_limit,
+            "budget_used_pct": (total_cost / self.budget_limit * 100) if self.budget_limit > 0 else 0,
+            "total_input_tokens": snapshot.input_tokens,
+            "total_output_tokens": snapshot.output_tokens,
+            "total_tokens": snapshot.input_tokens + snapshot.output_tokens,
+            "total_calls": snapshot.calls,
+            "session_duration_seconds": elapsed_time,
+            "cost_per_hour": (total_cost / elapsed_time * 3600) if elapsed_time > 0 else 0,
+            "models_used": snapshot.models_used,
+            "providers_used": snapshot.providers_used
+        }
+
+    def get_breakdown_by_model(self) -> List[Dict[str, Any]]:
         """
         Get cost breakdown by model
 
         Returns:
             List of model usage dictionaries
 
-        Thread-safe: Yes
+        Thread-safe: Yes (lock-free)
         """
-        with self._lock:
-            breakdown = []
-            for model, usage in self.model_usage.items():
-                breakdown.append({
-                    "model": model,
-                    "input_tokens": usage["input"],
-                    "output_tokens": usage["output"],
-                    "total_tokens": usage["input"] + usage["output"],
-                    "cost": self.model_costs[model],
-                    "cost_pct": (self.model_costs[model] / self.total_cost * 100) if self.total_cost > 0 else 0
-                })
-
-            # Sort by cost descending
-            return sorted(breakdown, key=lambda x: x["cost"], reverse=True)
-
-    def get_breakdown_by_provider(self) -> List[Dict[str, any]]:
+        cached, key = self._cached("model")
+        if cached is not None:
+            return list(cached)
+
+        total_cost = self.total_cost
+        names = self._models.names
+        calls = self._merged("model_calls")
+        input_tokens = self._merged("model_input_tokens")
+        output_tokens = self._merged("model_output_tokens")
+        costs = self._merged("model_cost")
+
+        breakdown = []
+        for model_id, cost in enumerate(costs):
+            if not calls[model_id]:
+                continue
+            breakdown.append({
+                "model": names[model_id],
+                "input_tokens": input_tokens[model_id],
+                "output_tokens": output_tokens[model_id],
+                "total_tokens": input_tokens[model_id] + output_tokens[model_id],
+                "cost": cost,
+                "cost_pct": (cost / total_cost * 100) if total_cost > 0 else 0
+            })
+
+        # Sort by cost descending
+        breakdown.sort(key=lambda x: x["cost"], reverse=True)
+        self._read_cache["model"] = (*key, breakdown)
+        return list(breakdown)
+
+    def get_breakdown_by_provider(self) -> List[Dict[str, Any]]:
         """
         Get cost breakdown by provider
 
         Returns:
             List of provider cost dictionaries
 
-        Thread-safe: Yes
+        Thread-safe: Yes (lock-free)
         """
-        with self._lock:
-            breakdown = []
-            for provider, cost in self.provider_costs.items():
-                breakdown.append({
-                    "provider": provider,
-                    "cost": cost,
-                    "cost_pct": (cost / self.total_cost * 100) if self.total_cost > 0 else 0
-                })
-
-            # Sort by cost descending
-            return sorted(breakdown, key=lambda x: x["cost"], reverse=True)
+        cached, key = self._cached("provider")
+        if cached is not None:
+            return list(cached)
+
+        total_cost = self.total_cost
+        names = self._providers.names
+        calls = self._merged("provider_calls")
+
+        breakdown = []
+        for provider_id, cost in enumerate(self._merged("provider_cost")):
+            if not calls[provider_id]:
+                continue
+            breakdown.append({
+                "provider": names[provider_id],
+                "cost": cost,
+                "cost_pct": (cost / total_cost * 100) if total_cost > 0 else 0
+            })
+
+        # Sort by cost descending
+        breakdown.sort(key=lambda x: x["cost"], reverse=True)
+        self._read_cache["provider"] = (*key, breakdown)
+        return list(breakdown)
 
     def print_summary(self):
         """Print comprehensive cost summary"""
@@ -305,14 +937,14 @@ class CostTracker:
         print(f"")
 
         # Model breakdown
-        if self.model_costs:
+        if any(self._merged("model_calls")):
             print("By Model:")
             for item in self.get_breakdown_by_model():
                 print(f"  {item['model']:<30} ${item['cost']:.4f} ({item['cost_pct']:.1f}%)")
             print(f"")
 
         # Provider breakdown
-        if self.provider_costs:
+        if any(self._merged("provider_calls")):
             print("By Provider:")
             for item in self.get_breakdown_by_provider():
                 print(f"  {item['provider']:<20} ${item['cost']:.4f} ({item['cost_pct']:.1f}%)")
@@ -321,37 +953,80 @@ class CostTracker:
 
     def reset(self):
         """Reset all tracking data"""
-        with self._lock:
-            self.total_input_tokens = 0
-            self.total_output_tokens = 0
-            self.total_cost = 0.0
-            self.model_usage.clear()
-            self.model_costs.clear()
-            self.provider_costs.clear()
+        with self._totals_lock, self._history_lock:
+            self._thread_totals = []
             self.usage_history.clear()
+            self.released_records = 0
             self.alerted_thresholds.clear()
+            self._next_threshold_idx = 0
+            self._next_alert_cost = self.budget_limit * self._sorted_thresholds[0]
             self.session_start = time.time()
 
-    def export_usage_history(self) -> List[Dict[str, any]]:
+    def export_usage_history(self) -> List[Dict[str, Any]]:
         """
         Export usage history for analysis
 
+        Only the records still in memory (at most history_limit) are included.
+
         Returns:
             List of usage records as dictionaries
         """
-        with self._lock:
-            return [
-                {
-                    "timestamp": record.timestamp,
-                    "datetime": datetime.fromtimestamp(record.timestamp).isoformat(),
-                    "model": record.model,
-                    "provider": record.provider,
-                    "input_tokens": record.input_tokens,
-                    "output_tokens": record.output_tokens,
-                    "cost": record.cost
-                }
-                for record in self.usage_history
-            ]
+        with self._history_lock:
+            return [_record_to_dict(record) for record in self.usage_history]
+
+    def export_usage_columns(self) -> Dict[str, list]:
+        """
+        Export usage history as parallel lists, one per field
+
+        Much cheaper than export_usage_history() for large histories: no
+        per-record dictionaries or datetime objects are created. Only the
+        records still in memory are included.
+
+        Returns:
+            Dictionary with "timestamp", "model", "provider", "input_tokens",
+            "output_tokens" and "cost" lists, oldest record first
+        """
+        with self._history_lock:
+            return self.usage_history.columns()
+
+    def flush_usage_history(self, path: str) -> int:
+        """
+        Append in-memory usage records to a JSONL file and release them
+
+        Call periodically in long sessions to keep the full history on disk
+        instead of in memory. Totals and breakdowns are unaffected.
+
+        Args:
+            path: JSONL file to append to
+
+        Returns:
+            Number of records written
+
+        Thread-safe: Yes
+        """
+        with self._history_lock:
+            records = list(self.usage_history)
+            self.usage_history.clear()
+            self.released_records += len(records)
+
+        with open(path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(_record_to_dict(record)) + "\n")
+
+        return len(records)
+
+
+def _record_to_dict(record: UsageRecord) -> Dict[str, Any]:
+    """Convert a usage record to an export dictionary"""
+    return {
+        "timestamp": record.timestamp,
+        "datetime": datetime.fromtimestamp(record.timestamp).isoformat(),
+        "model": record.model,
+        "provider": record.provider,
+        "input_tokens": record.input_tokens,
+        "output_tokens": record.output_tokens,
+        "cost": record.cost
+    }
 
 
 # Global instance for easy use
@@ -3,13 +3,27 @@ Performance Metrics Tracking
 
 Track compression ratios, search times, token usage, and generate
 performance reports for analysis and optimization.
+
+Each metric family is recorded into a MetricStream: bounded, column-oriented
+storage with one typed array per numeric field, so recording an event is a
+handful of appends rather than an object allocation. Timestamps are stored as
+time.time_ns() integers and only turned into datetimes on export.
+
+Trackers may be shared between threads. Each track_* call updates its
+aggregates and stream inside one short critical section, and readers copy
+what they need under the same lock, so they always see whole events.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence, Tuple
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
-import statistics
+import math
+import re
+import threading
+import time
+
+from utils import json_utils
 
 
 @dataclass
@@ -32,7 +46,7 @@ class SearchMetric:
     search_time_ms: float
     num_results: int
     success: bool
-    error: Optional[str] = None
+    error: Optional[str] = None  # Error kind (see ERROR_KINDS), None on success
 
 
 @dataclass
@@ -61,6 +75,342 @@ class IterationMetric:
     gaps_identified: List[str] = field(default_factory=list)
 
 
+# Default number of events kept per metric family
+DEFAULT_METRICS_CAPACITY = 65_536
+
+# Field typecode for strings with few distinct values (providers, models,
+# operations, errors): stored as "H" IDs into a per-field name table
+INTERNED = "interned"
+
+# Most names an INTERNED field can hold; the last ID stands for all later ones
+_MAX_INTERNED_NAMES = 0xFFFF
+_OVERFLOW_NAME = "<other>"
+
+# Field typecode for flags: packed eight to a byte
+BITS = "bits"
+
+# Search error kinds, matched against the lowercased error message in order;
+# failures matching none of them are recorded as "other"
+ERROR_KINDS: Tuple[Tuple[str, "re.Pattern"], ...] = (
+    ("timeout", re.compile(r"timed? ?out|deadline exceeded")),
+    ("rate-limit", re.compile(r"rate.?limit|too many requests|\b429\b|quota")),
+    ("5xx", re.compile(r"\b5\d\d\b|server error|service unavailable|bad gateway")),
+    ("parse", re.compile(r"pars|decod|json|unexpected token|invalid response")),
+)
+OTHER_ERROR_KIND = "other"
+
+
+def error_kind(error: Optional[str]) -> str:
+    """Classify a search error message into one of ERROR_KINDS (else OTHER_ERROR_KIND)"""
+    if error:
+        message = error.lower()
+        for kind, pattern in ERROR_KINDS:
+            if pattern.search(message):
+                return kind
+    return OTHER_ERROR_KIND
+
+
+# generate_report() sections, filled with str.format_map; section fields
+# index into the stats dicts (e.g. {tokens[total_cost]})
+_REPORT_SEARCH = """
+# Performance Report
+
+## Overall Statistics
+- Total Duration: {elapsed_time:.2f}s
+- Total Cost: ${tokens[total_cost]:.4f}
+- Total Tokens: {tokens[total_tokens]:,}
+
+## Compression Performance
+- Total Compressions: {compression[total_compressions]}
+- Average Compression Ratio: {compression[avg_compression_ratio]:.2%}
+- Bytes Saved: {compression[total_bytes_saved]:,} bytes
+- Avg Compression Time: {compression[avg_compression_time_ms]:.2f}ms
+
+## Search Performance
+- Total Searches: {search[total_searches]}
+- Success Rate: {search[success_rate]:.2%}
+- Avg Search Time: {search[avg_search_time_ms]:.2f}ms
+- Median Search Time: {search[median_search_time_ms]:.2f}ms
+
+### By Provider:
+"""
+
+_REPORT_PROVIDER_LINE = "- {name}: {successful}/{total} successful ({rate:.1%}), avg {avg_time_ms:.1f}ms\n"
+
+_REPORT_TOKENS = """
+## Token Usage
+- Input Tokens: {tokens[total_input_tokens]:,}
+- Output Tokens: {tokens[total_output_tokens]:,}
+- Total Cost: ${tokens[total_cost]:.4f}
+
+### By Model Type:
+"""
+
+_REPORT_MODEL_TYPE_LINE = "- {name}: {total_tokens:,} tokens (${cost:.4f})\n"
+
+_REPORT_OPERATIONS = """
+### By Operation:
+"""
+
+_REPORT_OPERATION_LINE = "- {name}: {count} calls, {total_tokens:,} tokens (${cost:.4f})\n"
+
+_REPORT_ITERATIONS = """
+## Research Iterations
+- Total Iterations: {iterations[total_iterations]}
+- Total Searches: {iterations[total_searches]}
+- Total Agents: {iterations[total_agents]}
+- Avg Duration per Iteration: {avg_duration:.2f}s
+- Final Confidence: {final_confidence:.2f}
+- Avg Confidence Gain: {avg_confidence_gain:.2f}
+
+### Confidence Progression:
+{confidence_progression}
+"""
+
+
+def _to_datetime(timestamp_ns: int) -> datetime:
+    """Local datetime for a time.time_ns() timestamp"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+
+
+def _mean(values: Sequence[float]) -> float:
+    """Arithmetic mean of a non-empty column"""
+    return math.fsum(values) / len(values)
+
+
+def _median(values: Sequence[float]) -> float:
+    """Median of a non-empty column"""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+class _RunningStat:
+    """Count, sum, min, max and Welford mean/variance of a value stream"""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        """Fold one value into the statistics"""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self._m2 / self.count if self.count else 0.0
+
+
+def _copy_stats(value: Any) -> Any:
+    """Copy of a stats value with fresh nested dicts and lists, so callers can't alter the cache"""
+    if isinstance(value, dict):
+        return {key: _copy_stats(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_stats(item) for item in value]
+    return value
+
+
+def _add_to_group(groups: List[List[float]], key: int, *values: float):
+    """Add values to the [count, value totals...] accumulator of an interned ID"""
+    while len(groups) <= key:
+        groups.append([0] + [0] * len(values))
+    group = groups[key]
+    group[0] += 1
+    for i, value in enumerate(values, 1):
+        group[i] += value
+
+
+class _NameTable:
+    """Assigns small integer IDs to the distinct values of a string field"""
+
+    __slots__ = ("names", "ids")
+
+    def __init__(self):
+        self.names: List[Optional[str]] = []
+        self.ids: Dict[Optional[str], int] = {}
+
+    def id_for(self, name: Optional[str]) -> int:
+        """Get the ID for a name, assigning the next free ID on first sight"""
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            if name_id >= _MAX_INTERNED_NAMES - 1:
+                if name_id == _MAX_INTERNED_NAMES - 1:
+                    self.names.append(_OVERFLOW_NAME)
+                return _MAX_INTERNED_NAMES - 1
+            self.ids[name] = name_id
+            self.names.append(name)
+        return name_id
+
+
+class _BitColumn:
+    """Growable column of flags, packed one bit per event into a bytearray"""
+
+    __slots__ = ("_bits", "_length")
+
+    def __init__(self):
+        self._bits = bytearray()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, value: bool):
+        i = self._length
+        if not i & 7:
+            self._bits.append(0)
+        if value:
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self._length = i + 1
+
+    def __setitem__(self, i: int, value: bool):
+        mask = 1 << (i & 7)
+        if value:
+            self._bits[i >> 3] |= mask
+        else:
+            self._bits[i >> 3] &= ~mask & 0xFF
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._length))]
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        bits = self._bits
+        for i in range(self._length):
+            yield bool(bits[i >> 3] >> (i & 7) & 1)
+
+
+def _new_column(typecode: Optional[str]):
+    """Empty storage for a field of the given typecode"""
+    if typecode is None:
+        return []
+    if typecode == BITS:
+        return _BitColumn()
+    return array("H" if typecode == INTERNED else typecode)
+
+
+class MetricStream:
+    """
+    Bounded columnar store for one metric family
+
+    Fields are declared as (name, typecode) pairs; numeric fields are stored
+    in array.array columns of that typecode, fields with a None typecode
+    (strings, lists) in plain lists. INTERNED fields hold "H" IDs from
+    intern(); column() and rows() map them back to names. BITS fields are
+    packed into bitmaps and read back as bools. Once capacity
+    events are stored, the oldest is overwritten (ring buffer) and counted
+    in dropped.
+
+    Not thread-safe by itself; MetricsTracker serializes access.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[Tuple[str, Optional[str]]],
+        capacity: int = DEFAULT_METRICS_CAPACITY
+    ):
+        """
+        Initialize stream
+
+        Args:
+            fields: (field name, array typecode or None) per column
+            capacity: Maximum events kept
+        """
+        self.fields = tuple(name for name, _ in fields)
+        self._typecodes = tuple(typecode for _, typecode in fields)
+        self.capacity = capacity
+
+        # Bumped by every append() and clear(), so readers can tell whether
+        # the stream changed since they last looked
+        self.version = 0
+
+        # Name tables outlive clear(), so IDs stay valid
+        self._tables = {
+            name: _NameTable()
+            for name, typecode in fields if typecode == INTERNED
+        }
+        self.clear()
+
+    def clear(self):
+        """Remove all events"""
+        self._columns = tuple(_new_column(typecode) for typecode in self._typecodes)
+        self._start = 0  # Index of the oldest event once the buffer wraps
+        self.dropped = 0
+        self.version += 1
+
+    def append(self, *values: Any):
+        """Add an event, one value per field in declaration order (IDs for INTERNED fields)"""
+        self.version += 1
+        columns = self._columns
+        if len(columns[0]) < self.capacity:
+            for column, value in zip(columns, values):
+                column.append(value)
+            return
+
+        i = self._start
+        for column, value in zip(columns, values):
+            column[i] = value
+        self._start = (i + 1) % self.capacity
+        self.dropped += 1
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def intern(self, name: str, value: Optional[str]) -> int:
+        """ID of a value of an INTERNED field"""
+        return self._tables[name].id_for(value)
+
+    def names(self, name: str) -> List[Optional[str]]:
+        """Values of an INTERNED field, indexed by ID"""
+        return self._tables[name].names
+
+    def values(self, name: str) -> Sequence:
+        """
+        A field's raw column, in storage order (IDs for INTERNED fields)
+
+        For order-independent reductions (sum, min, max, mean): no copy is
+        made, and builtins iterate typed arrays without boxing into a list.
+        """
+        return self._columns[self.fields.index(name)]
+
+    def column(self, name: str) -> list:
+        """A field's values from oldest to newest event"""
+        column = self._columns[self.fields.index(name)]
+        if self._start:
+            column = column[self._start:] + column[:self._start]
+        table = self._tables.get(name)
+        if table is not None:
+            return [table.names[name_id] for name_id in column]
+        return list(column)
+
+    def columns(self) -> Dict[str, list]:
+        """All fields as lists, oldest event first"""
+        return {name: self.column(name) for name in self.fields}
+
+    def rows(self) -> Iterator[tuple]:
+        """Events as tuples of field values, oldest first"""
+        return zip(*(self.column(name) for name in self.fields))
+
+
 class MetricsTracker:
     """
     Track and analyze performance metrics
@@ -71,14 +421,126 @@ class MetricsTracker:
     - Token usage by model and operation
     - Cost per iteration and total
     - Research iteration metrics
+
+    Counts, totals, averages, minima and maxima (overall and per group) are
+    aggregated as events are tracked, so they cover every event and reading
+    them does not rescan the streams. Medians are computed from the events
+    still held in the streams.
     """
 
-    def __init__(self):
-        self.compression_metrics: List[CompressionMetric] = []
-        self.search_metrics: List[SearchMetric] = []
-        self.token_metrics: List[TokenUsageMetric] = []
-        self.iteration_metrics: List[IterationMetric] = []
-        self.start_time = datetime.now()
+    def __init__(self, capacity: int = DEFAULT_METRICS_CAPACITY):
+        """
+        Initialize metrics tracker
+
+        Args:
+            capacity: Most recent events kept per metric family
+        """
+        self.compression = MetricStream((
+            ("timestamp_ns", "q"),
+            ("original_size", "q"),
+            ("compressed_size", "q"),
+            ("compression_ratio", "d"),
+            ("compression_time_ms", "d"),
+            ("provider", INTERNED),
+        ), capacity)
+        self.search = MetricStream((
+            ("timestamp_ns", "q"),
+            ("provider", INTERNED),
+            ("query", None),
+            ("search_time_ms", "d"),
+            ("num_results", "q"),
+            ("success", BITS),
+            ("error", INTERNED),
+        ), capacity)
+        self.search.intern("error", None)  # Error ID 0: no error
+        self.tokens = MetricStream((
+            ("timestamp_ns", "q"),
+            ("model", INTERNED),
+            ("model_type", INTERNED),
+            ("input_tokens", "q"),
+            ("output_tokens", "q"),
+            ("cost", "d"),
+            ("operation", INTERNED),
+        ), capacity)
+        self.iterations = MetricStream((
+            ("iteration", "q"),
+            ("timestamp_ns", "q"),
+            ("num_searches", "q"),
+            ("num_agents", "q"),
+            ("total_tokens", "q"),
+            ("total_cost", "d"),
+            ("confidence_score", "d"),
+            ("duration_seconds", "d"),
+            ("gaps_identified", None),
+        ), capacity)
+        self.start_time_ns = time.time_ns()
+
+        # Guards the streams and running aggregates below
+        self._lock = threading.Lock()
+
+        # Running aggregates, updated by track_*
+        self._compression_ratio = _RunningStat()
+        self._compression_time = _RunningStat()
+        self._bytes_saved = 0
+
+        self._search_time = _RunningStat()
+        self._search_successful = 0
+        # Group accumulators are indexed by the stream's interned ID
+        self._search_groups: List[List[float]] = []  # [searches, successful, total time]
+        self._search_error_groups: List[List[int]] = []  # [failed searches]
+
+        self._token_totals = [0, 0, 0.0]  # input tokens, output tokens, cost
+        self._token_type_groups: List[List[float]] = []  # [calls, input, output, cost]
+        self._token_operation_groups: List[List[float]] = []
+
+        # Stats family -> (stream version, stats), reused until the stream changes
+        self._stats_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    @property
+    def start_time(self) -> datetime:
+        """When tracking started"""
+        return _to_datetime(self.start_time_ns)
+
+    def _rows(self, stream: MetricStream) -> List[tuple]:
+        """Copy of a stream's events, oldest first"""
+        with self._lock:
+            return list(stream.rows())
+
+    @property
+    def compression_metrics(self) -> List[CompressionMetric]:
+        """Recorded compression events, oldest first"""
+        return [
+            CompressionMetric(_to_datetime(row[0]), *row[1:])
+            for row in self._rows(self.compression)
+        ]
+
+    @property
+    def search_metrics(self) -> List[SearchMetric]:
+        """Recorded search events, oldest first"""
+        return [
+            SearchMetric(
+                _to_datetime(ts), provider, query, search_time_ms,
+                num_results, success, error
+            )
+            for ts, provider, query, search_time_ms, num_results, success, error
+            in self._rows(self.search)
+        ]
+
+    @property
+    def token_metrics(self) -> List[TokenUsageMetric]:
+        """Recorded token usage events, oldest first"""
+        return [
+            TokenUsageMetric(_to_datetime(row[0]), *row[1:])
+            for row in self._rows(self.tokens)
+        ]
+
+    @property
+    def iteration_metrics(self) -> List[IterationMetric]:
+        """Recorded research iterations, oldest first"""
+        return [
+            IterationMetric(row[0], _to_datetime(row[1]), *row[2:])
+            for row in self._rows(self.iterations)
+        ]
 
     def track_compression(
         self,
@@ -89,16 +551,17 @@ class MetricsTracker:
     ):
         """Track compression operation"""
         ratio = compressed_size / original_size if original_size > 0 else 0
+        timestamp_ns = time.time_ns()
 
-        metric = CompressionMetric(
-            timestamp=datetime.now(),
-            original_size=original_size,
-            compressed_size=compressed_size,
-            compression_ratio=ratio,
-            compression_time_ms=compression_time_ms,
-            provider=provider
-        )
-        self.compression_metrics.append(metric)
+        with self._lock:
+            self._compression_ratio.add(ratio)
+            self._compression_time.add(compression_time_ms)
+            self._bytes_saved += original_size - compressed_size
+
+            self.compression.append(
+                timestamp_ns, original_size, compressed_size, ratio,
+                compression_time_ms, self.compression.intern("provider", provider)
+            )
 
     def track_search(
         self,
@@ -110,16 +573,25 @@ class MetricsTracker:
         error: Optional[str] = None
     ):
         """Track search operation"""
-        metric = SearchMetric(
-            timestamp=datetime.now(),
-            provider=provider,
-            query=query,
-            search_time_ms=search_time_ms,
-            num_results=num_results,
-            success=success,
-            error=error
-        )
-        self.search_metrics.append(metric)
+        timestamp_ns = time.time_ns()
+
+        with self._lock:
+            search = self.search
+            provider_id = search.intern("provider", provider)
+            # Failures are recorded by error kind, so the name table stays
+            # at a handful of entries; ID 0 means no error
+            error_id = 0 if success else search.intern("error", error_kind(error))
+
+            self._search_time.add(search_time_ms)
+            self._search_successful += success
+            _add_to_group(self._search_groups, provider_id, success, search_time_ms)
+            if not success:
+                _add_to_group(self._search_error_groups, error_id)
+
+            search.append(
+                timestamp_ns, provider_id, query, search_time_ms, num_results,
+                success, error_id
+            )
 
     def track_token_usage(
         self,
@@ -131,16 +603,24 @@ class MetricsTracker:
         operation: str
     ):
         """Track token usage"""
-        metric = TokenUsageMetric(
-            timestamp=datetime.now(),
-            model=model,
-            model_type=model_type,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost=cost,
-            operation=operation
-        )
-        self.token_metrics.append(metric)
+        timestamp_ns = time.time_ns()
+
+        with self._lock:
+            tokens = self.tokens
+            model_type_id = tokens.intern("model_type", model_type)
+            operation_id = tokens.intern("operation", operation)
+
+            totals = self._token_totals
+            totals[0] += input_tokens
+            totals[1] += output_tokens
+            totals[2] += cost
+            _add_to_group(self._token_type_groups, model_type_id, input_tokens, output_tokens, cost)
+            _add_to_group(self._token_operation_groups, operation_id, input_tokens, output_tokens, cost)
+
+            tokens.append(
+                timestamp_ns, tokens.intern("model", model), model_type_id,
+                input_tokens, output_tokens, cost, operation_id
+            )
 
     def track_iteration(
         self,
@@ -154,22 +634,43 @@ class MetricsTracker:
         gaps_identified: List[str] = None
     ):
         """Track research iteration"""
-        metric = IterationMetric(
-            iteration=iteration,
-            timestamp=datetime.now(),
-            num_searches=num_searches,
-            num_agents=num_agents,
-            total_tokens=total_tokens,
-            total_cost=total_cost,
-            confidence_score=confidence_score,
-            duration_seconds=duration_seconds,
-            gaps_identified=gaps_identified or []
-        )
-        self.iteration_metrics.append(metric)
+        timestamp_ns = time.time_ns()
+
+        with self._lock:
+            self.iterations.append(
+                iteration, timestamp_ns, num_searches, num_agents, total_tokens,
+                total_cost, confidence_score, duration_seconds,
+                gaps_identified or []
+            )
 
     def get_compression_stats(self) -> Dict[str, Any]:
         """Get compression statistics"""
-        if not self.compression_metrics:
+        with self._lock:
+            return _copy_stats(self._cached_stats("compression", self.compression, self._compression_stats))
+
+    def _cached_stats(
+        self,
+        family: str,
+        stream: MetricStream,
+        compute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Stats for a family, recomputed only when its stream has changed
+
+        The caller holds the lock. The returned dict is the cached one;
+        public getters hand out a deep copy (_copy_stats).
+        """
+        cached = self._stats_cache.get(family)
+        if cached is not None and cached[0] == stream.version:
+            return cached[1]
+        stats = compute()
+        self._stats_cache[family] = (stream.version, stats)
+        return stats
+
+    def _compression_stats(self) -> Dict[str, Any]:
+        """Compression statistics; caller holds the lock"""
+        ratio = self._compression_ratio
+        if not ratio.count:
             return {
                 "total_compressions": 0,
                 "avg_compression_ratio": 0,
@@ -177,76 +678,79 @@ class MetricsTracker:
                 "avg_compression_time_ms": 0
             }
 
-        ratios = [m.compression_ratio for m in self.compression_metrics]
-        times = [m.compression_time_ms for m in self.compression_metrics]
-        bytes_saved = sum(
-            m.original_size - m.compressed_size
-            for m in self.compression_metrics
-        )
+        times = self._compression_time
 
         return {
-            "total_compressions": len(self.compression_metrics),
-            "avg_compression_ratio": statistics.mean(ratios),
-            "median_compression_ratio": statistics.median(ratios),
-            "min_compression_ratio": min(ratios),
-            "max_compression_ratio": max(ratios),
-            "total_bytes_saved": bytes_saved,
-            "avg_compression_time_ms": statistics.mean(times),
-            "total_compression_time_ms": sum(times)
+            "total_compressions": ratio.count,
+            "avg_compression_ratio": ratio.mean,
+            "median_compression_ratio": _median(self.compression.values("compression_ratio")),
+            "min_compression_ratio": ratio.minimum,
+            "max_compression_ratio": ratio.maximum,
+            "total_bytes_saved": self._bytes_saved,
+            "avg_compression_time_ms": times.mean,
+            "total_compression_time_ms": times.total
         }
 
     def get_search_stats(self) -> Dict[str, Any]:
         """Get search statistics"""
-        if not self.search_metrics:
+        with self._lock:
+            return _copy_stats(self._cached_stats("search", self.search, self._search_stats))
+
+    def _search_stats(self) -> Dict[str, Any]:
+        """Search statistics; caller holds the lock"""
+        times = self._search_time
+        if not times.count:
             return {
                 "total_searches": 0,
                 "success_rate": 0,
                 "avg_search_time_ms": 0
             }
 
-        successful = [m for m in self.search_metrics if m.success]
-        times = [m.search_time_ms for m in self.search_metrics]
+        total = times.count
+        successful = self._search_successful
 
         # Provider breakdown
-        provider_stats = {}
-        for metric in self.search_metrics:
-            if metric.provider not in provider_stats:
-                provider_stats[metric.provider] = {
-                    "total": 0,
-                    "successful": 0,
-                    "failed": 0,
-                    "avg_time_ms": 0,
-                    "times": []
-                }
-
-            provider_stats[metric.provider]["total"] += 1
-            if metric.success:
-                provider_stats[metric.provider]["successful"] += 1
-            else:
-                provider_stats[metric.provider]["failed"] += 1
-            provider_stats[metric.provider]["times"].append(metric.search_time_ms)
+        providers = self.search.names("provider")
+        provider_stats = {
+            providers[provider_id]: {
+                "total": count,
+                "successful": succeeded,
+                "failed": count - succeeded,
+                "avg_time_ms": time_sum / count
+            }
+            for provider_id, (count, succeeded, time_sum) in enumerate(self._search_groups)
+            if count
+        }
 
-        # Calculate averages
-        for provider in provider_stats:
-            times = provider_stats[provider]["times"]
-            provider_stats[provider]["avg_time_ms"] = statistics.mean(times) if times else 0
-            del provider_stats[provider]["times"]  # Remove raw times
+        # Failures by error kind (error ID 0 is "no error")
+        errors = self.search.names("error")
+        error_counts = {
+            errors[error_id]: count
+            for error_id, (count,) in enumerate(self._search_error_groups)
+            if count and error_id
+        }
 
         return {
-            "total_searches": len(self.search_metrics),
-            "successful_searches": len(successful),
-            "failed_searches": len(self.search_metrics) - len(successful),
-            "success_rate": len(successful) / len(self.search_metrics),
-            "avg_search_time_ms": statistics.mean(times),
-            "median_search_time_ms": statistics.median(times),
-            "min_search_time_ms": min(times),
-            "max_search_time_ms": max(times),
-            "by_provider": provider_stats
+            "total_searches": total,
+            "successful_searches": successful,
+            "failed_searches": total - successful,
+            "success_rate": successful / total,
+            "avg_search_time_ms": times.mean,
+            "median_search_time_ms": _median(self.search.values("search_time_ms")),
+            "min_search_time_ms": times.minimum,
+            "max_search_time_ms": times.maximum,
+            "by_provider": provider_stats,
+            "by_error": error_counts
         }
 
     def get_token_stats(self) -> Dict[str, Any]:
         """Get token usage statistics"""
-        if not self.token_metrics:
+        with self._lock:
+            return _copy_stats(self._cached_stats("token", self.tokens, self._token_stats))
+
+    def _token_stats(self) -> Dict[str, Any]:
+        """Token usage statistics; caller holds the lock"""
+        if not self._token_operation_groups:
             return {
                 "total_tokens": 0,
                 "total_cost": 0,
@@ -254,34 +758,35 @@ class MetricsTracker:
                 "by_operation": {}
             }
 
-        total_input = sum(m.input_tokens for m in self.token_metrics)
-        total_output = sum(m.output_tokens for m in self.token_metrics)
-        total_cost = sum(m.cost for m in self.token_metrics)
+        total_input, total_output, total_cost = self._token_totals
+        type_groups = dict(zip(self.tokens.names("model_type"), self._token_type_groups))
 
         # By model type
         by_model_type = {}
         for model_type in ["big", "small"]:
-            metrics = [m for m in self.token_metrics if m.model_type == model_type]
-            if metrics:
+            if model_type in type_groups:
+                _, input_count, output_count, cost = type_groups[model_type]
                 by_model_type[model_type] = {
-                    "input_tokens": sum(m.input_tokens for m in metrics),
-                    "output_tokens": sum(m.output_tokens for m in metrics),
-                    "total_tokens": sum(m.input_tokens + m.output_tokens for m in metrics),
-                    "cost": sum(m.cost for m in metrics)
+                    "input_tokens": input_count,
+                    "output_tokens": output_count,
+                    "total_tokens": input_count + output_count,
+                    "cost": cost
                 }
 
         # By operation
-        by_operation = {}
-        operations = set(m.operation for m in self.token_metrics)
-        for operation in operations:
-            metrics = [m for m in self.token_metrics if m.operation == operation]
-            by_operation[operation] = {
-                "count": len(metrics),
-                "input_tokens": sum(m.input_tokens for m in metrics),
-                "output_tokens": sum(m.output_tokens for m in metrics),
-                "total_tokens": sum(m.input_tokens + m.output_tokens for m in metrics),
-                "cost": sum(m.cost for m in metrics)
+        operations = self.tokens.names("operation")
+        by_operation = {
+            operations[operation_id]: {
+                "count": count,
+                "input_tokens": input_count,
+                "output_tokens": output_count,
+                "total_tokens": input_count + output_count,
+                "cost": cost
             }
+            for operation_id, (count, input_count, output_count, cost)
+            in enumerate(self._token_operation_groups)
+            if count
+        }
 
         return {
             "total_input_tokens": total_input,
@@ -294,7 +799,12 @@ class MetricsTracker:
 
     def get_iteration_stats(self) -> Dict[str, Any]:
         """Get iteration statistics"""
-        if not self.iteration_metrics:
+        with self._lock:
+            return _copy_stats(self._cached_stats("iteration", self.iterations, self._iteration_stats))
+
+    def _iteration_stats(self) -> Dict[str, Any]:
+        """Iteration statistics; caller holds the lock"""
+        if not self.iterations:
             return {
                 "total_iterations": 0,
                 "avg_confidence_gain": 0,
@@ -302,160 +812,103 @@ class MetricsTracker:
             }
 
         # Confidence progression
-        confidence_scores = [m.confidence_score for m in self.iteration_metrics]
+        confidence_scores = self.iterations.column("confidence_score")
+        durations = self.iterations.values("duration_seconds")
         confidence_gains = [
             confidence_scores[i] - confidence_scores[i-1]
             for i in range(1, len(confidence_scores))
         ]
 
         return {
-            "total_iterations": len(self.iteration_metrics),
-            "total_searches": sum(m.num_searches for m in self.iteration_metrics),
-            "total_agents": sum(m.num_agents for m in self.iteration_metrics),
-            "total_tokens": sum(m.total_tokens for m in self.iteration_metrics),
-            "total_cost": sum(m.total_cost for m in self.iteration_metrics),
-            "total_duration_seconds": sum(m.duration_seconds for m in self.iteration_metrics),
-            "avg_duration_per_iteration": statistics.mean(
-                [m.duration_seconds for m in self.iteration_metrics]
-            ),
+            "total_iterations": len(self.iterations),
+            "total_searches": sum(self.iterations.values("num_searches")),
+            "total_agents": sum(self.iterations.values("num_agents")),
+            "total_tokens": sum(self.iterations.values("total_tokens")),
+            "total_cost": sum(self.iterations.values("total_cost")),
+            "total_duration_seconds": sum(durations),
+            "avg_duration_per_iteration": _mean(durations),
             "confidence_progression": confidence_scores,
-            "avg_confidence_gain": statistics.mean(confidence_gains) if confidence_gains else 0,
+            "avg_confidence_gain": _mean(confidence_gains) if confidence_gains else 0,
             "final_confidence": confidence_scores[-1] if confidence_scores else 0
         }
 
     def generate_report(self) -> str:
         """Generate comprehensive performance report"""
-        compression_stats = self.get_compression_stats()
         search_stats = self.get_search_stats()
         token_stats = self.get_token_stats()
         iteration_stats = self.get_iteration_stats()
 
-        elapsed_time = (datetime.now() - self.start_time).total_seconds()
-
-        report = f"""
-# Performance Report
-
-## Overall Statistics
-- Total Duration: {elapsed_time:.2f}s
-- Total Cost: ${token_stats['total_cost']:.4f}
-- Total Tokens: {token_stats['total_tokens']:,}
-
-## Compression Performance
-- Total Compressions: {compression_stats['total_compressions']}
-- Average Compression Ratio: {compression_stats['avg_compression_ratio']:.2%}
-- Bytes Saved: {compression_stats['total_bytes_saved']:,} bytes
-- Avg Compression Time: {compression_stats['avg_compression_time_ms']:.2f}ms
-
-## Search Performance
-- Total Searches: {search_stats['total_searches']}
-- Success Rate: {search_stats['success_rate']:.2%}
-- Avg Search Time: {search_stats['avg_search_time_ms']:.2f}ms
-- Median Search Time: {search_stats['median_search_time_ms']:.2f}ms
-
-### By Provider:
-"""
-        for provider, stats in search_stats.get('by_provider', {}).items():
-            report += f"- {provider}: {stats['successful']}/{stats['total']} successful ({stats['successful']/stats['total']:.1%}), avg {stats['avg_time_ms']:.1f}ms\n"
-
-        report += f"""
-## Token Usage
-- Input Tokens: {token_stats['total_input_tokens']:,}
-- Output Tokens: {token_stats['total_output_tokens']:,}
-- Total Cost: ${token_stats['total_cost']:.4f}
-
-### By Model Type:
-"""
-        for model_type, stats in token_stats.get('by_model_type', {}).items():
-            report += f"- {model_type}: {stats['total_tokens']:,} tokens (${stats['cost']:.4f})\n"
-
-        report += f"""
-### By Operation:
-"""
-        for operation, stats in token_stats.get('by_operation', {}).items():
-            report += f"- {operation}: {stats['count']} calls, {stats['total_tokens']:,} tokens (${stats['cost']:.4f})\n"
-
-        report += f"""
-## Research Iterations
-- Total Iterations: {iteration_stats['total_iterations']}
-- Total Searches: {iteration_stats['total_searches']}
-- Total Agents: {iteration_stats['total_agents']}
-- Avg Duration per Iteration: {iteration_stats.get('avg_duration_per_iteration', 0):.2f}s
-- Final Confidence: {iteration_stats.get('final_confidence', 0):.2f}
-- Avg Confidence Gain: {iteration_stats.get('avg_confidence_gain', 0):.2f}
+        context = {
+            "elapsed_time": (time.time_ns() - self.start_time_ns) / 1e9,
+            "compression": self.get_compression_stats(),
+            "search": search_stats,
+            "tokens": token_stats,
+            "iterations": iteration_stats,
+            "avg_duration": iteration_stats.get('avg_duration_per_iteration', 0),
+            "final_confidence": iteration_stats.get('final_confidence', 0),
+            "avg_confidence_gain": iteration_stats.get('avg_confidence_gain', 0),
+            "confidence_progression": ' -> '.join([
+                f"{c:.2f}" for c in iteration_stats.get('confidence_progression', [])
+            ])
+        }
 
-### Confidence Progression:
-{' -> '.join([f"{c:.2f}" for c in iteration_stats.get('confidence_progression', [])])}
-"""
+        parts = [_REPORT_SEARCH.format_map(context)]
+        parts.extend(
+            _REPORT_PROVIDER_LINE.format(
+                name=provider, rate=stats['successful'] / stats['total'], **stats
+            )
+            for provider, stats in search_stats.get('by_provider', {}).items()
+        )
+        parts.append(_REPORT_TOKENS.format_map(context))
+        parts.extend(
+            _REPORT_MODEL_TYPE_LINE.format(name=model_type, **stats)
+            for model_type, stats in token_stats.get('by_model_type', {}).items()
+        )
+        parts.append(_REPORT_OPERATIONS)
+        parts.extend(
+            _REPORT_OPERATION_LINE.format(name=operation, **stats)
+            for operation, stats in token_stats.get('by_operation', {}).items()
+        )
+        parts.append(_REPORT_ITERATIONS.format_map(context))
 
-        return report
+        return "".join(parts)
 
     def export_metrics(self, filepath: str):
-        """Export all metrics to JSON file"""
+        """
+        Export all metrics to JSON file
+
+        Events are written column-wise: each metric family is an object of
+        field name -> list of values (oldest first), with timestamps as
+        time.time_ns() integers.
+        """
+        # Copy events and summary under one lock so they agree
+        with self._lock:
+            compression = self.compression.columns()
+            search = self.search.columns()
+            tokens = self.tokens.columns()
+            iterations = self.iterations.columns()
+            summary = {
+                "compression_stats": self._cached_stats("compression", self.compression, self._compression_stats),
+                "search_stats": self._cached_stats("search", self.search, self._search_stats),
+                "token_stats": self._cached_stats("token", self.tokens, self._token_stats),
+                "iteration_stats": self._cached_stats("iteration", self.iterations, self._iteration_stats)
+            }
+
         data = {
             "metadata": {
                 "start_time": self.start_time.isoformat(),
                 "end_time": datetime.now().isoformat(),
-                "duration_seconds": (datetime.now() - self.start_time).total_seconds()
+                "duration_seconds": (time.time_ns() - self.start_time_ns) / 1e9
             },
-            "compression_metrics": [
-                {
-                    "timestamp": m.timestamp.isoformat(),
-                    "original_size": m.original_size,
-                    "compressed_size": m.compressed_size,
-                    "compression_ratio": m.compression_ratio,
-                    "compression_time_ms": m.compression_time_ms,
-                    "provider": m.provider
-                }
-                for m in self.compression_metrics
-            ],
-            "search_metrics": [
-                {
-                    "timestamp": m.timestamp.isoformat(),
-                    "provider": m.provider,
-                    "query": m.query,
-                    "search_time_ms": m.search_time_ms,
-                    "num_results": m.num_results,
-                    "success": m.success,
-                    "error": m.error
-                }
-                for m in self.search_metrics
-            ],
-            "token_metrics": [
-                {
-                    "timestamp": m.timestamp.isoformat(),
-                    "model": m.model,
-                    "model_type": m.model_type,
-                    "input_tokens": m.input_tokens,
-                    "output_tokens": m.output_tokens,
-                    "cost": m.cost,
-                    "operation": m.operation
-                }
-                for m in self.token_metrics
-            ],
-            "iteration_metrics": [
-                {
-                    "iteration": m.iteration,
-                    "timestamp": m.timestamp.isoformat(),
-                    "num_searches": m.num_searches,
-                    "num_agents": m.num_agents,
-                    "total_tokens": m.total_tokens,
-                    "total_cost": m.total_cost,
-                    "confidence_score": m.confidence_score,
-                    "duration_seconds": m.duration_seconds,
-                    "gaps_identified": m.gaps_identified
-                }
-                for m in self.iteration_metrics
-            ],
-            "summary": {
-                "compression_stats": self.get_compression_stats(),
-                "search_stats": self.get_search_stats(),
-                "token_stats": self.get_token_stats(),
-                "iteration_stats": self.get_iteration_stats()
-            }
+            "compression_metrics": compression,
+            "search_metrics": search,
+            "token_metrics": tokens,
+            "iteration_metrics": iterations,
+            "summary": summary
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(json_utils.dumps(data, indent=2))
 
         print(f"📊 Metrics exported to: {filepath}")
 
@@ -485,6 +938,14 @@ class MetricsTracker:
                 f"Consider implementing fallback providers."
             )
 
+        error_counts = search_stats.get('by_error')
+        if error_counts:
+            error, count = max(error_counts.items(), key=lambda item: item[1])
+            recommendations.append(
+                f"⚠️ Most common search error kind is {error} "
+                f"({count}/{search_stats['failed_searches']} failures)."
+            )
+
         # Cost recommendations
         big_model_cost = token_stats.get('by_model_type', {}).get('big', {}).get('cost', 0)
         small_model_cost = token_stats.get('by_model_type', {}).get('small', {}).get('cost', 0)
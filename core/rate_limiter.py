@@ -44,14 +44,29 @@ class RateLimiter:
             requests_per_minute: Maximum requests per minute
         """
         self.rpm = requests_per_minute
-        self.requests: deque = deque()
+        self._refill_per_sec = requests_per_minute / 60.0
         self._lock = Lock()
 
+        # Bucket state: available tokens and last refill time (monotonic).
+        # Tokens may go negative; each waiter has then reserved a future slot.
+        self._tokens = float(requests_per_minute)
+        self._last_refill = time.monotonic()
+
         # Statistics
         self.total_requests = 0
         self.total_wait_time = 0.0
         self.wait_count = 0
 
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last refill (caller holds the lock)."""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(
+                float(self.rpm),
+                self._tokens + elapsed * self._refill_per_sec
+            )
+            self._last_refill = now
+
     async def acquire(self) -> bool:
         """
         Acquire permission to make an API call
@@ -63,33 +78,28 @@ class RateLimiter:
 
         Thread-safe: Yes
         """
-        with self._lock:
-            now = time.time()
-
-            # Remove requests older than 1 minute
-            while self.requests and now - self.requests[0] >= 60:
-                self.requests.popleft()
+        if self.rpm <= 0:
+            self.total_requests += 1
+            return True
 
-            # Check if at limit
-            if len(self.requests) >= self.rpm:
-                # Calculate wait time
-                oldest_request = self.requests[0]
-                wait_time = 60 - (now - oldest_request)
+        # O(1) arithmetic under the lock: take a token, or reserve the next
+        # one and compute how long until it is earned
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            self.total_requests += 1
 
-                if wait_time > 0:
-                    self.wait_count += 1
-                    self.total_wait_time += wait_time
-                    print(f"⏳ Rate limit reached. Waiting {wait_time:.1f}s...")
+            wait_time = 0.0
+            if self._tokens < 0:
+                wait_time = -self._tokens / self._refill_per_sec
+                self.wait_count += 1
+                self.total_wait_time += wait_time
 
         # Wait outside the lock to allow other threads
         if wait_time > 0:
+            print(f"⏳ Rate limit reached. Waiting {wait_time:.1f}s...")
             await asyncio.sleep(wait_time)
 
-        # Add this request
-        with self._lock:
-            self.requests.append(time.time())
-            self.total_requests += 1
-
         return True
 
     async def can_proceed(self) -> bool:
@@ -99,14 +109,12 @@ class RateLimiter:
         Returns:
             True if under rate limit, False if would need to wait
         """
-        with self._lock:
-            now = time.time()
+        if self.rpm <= 0:
+            return True
 
-            # Remove requests older than 1 minute
-            while self.requests and now - self.requests[0] >= 60:
-                self.requests.popleft()
-
-            return len(self.requests) < self.rpm
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens >= 1
 
     def get_current_usage(self) -> Dict[str, any]:
         """
@@ -116,17 +124,16 @@ class RateLimiter:
             Dictionary with usage statistics
         """
         with self._lock:
-            now = time.time()
-
-            # Clean old requests
-            while self.requests and now - self.requests[0] >= 60:
-                self.requests.popleft()
+            if self.rpm > 0:
+                self._refill(time.monotonic())
+            available = max(0, int(self._tokens))
+            current = max(0, self.rpm - available)
 
             return {
-                "current_requests": len(self.requests),
+                "current_requests": current,
                 "limit": self.rpm,
-                "usage_pct": (len(self.requests) / self.rpm * 100) if self.rpm > 0 else 0,
-                "available": max(0, self.rpm - len(self.requests)),
+                "usage_pct": (current / self.rpm * 100) if self.rpm > 0 else 0,
+                "available": available,
                 "total_requests": self.total_requests,
                 "total_waits": self.wait_count,
                 "total_wait_time": self.total_wait_time
@@ -135,7 +142,8 @@ class RateLimiter:
     def reset(self):
         """Reset rate limiter state"""
         with self._lock:
-            self.requests.clear()
+            self._tokens = float(self.rpm)
+            self._last_refill = time.monotonic()
             self.total_requests = 0
             self.total_wait_time = 0.0
             self.wait_count = 0
@@ -8,8 +8,8 @@ Reference: METAPROMPT_agentic_research_continuation.md (Lines 299-356)
 """
 
 import anyio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime
 import json
 
@@ -28,6 +28,137 @@ class VerificationResult:
     decision: str  # "continue" or "complete"
 
 
+@dataclass
+class VerificationResultDelta:
+    """
+    Verification result stored as changes from the previous one
+
+    Scores and decision are stored as-is; list fields as the items removed
+    from and appended to the previous result's list.
+    """
+
+    confidence: float
+    coverage_score: float
+    depth_score: float
+    source_quality_score: float
+    consistency_score: float
+    decision: str
+    removed_gaps: Tuple[str, ...]
+    added_gaps: Tuple[str, ...]
+    removed_angles: Tuple[str, ...]
+    added_angles: Tuple[str, ...]
+
+
+def _list_delta(
+    previous: List[str], current: List[str]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Compute (removed, added) so that _apply_delta(previous, ...) == current
+
+    Falls back to replacing the whole list when items were reordered.
+    """
+    current_set = set(current)
+    previous_set = set(previous)
+    removed = tuple(item for item in previous_set if item not in current_set)
+    added = tuple(item for item in current if item not in previous_set)
+
+    if _apply_delta(previous, removed, added) != current:
+        return tuple(previous_set), tuple(current)
+    return removed, added
+
+
+def _apply_delta(
+    previous: List[str], removed: Tuple[str, ...], added: Tuple[str, ...]
+) -> List[str]:
+    """Rebuild a list from the previous list and a (removed, added) delta"""
+    if removed:
+        removed_set = set(removed)
+        kept = [item for item in previous if item not in removed_set]
+    else:
+        kept = list(previous)
+    kept.extend(added)
+    return kept
+
+
+class VerificationHistory:
+    """
+    Verification results across iterations, delta-encoded
+
+    Gaps and recommended angles usually overlap heavily between iterations,
+    so only the first result is stored in full; later results are stored as
+    VerificationResultDelta against their predecessor. Supports len(),
+    iteration and indexing like the list it replaces; the latest result is
+    kept in full for O(1) access to history[-1].
+    """
+
+    def __init__(self):
+        self._baseline: Optional[VerificationResult] = None
+        self._deltas: List[VerificationResultDelta] = []
+        self._latest: Optional[VerificationResult] = None
+
+    def append(self, result: VerificationResult) -> None:
+        """Record the next iteration's verification result"""
+        if self._latest is None:
+            self._baseline = result
+        else:
+            removed_gaps, added_gaps = _list_delta(self._latest.gaps, result.gaps)
+            removed_angles, added_angles = _list_delta(
+                self._latest.recommended_angles, result.recommended_angles
+            )
+            self._deltas.append(
+                VerificationResultDelta(
+                    confidence=result.confidence,
+                    coverage_score=result.coverage_score,
+                    depth_score=result.depth_score,
+                    source_quality_score=result.source_quality_score,
+                    consistency_score=result.consistency_score,
+                    decision=result.decision,
+                    removed_gaps=removed_gaps,
+                    added_gaps=added_gaps,
+                    removed_angles=removed_angles,
+                    added_angles=added_angles,
+                )
+            )
+        self._latest = result
+
+    def __len__(self) -> int:
+        return 0 if self._baseline is None else len(self._deltas) + 1
+
+    def __iter__(self) -> Iterator[VerificationResult]:
+        if self._baseline is None:
+            return
+
+        result = self._baseline
+        yield result
+        for delta in self._deltas:
+            result = VerificationResult(
+                confidence=delta.confidence,
+                coverage_score=delta.coverage_score,
+                depth_score=delta.depth_score,
+                source_quality_score=delta.source_quality_score,
+                consistency_score=delta.consistency_score,
+                gaps=_apply_delta(result.gaps, delta.removed_gaps, delta.added_gaps),
+                recommended_angles=_apply_delta(
+                    result.recommended_angles, delta.removed_angles, delta.added_angles
+                ),
+                decision=delta.decision,
+            )
+            yield result
+
+    def __getitem__(self, index: int) -> VerificationResult:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("verification history index out of range")
+
+        if index == length - 1:
+            return self._latest
+        for i, result in enumerate(self):
+            if i == index:
+                return result
+
+
 @dataclass
 class ResearchReport:
     """Final research report"""
@@ -36,7 +167,7 @@ class ResearchReport:
     findings: List[Dict[str, Any]]
     report: str
     metadata: Dict[str, Any]
-    verification_history: List[VerificationResult]
+    verification_history: VerificationHistory
     total_iterations: int
     total_searches: int
     total_cost: float
@@ -112,7 +243,7 @@ class ResearchLoop:
         """
         iteration = 0
         all_findings = []
-        verification_history = []
+        verification_history = VerificationHistory()
 
         print(f"🔍 Starting iterative research on: {query}")
         print(
@@ -240,8 +371,6 @@ class ResearchLoop:
         )
 
         # Convert ResearchPlan dataclass to dict for compatibility
-        from dataclasses import asdict
-
         return asdict(plan)
 
     async def _spawn_search_agents(
@@ -9,7 +9,7 @@ Priority: HIGH (must run before API call)
 
 import time
 import hashlib
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Mapping, Optional, Set
 from functools import wraps
 from collections import defaultdict
 
@@ -113,9 +113,15 @@ async def optimize_context(
 
     if context_editor is not None:
         # Use sophisticated context editor
-        optimized = await context_editor.edit_context(
+        target_tokens = int(max_tokens * 0.7)  # Target 70% of max
+
+        # Skip the editor entirely when savings would be marginal
+        if not context_editor.should_compress_preflight(unique_messages, target_tokens):
+            return unique_messages
+
+        optimized = await context_editor.optimize_context(
             messages=unique_messages,
-            target_tokens=max_tokens * 0.7,  # Target 70% of max
+            target_tokens=target_tokens,
             strategy="keep_recent_and_relevant"
         )
         return optimized
@@ -151,7 +157,7 @@ async def remove_duplicate_urls(
         # Extract URL from various possible locations
         url = None
 
-        if isinstance(msg, dict):
+        if isinstance(msg, Mapping):
             url = (
                 msg.get("url") or
                 msg.get("source") or
@@ -298,7 +304,7 @@ async def compress_old_messages(
     # Compress old messages
     compressed_old = []
     for msg in old_messages:
-        if isinstance(msg, dict) and "content" in msg:
+        if isinstance(msg, Mapping) and "content" in msg:
             content = str(msg.get("content", ""))
             if len(content) > 500:
                 # Create compressed version
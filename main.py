@@ -69,9 +69,23 @@ except ImportError:
     Console = None
     print("Warning: 'rich' package not available. Install with: pip install rich")
 
+# uvloop for a faster event loop (optional, not available on Windows)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 # Core imports
 from utils.config_loader import ConfigLoader
-from utils.logging_config import setup_logging, configure_debug_logging
+from utils.logging_config import (
+    setup_logging,
+    configure_debug_logging,
+    enable_queue_logging,
+    disable_queue_logging,
+)
 from core.cost_tracker import CostTracker
 from core.rate_limiter import RateLimiter
 from core.research_loop import ResearchLoop, ResearchReport
@@ -109,6 +123,11 @@ class ResearchCLI:
             self.logger = setup_logging(
                 level=log_level, component="main", use_colors=True
             )
+            # Agent progress is logged under the package logger
+            setup_logging(level=log_level, use_colors=True)
+
+        # Agent loggers only enqueue records; a background thread writes them
+        enable_queue_logging()
 
     def _print(self, message: str, style: Optional[str] = None) -> None:
         """Print with optional Rich styling"""
@@ -343,6 +362,9 @@ class ResearchCLI:
             self.end_time = datetime.now()
             raise
 
+        finally:
+            await orchestrator.cleanup()
+
     def format_report(self, report: ResearchReport) -> str:
         """
         Format research report as markdown
@@ -637,6 +659,8 @@ class ResearchCLI:
                     print(f"\nStack trace:")
                     traceback.print_exc()
             return 1
+        finally:
+            disable_queue_logging()
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -772,8 +796,10 @@ def main() -> int:
     # Create and run CLI
     cli = ResearchCLI(args)
 
-    # Run async event loop
-    return asyncio.run(cli.run())
+    # Run async event loop (uvloop when installed)
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(cli.run())
 
 
 if __name__ == "__main__":
@@ -6,7 +6,13 @@ must follow, enabling easy switching between Claude, OpenAI, OpenRouter, and Gem
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+
+
+# Upper bound on pooled agents per provider (least recently used evicted)
+AGENT_POOL_MAX_ENTRIES = 64
 
 
 class BaseProvider(ABC):
@@ -34,6 +40,63 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def get_pooled_agent(
+        self,
+        model_type: str,
+        system_prompt: str,
+        tools: Optional[List[str]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Get a shared agent instance, creating it on first use.
+
+        Agents are pooled per (event loop, model type, system prompt,
+        options), so short-lived agent wrappers built with the same
+        configuration reuse one underlying agent instead of creating a new
+        one each time. Pooled agents must be treated as read-only. The pool
+        keeps the AGENT_POOL_MAX_ENTRIES most recently used agents, so
+        per-angle prompts and new event loops don't grow it without bound.
+
+        Args:
+            model_type: "big" or "small" model
+            system_prompt: System prompt for the agent
+            tools: List of tool names to enable
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            Agent instance
+        """
+        pool: "OrderedDict[Tuple[Any, ...], Any]" = self.__dict__.setdefault(
+            "_agent_pool", OrderedDict()
+        )
+        key = (
+            id(asyncio.get_running_loop()),
+            model_type,
+            # str caches its hash, so module-level prompt constants are
+            # keyed without re-encoding them on every initialization
+            system_prompt,
+            tuple(tools or ()),
+            repr(sorted(kwargs.items()))
+        )
+
+        agent = pool.get(key)
+        if agent is not None:
+            pool.move_to_end(key)
+            return agent
+
+        agent = await self.create_agent(
+            model_type=model_type,
+            system_prompt=system_prompt,
+            tools=tools,
+            **kwargs
+        )
+        # Another caller may have pooled one while this one was created
+        agent = pool.setdefault(key, agent)
+        pool.move_to_end(key)
+        while len(pool) > AGENT_POOL_MAX_ENTRIES:
+            pool.popitem(last=False)
+        return agent
+
     @abstractmethod
     async def send_message(
         self,
@@ -45,6 +108,10 @@ class BaseProvider(ABC):
         """
         Send message to agent and get response.
 
+        Providers should accept a ``cache_prefix`` keyword: stable text sent
+        before the message and marked for provider-side prompt caching where
+        supported (sent as a plain prefix otherwise).
+
         Args:
             agent: Agent instance
             message: Message to send
@@ -56,6 +123,31 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def send_message_stream(
+        self,
+        agent: Any,
+        message: str,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Send message to agent and yield the response as it is generated.
+
+        Accepts the same arguments as send_message(). The default
+        implementation yields the complete response as a single chunk;
+        providers with streaming APIs override it.
+
+        Args:
+            agent: Agent instance
+            message: Message to send
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific arguments
+
+        Yields:
+            Response text chunks
+        """
+        yield await self.send_message(agent, message, temperature, **kwargs)
+
     @abstractmethod
     async def call_tool(
         self,
@@ -109,6 +201,14 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release pooled network resources.
+
+        The provider stays usable; connections are re-created on next use.
+        """
+        pass
+
     @property
     @abstractmethod
     def big_model_name(self) -> str:
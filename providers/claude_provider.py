@@ -6,9 +6,14 @@ It handles agent creation, message sending, tool calls, and cost tracking.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 from anthropic import Anthropic, AsyncAnthropic
 from .base import BaseProvider
+from .session import RefreshingSession, create_http_client, MAX_REQUESTS_PER_CLIENT
+
+
+# Prompt-caching breakpoint for stable system prompts and message prefixes
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class ClaudeProvider(BaseProvider):
@@ -34,17 +39,39 @@ class ClaudeProvider(BaseProvider):
         "small": {"input": 0.80, "output": 4.00},
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_requests_per_client: int = MAX_REQUESTS_PER_CLIENT):
         """
         Initialize Claude provider.
 
         Args:
             api_key: Anthropic API key
+            max_requests_per_client: Requests served before the async client
+                is replaced with a fresh one
         """
         self.api_key = api_key
-        self.client = AsyncAnthropic(api_key=api_key)
+        self._session = RefreshingSession(self._create_client, max_requests_per_client)
         self.sync_client = Anthropic(api_key=api_key)
 
+    def _create_client(self) -> AsyncAnthropic:
+        """Create an async client backed by a pooled keep-alive HTTP connection."""
+        http_client = create_http_client()
+        if http_client is not None:
+            return AsyncAnthropic(api_key=self.api_key, http_client=http_client)
+        return AsyncAnthropic(api_key=self.api_key)
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """
+        Current async client, shared by every agent using this provider.
+
+        Created on first use and replaced after max_requests_per_client requests.
+        """
+        return self._session.client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections (re-created on next use)."""
+        await self._session.aclose()
+
     async def create_agent(
         self,
         model_type: str,
@@ -59,7 +86,8 @@ class ClaudeProvider(BaseProvider):
             model_type: Either "big" or "small"
             system_prompt: System prompt defining agent behavior
             tools: List of tool names (optional)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (prompt_caching=True marks the
+                system prompt for provider-side prompt caching)
 
         Returns:
             Agent configuration dictionary
@@ -94,7 +122,8 @@ class ClaudeProvider(BaseProvider):
             agent: Agent configuration dictionary
             message: User message
             temperature: Sampling temperature (0.0-1.0)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (cache_prefix: stable text sent
+                before the message as a prompt-cached block)
 
         Returns:
             Agent's text response
@@ -103,14 +132,10 @@ class ClaudeProvider(BaseProvider):
             Exception: If API call fails
         """
         try:
-            response = await self.client.messages.create(
-                model=agent["model"],
-                system=agent["system_prompt"],
-                messages=[{"role": "user", "content": message}],
-                temperature=temperature,
-                max_tokens=kwargs.get("max_tokens", 4096),
-                **{k: v for k, v in kwargs.items() if k != "max_tokens"},
-            )
+            async with self._session.request() as client:
+                response = await client.messages.create(
+                    **self._build_request(agent, message, temperature, kwargs)
+                )
 
             # Extract text content from response
             text_content = ""
@@ -123,6 +148,85 @@ class ClaudeProvider(BaseProvider):
         except Exception as e:
             raise Exception(f"Claude API error: {str(e)}") from e
 
+    async def send_message_stream(
+        self, agent: Dict[str, Any], message: str, temperature: float = 0.3, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Send a message to the agent and yield response text as it arrives.
+
+        Args:
+            agent: Agent configuration dictionary
+            message: User message
+            temperature: Sampling temperature (0.0-1.0)
+            **kwargs: Same as send_message()
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            async with self._session.request() as client:
+                async with client.messages.stream(
+                    **self._build_request(agent, message, temperature, kwargs)
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}") from e
+
+    def _build_request(
+        self,
+        agent: Dict[str, Any],
+        message: str,
+        temperature: float,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build Messages API parameters for send_message/send_message_stream.
+
+        Args:
+            agent: Agent configuration dictionary
+            message: User message
+            temperature: Sampling temperature
+            kwargs: Extra parameters (cache_prefix, max_tokens, API options)
+
+        Returns:
+            Keyword arguments for client.messages.create/stream
+        """
+        kwargs = dict(kwargs)
+        cache_prefix = kwargs.pop("cache_prefix", None)
+
+        system: Any = agent["system_prompt"]
+        if agent.get("prompt_caching"):
+            system = [{
+                "type": "text",
+                "text": system,
+                "cache_control": EPHEMERAL_CACHE_CONTROL,
+            }]
+
+        content: Any = message
+        if cache_prefix:
+            content = [
+                {
+                    "type": "text",
+                    "text": cache_prefix,
+                    "cache_control": EPHEMERAL_CACHE_CONTROL,
+                },
+                {"type": "text", "text": message},
+            ]
+
+        return {
+            "model": agent["model"],
+            "system": system,
+            "messages": [{"role": "user", "content": content}],
+            "temperature": temperature,
+            "max_tokens": kwargs.pop("max_tokens", 4096),
+            **kwargs,
+        }
+
     async def call_tool(
         self, agent: Dict[str, Any], tool_name: str, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -141,23 +245,24 @@ class ClaudeProvider(BaseProvider):
             ValueError: If tool is not available
             Exception: If tool execution fails
         """
-        if tool_name not in agent.get("tools", []):
+        if tool_name not in (agent.get("tools") or ()):
             raise ValueError(f"Tool '{tool_name}' not available for this agent")
 
         try:
             # Create a message that triggers the tool
-            response = await self.client.messages.create(
-                model=agent["model"],
-                system=agent["system_prompt"],
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"Execute tool: {tool_name} with arguments: {arguments}",
-                    }
-                ],
-                tools=[{"name": tool_name, "description": f"Tool: {tool_name}"}],
-                max_tokens=4096,
-            )
+            async with self._session.request() as client:
+                response = await client.messages.create(
+                    model=agent["model"],
+                    system=agent["system_prompt"],
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": f"Execute tool: {tool_name} with arguments: {arguments}",
+                        }
+                    ],
+                    tools=[{"name": tool_name, "description": f"Tool: {tool_name}"}],
+                    max_tokens=4096,
+                )
 
             # Extract tool use result
             for block in response.content:
@@ -0,0 +1,144 @@
+"""
+Shared HTTP Connection Pooling
+
+This module builds the pooled HTTP client that providers hand to their SDKs,
+so every agent and search call made through a provider reuses the same
+keep-alive TCP/TLS connections instead of opening new ones.
+
+RefreshingSession replaces that client after a fixed number of requests so
+long-running processes do not accumulate state in a single client forever.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+
+# Connection pool limits shared by all provider HTTP clients
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Requests served by one client before it is replaced
+MAX_REQUESTS_PER_CLIENT = 1000
+
+
+def create_http_client(
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = KEEPALIVE_EXPIRY_SECONDS,
+    timeout: float = 600.0
+) -> Optional[Any]:
+    """
+    Create a pooled async HTTP client for a provider SDK.
+
+    Args:
+        max_connections: Maximum open connections
+        max_keepalive_connections: Maximum idle connections kept alive
+        keepalive_expiry: Seconds an idle connection is kept
+        timeout: Request timeout in seconds
+
+    Returns:
+        httpx.AsyncClient, or None if httpx is not installed (SDK default)
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        timeout=timeout
+    )
+
+
+class RefreshingSession:
+    """
+    Client holder that replaces its client after max_requests requests.
+
+    A replaced client with no requests in flight is closed right away; a busy
+    one is retired and closed once its last in-flight request finishes, so
+    rotation never interrupts concurrent calls.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_requests: int = MAX_REQUESTS_PER_CLIENT
+    ):
+        """
+        Initialize refreshing session.
+
+        Args:
+            factory: Zero-argument callable creating a client with async close()
+            max_requests: Requests served before the client is replaced
+        """
+        self._factory = factory
+        self.max_requests = max_requests
+
+        # Current [client, in-flight requests] record and its request count
+        self._current: Optional[List[Any]] = None
+        self._count = 0
+
+        # Replaced records still serving in-flight requests (never idle ones)
+        self._retired: List[List[Any]] = []
+
+    def _current_record(self) -> List[Any]:
+        """Current [client, in-flight] record, creating the client if needed."""
+        if self._current is None:
+            self._current = [self._factory(), 0]
+            self._count = 0
+        return self._current
+
+    @property
+    def client(self) -> Any:
+        """Current client, created on first use."""
+        return self._current_record()[0]
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[Any]:
+        """
+        Hold a client for the duration of one request.
+
+        Yields:
+            Client to issue the request with
+        """
+        if self._current is not None and self._count >= self.max_requests:
+            retired = self._current
+            self._current = None
+            if retired[1]:
+                self._retired.append(retired)
+            else:
+                await retired[0].close()
+
+        record = self._current_record()
+        self._count += 1
+        record[1] += 1
+        try:
+            yield record[0]
+        finally:
+            record[1] -= 1
+            if record[1] == 0 and record in self._retired:
+                self._retired.remove(record)
+                await record[0].close()
+
+    async def aclose(self) -> None:
+        """Close the current client and any retired clients."""
+        records = self._retired
+        if self._current is not None:
+            records.append(self._current)
+        self._current = None
+        self._retired = []
+        self._count = 0
+
+        for client, _ in records:
+            await client.close()
@@ -0,0 +1,76 @@
+"""
+Tests for agents.llm_cache near-hit matching.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from agents.llm_cache import AngleTemplateCache, SemanticCache
+
+
+EU_QUERY = "What is the market outlook for electric vehicles in Europe in 2025?"
+EU_ANGLES = [
+    "EU emissions regulation",
+    "European charging infrastructure",
+    "EV sales forecasts for Europe",
+    "Battery supply chain in Europe",
+    "Consumer incentives in EU member states",
+]
+
+
+class AngleTemplateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = AngleTemplateCache()
+        self.cache.set(EU_QUERY, EU_ANGLES)
+
+    def test_rephrased_query_hits(self):
+        query = "Electric vehicles in Europe in 2025: what is the market outlook?"
+        self.assertEqual(self.cache.get(query, 5), EU_ANGLES)
+
+    def test_entity_swap_misses(self):
+        query = "What is the market outlook for electric vehicles in China in 2025?"
+        self.assertIsNone(self.cache.get(query, 5))
+
+
+CAFFEINE_KEY = (
+    "What are the effects of moderate daily caffeine consumption on sleep "
+    "quality and cognitive performance in healthy adults over 40?"
+)
+
+
+class SemanticCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SemanticCache()
+        self.cache.set("ns", "prompt 1", "caffeine angles", semantic_key=CAFFEINE_KEY)
+
+    def test_rephrased_key_hits(self):
+        key = CAFFEINE_KEY.lower().rstrip("?")
+        self.assertEqual(
+            self.cache.get("ns", "prompt 2", semantic_key=key), "caffeine angles"
+        )
+
+    def test_swapped_word_misses(self):
+        key = CAFFEINE_KEY.replace("caffeine", "alcohol")
+        self.assertIsNone(self.cache.get("ns", "prompt 2", semantic_key=key))
+
+    def test_persisted_entries_keep_content_terms(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.json")
+            self.cache.path = Path(path)
+            self.cache.save()
+
+            loaded = SemanticCache(path=path)
+            key = CAFFEINE_KEY.replace("caffeine", "alcohol")
+            self.assertIsNone(loaded.get("ns", "prompt 2", semantic_key=key))
+            self.assertEqual(
+                loaded.get("ns", "prompt 2", semantic_key=CAFFEINE_KEY),
+                "caffeine angles"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
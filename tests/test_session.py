@@ -0,0 +1,69 @@
+"""
+Tests for providers.session.RefreshingSession client rotation.
+"""
+
+import asyncio
+import unittest
+
+from providers.session import RefreshingSession
+
+
+class FakeClient:
+    """Client stand-in that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class RefreshingSessionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sequential_rotation_closes_old_clients(self):
+        clients = []
+
+        def factory():
+            clients.append(FakeClient())
+            return clients[-1]
+
+        session = RefreshingSession(factory, max_requests=2)
+        for _ in range(7):
+            async with session.request():
+                pass
+
+        self.assertEqual(len(clients), 4)
+        self.assertTrue(all(client.closed for client in clients[:-1]))
+        self.assertFalse(clients[-1].closed)
+        self.assertEqual(session._retired, [])
+
+        await session.aclose()
+        self.assertTrue(clients[-1].closed)
+
+    async def test_busy_client_closed_after_last_request(self):
+        clients = []
+
+        def factory():
+            clients.append(FakeClient())
+            return clients[-1]
+
+        session = RefreshingSession(factory, max_requests=1)
+        release = asyncio.Event()
+
+        async def slow_request():
+            async with session.request():
+                await release.wait()
+
+        task = asyncio.create_task(slow_request())
+        await asyncio.sleep(0)
+        async with session.request():
+            self.assertFalse(clients[0].closed)
+
+        release.set()
+        await task
+        self.assertTrue(clients[0].closed)
+        self.assertEqual(session._retired, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
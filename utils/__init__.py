@@ -4,9 +4,23 @@ Utility modules for configuration, logging, and helper functions.
 This package contains:
 - ConfigLoader: Load API keys and configuration from secrets.json
 - Logging configuration: Set up structured logging
+- json_utils: Fast JSON encode/decode with extraction from LLM responses
 """
 
 from .config_loader import ConfigLoader
-from .logging_config import setup_logging, get_logger
+from .logging_config import (
+    setup_logging,
+    get_logger,
+    enable_queue_logging,
+    disable_queue_logging,
+)
+from . import json_utils
 
-__all__ = ["ConfigLoader", "setup_logging", "get_logger"]
+__all__ = [
+    "ConfigLoader",
+    "setup_logging",
+    "get_logger",
+    "enable_queue_logging",
+    "disable_queue_logging",
+    "json_utils",
+]
@@ -0,0 +1,145 @@
+"""
+JSON Utilities
+
+This module provides fast JSON encoding/decoding for LLM responses.
+It uses orjson when installed and falls back to the standard library otherwise,
+and includes a single-pass scanner for pulling JSON out of surrounding prose.
+"""
+
+import json
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    JSONDecodeError: Tuple[type, ...] = (orjson.JSONDecodeError, json.JSONDecodeError)
+else:
+    JSONDecodeError = (json.JSONDecodeError,)
+
+
+def loads(data: Any) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON text (str or bytes)
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: Optional[int] = None) -> str:
+    """
+    Encode an object as compact JSON text.
+
+    Args:
+        obj: Object to encode
+        sort_keys: Sort dictionary keys in the output
+        indent: Pretty-print with this indent (orjson only supports 2)
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+
+    separators = (",", ":") if indent is None else None
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=indent,
+        separators=separators,
+        ensure_ascii=False,
+        default=str
+    )
+
+
+def find_json_span(text: str, open_char: str = "{") -> Optional[Tuple[int, int]]:
+    """
+    Locate the first balanced JSON object or array in text.
+
+    Scans once from the first opening bracket, tracking nesting depth and
+    skipping over string literals so brackets inside strings are ignored.
+
+    Args:
+        text: Text that may contain JSON
+        open_char: "{" for an object, "[" for an array
+
+    Returns:
+        (start, end) slice bounds, or None if no balanced span was found
+    """
+    close_char = "}" if open_char == "{" else "]"
+    start = text.find(open_char)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == open_char:
+            depth += 1
+        elif c == close_char:
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+
+    return None
+
+
+def extract_json(text: str, open_char: str = "{") -> Any:
+    """
+    Parse JSON from text, tolerating markdown fences and surrounding prose.
+
+    Args:
+        text: Response text that may contain JSON
+        open_char: "{" to extract an object, "[" to extract an array
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If no valid JSON could be extracted
+    """
+    try:
+        return loads(text)
+    except JSONDecodeError:
+        pass
+
+    span = find_json_span(text, open_char)
+    if span is not None:
+        try:
+            return loads(text[span[0]:span[1]])
+        except JSONDecodeError:
+            pass
+
+    raise ValueError(f"Could not parse JSON from response: {text[:200]}")
@@ -6,12 +6,18 @@ It provides consistent logging format with timestamps, levels, and component nam
 """
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# Background listener started by enable_queue_logging()
+_queue_listener: Optional[QueueListener] = None
+
+
 class ColoredFormatter(logging.Formatter):
     """
     Custom formatter that adds colors to log levels for terminal output.
@@ -234,3 +240,51 @@ def configure_debug_logging() -> None:
     root_logger.addHandler(console_handler)
 
     root_logger.debug("Debug logging configured")
+
+
+def enable_queue_logging(logger_name: str = "agentic_research") -> QueueListener:
+    """
+    Move a logger's handlers behind a queue drained by a background thread.
+
+    Logging calls then only enqueue the record, so slow consoles or log
+    files never block the event loop. Call after the handlers are configured
+    (e.g. after setup_logging or configure_production_logging).
+
+    Args:
+        logger_name: Logger whose handlers should be moved off-thread
+
+    Returns:
+        The running QueueListener
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        return _queue_listener
+
+    logger = logging.getLogger(logger_name)
+    handlers = [h for h in logger.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+        handlers = [handler]
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.handlers = [QueueHandler(log_queue)]
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    return _queue_listener
+
+
+def disable_queue_logging() -> None:
+    """
+    Stop the background listener, flushing any queued records.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None